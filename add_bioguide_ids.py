@@ -15,21 +15,135 @@ Usage:
 
     # Process all files matching a pattern
     python3 add_bioguide_ids.py --pattern "data/*/senate_data_cleaned.csv"
+
+    # Use local legislator data instead of downloading it
+    python3 add_bioguide_ids.py --all --legislators-source /path/to/congress-legislators
+
+    # Process several files at once in 4 worker processes
+    python3 add_bioguide_ids.py --all --jobs 4
 """
 
 import os
 import sys
+import io
 import csv
 import argparse
+import contextlib
 import glob
+import shutil
+import tempfile
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from bioguide_matcher import BioguideIdMatcher
 
+# Version of how IDs are written into a cleaned CSV, which keys the pipeline's
+# bioguide stage along with the matcher's data_version(). Bump it with any change
+# to add_bioguide_ids_to_csv() that changes its output.
+ADD_IDS_VERSION = 1
+
+# Matcher used by pool worker processes, set once per worker by _init_worker()
+_worker_matcher = None
+
+
+def _find_columns(header_row_2, input_file):
+    """
+    Find the column indices used for matching, adding a bioguide_id header if needed.
+
+    Args:
+        header_row_2: Column header row (modified in place if bioguide_id is added)
+        input_file: Path of the file, for error messages
+
+    Returns:
+        Dictionary of column indices and has_bioguide, or None on error
+    """
+    # Check if bioguide_id column already exists
+    has_bioguide = 'bioguide_id' in header_row_2
+    if has_bioguide:
+        bioguide_idx = header_row_2.index('bioguide_id')
+    else:
+        # Add bioguide_id column after senator_name
+        try:
+            senator_name_idx = header_row_2.index('senator_name')
+            bioguide_idx = senator_name_idx + 1
+            header_row_2.insert(bioguide_idx, 'bioguide_id')
+        except ValueError:
+            print(f"Error: Could not find 'senator_name' column in {input_file}")
+            return None
+
+    # Get column indices
+    try:
+        return {
+            'has_bioguide': has_bioguide,
+            'bioguide': bioguide_idx,
+            'senator_flag': header_row_2.index('senator_flag'),
+            'senator_name': header_row_2.index('senator_name'),
+            'funding_year': header_row_2.index('funding_year'),
+            'fiscal_year': header_row_2.index('fiscal_year'),
+            'width': len(header_row_2),
+        }
+    except ValueError as e:
+        print(f"Error: Missing required column in {input_file}: {e}")
+        return None
+
+
+def _senator_lookup(row, columns):
+    """
+    Pad a data row and work out what it needs from the matcher.
+
+    Returns:
+        Tuple of (senator_flag, lookup) where lookup is the (senator_name, year)
+        to resolve, 'has_id' if the row already has a bioguide ID, or None
+    """
+    # Ensure row has enough columns
+    while len(row) <= max(columns['bioguide'], columns['width'] - 1):
+        row.append('')
+
+    # Check if this is a senator row
+    try:
+        senator_flag = int(row[columns['senator_flag']]) if row[columns['senator_flag']] else 0
+    except (ValueError, IndexError):
+        senator_flag = 0
+
+    if not senator_flag:
+        return 0, None
+
+    # Check if already has a bioguide ID
+    if columns['has_bioguide'] and row[columns['bioguide']]:
+        return senator_flag, 'has_id'
+
+    # Get senator info
+    senator_name = row[columns['senator_name']] if len(row) > columns['senator_name'] else ''
+    if not senator_name:
+        return senator_flag, None
+
+    try:
+        funding_year = int(row[columns['funding_year']]) if row[columns['funding_year']] else None
+    except (ValueError, IndexError):
+        funding_year = None
+
+    try:
+        fiscal_year = int(row[columns['fiscal_year']]) if row[columns['fiscal_year']] else None
+    except (ValueError, IndexError):
+        fiscal_year = None
+
+    # Use funding_year if available, otherwise fiscal_year
+    year = funding_year if funding_year else fiscal_year
+
+    return senator_flag, (senator_name, year)
+
 
 def add_bioguide_ids_to_csv(input_file, output_file=None, matcher=None):
     """
     Add bioguide IDs to an existing cleaned CSV file.
 
+    The file is streamed twice rather than loaded into memory: the first pass
+    collects the distinct senator (name, year) pairs, which the matcher
+    resolves together, and the second pass writes each annotated row to a
+    temporary file that then atomically replaces output_file. Memory use
+    depends on the number of distinct senators, not the size of the file.
+
     Args:
         input_file: Path to input CSV file
         output_file: Path to output CSV file (default: overwrites input)
@@ -45,11 +159,8 @@ def add_bioguide_ids_to_csv(input_file, output_file=None, matcher=None):
     if matcher is None:
         matcher = BioguideIdMatcher()
 
-    # Read the input file
-    rows = []
-    header_row_1 = None
-    header_row_2 = None
-
+    # First pass: find the columns and every distinct senator-year that needs an ID
+    pairs = {}
     with open(input_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
 
@@ -61,110 +172,158 @@ def add_bioguide_ids_to_csv(input_file, output_file=None, matcher=None):
             print(f"Error: {input_file} appears to be empty or malformed")
             return None
 
-        # Read all data rows
-        rows = list(reader)
-
-    # Check if bioguide_id column already exists
-    has_bioguide = 'bioguide_id' in header_row_2
-    if has_bioguide:
-        bioguide_idx = header_row_2.index('bioguide_id')
-    else:
-        # Add bioguide_id column after senator_name
-        try:
-            senator_name_idx = header_row_2.index('senator_name')
-            bioguide_idx = senator_name_idx + 1
-            header_row_2.insert(bioguide_idx, 'bioguide_id')
-        except ValueError:
-            print(f"Error: Could not find 'senator_name' column in {input_file}")
+        columns = _find_columns(header_row_2, input_file)
+        if columns is None:
             return None
 
-    # Get column indices
-    try:
-        senator_flag_idx = header_row_2.index('senator_flag')
-        senator_name_idx = header_row_2.index('senator_name')
-        funding_year_idx = header_row_2.index('funding_year')
-        fiscal_year_idx = header_row_2.index('fiscal_year')
-    except ValueError as e:
-        print(f"Error: Missing required column in {input_file}: {e}")
-        return None
+        for row in reader:
+            _, lookup = _senator_lookup(row, columns)
+            if lookup and lookup != 'has_id':
+                pairs[lookup] = None
+
+    bioguide_ids = dict(zip(pairs, matcher.resolve_many(pairs)))
 
-    # Process rows and add bioguide IDs
     stats = {
-        'total_rows': len(rows),
+        'total_rows': 0,
         'senator_rows': 0,
         'matched': 0,
         'unmatched': 0,
         'already_had_id': 0
     }
 
-    for row in rows:
-        # Ensure row has enough columns
-        while len(row) <= max(bioguide_idx, len(header_row_2) - 1):
-            row.append('')
+    # Warn about each unmatched (name, year) once rather than on every row
+    unmatched_names = set()
+    has_bioguide = columns['has_bioguide']
+    bioguide_idx = columns['bioguide']
 
-        # Check if this is a senator row
-        try:
-            senator_flag = int(row[senator_flag_idx]) if row[senator_flag_idx] else 0
-        except (ValueError, IndexError):
-            senator_flag = 0
-
-        if senator_flag:
-            stats['senator_rows'] += 1
-
-            # Check if already has a bioguide ID
-            if has_bioguide and row[bioguide_idx]:
-                stats['already_had_id'] += 1
-                continue
-
-            # Get senator info
-            senator_name = row[senator_name_idx] if len(row) > senator_name_idx else ''
-
-            try:
-                funding_year = int(row[funding_year_idx]) if row[funding_year_idx] else None
-            except (ValueError, IndexError):
-                funding_year = None
-
-            try:
-                fiscal_year = int(row[fiscal_year_idx]) if row[fiscal_year_idx] else None
-            except (ValueError, IndexError):
-                fiscal_year = None
-
-            # Use funding_year if available, otherwise fiscal_year
-            year = funding_year if funding_year else fiscal_year
-
-            # Get bioguide ID
-            if senator_name:
-                bioguide_id = matcher.get_bioguide_id(senator_name, year)
-
-                if bioguide_id:
-                    stats['matched'] += 1
-                    if not has_bioguide:
-                        row.insert(bioguide_idx, bioguide_id)
+    # Second pass: annotate and write each row to a temporary file next to the output
+    output_dir = os.path.dirname(os.path.abspath(output_file))
+    fd, temp_file = tempfile.mkstemp(dir=output_dir, suffix='.tmp')
+    try:
+        # Wrap fd first so it is closed even if the input can't be opened
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as out_file, \
+                open(input_file, 'r', encoding='utf-8') as in_file:
+            reader = csv.reader(in_file)
+            writer = csv.writer(out_file)
+
+            # Skip the original header rows and write the (possibly extended) ones
+            next(reader)
+            next(reader)
+            writer.writerow(header_row_1)
+            writer.writerow(header_row_2)
+
+            for row in reader:
+                stats['total_rows'] += 1
+                senator_flag, lookup = _senator_lookup(row, columns)
+                if senator_flag:
+                    stats['senator_rows'] += 1
+
+                if lookup == 'has_id':
+                    stats['already_had_id'] += 1
+                elif lookup:
+                    senator_name, year = lookup
+                    bioguide_id = bioguide_ids[lookup]
+
+                    if bioguide_id:
+                        stats['matched'] += 1
+                        if not has_bioguide:
+                            row.insert(bioguide_idx, bioguide_id)
+                        else:
+                            row[bioguide_idx] = bioguide_id
                     else:
-                        row[bioguide_idx] = bioguide_id
-                else:
-                    stats['unmatched'] += 1
-                    if not has_bioguide:
-                        row.insert(bioguide_idx, '')
-                    print(f"  Warning: Could not match senator '{senator_name}' (year: {year})")
-            else:
-                if not has_bioguide:
+                        stats['unmatched'] += 1
+                        if not has_bioguide:
+                            row.insert(bioguide_idx, '')
+                        if lookup not in unmatched_names:
+                            unmatched_names.add(lookup)
+                            print(f"  Warning: Could not match senator '{senator_name}' (year: {year})")
+                elif not has_bioguide:
+                    # Not a senator row (or no name), just add empty bioguide_id
                     row.insert(bioguide_idx, '')
-        else:
-            # Not a senator row, just add empty bioguide_id if needed
-            if not has_bioguide:
-                row.insert(bioguide_idx, '')
 
-    # Write output file
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(header_row_1)
-        writer.writerow(header_row_2)
-        writer.writerows(rows)
+                writer.writerow(row)
+
+        # Keep the permissions of the file being replaced
+        if os.path.exists(output_file):
+            shutil.copymode(output_file, temp_file)
+        else:
+            os.chmod(temp_file, 0o644)
+        os.replace(temp_file, output_file)
+    finally:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
 
     return stats
 
 
+def process_file(input_file, output_file, matcher):
+    """
+    Add bioguide IDs to one file and print its statistics.
+
+    Returns:
+        Tuple of (stats dictionary or None if the file failed, dictionary of
+        matcher lookup 'hits' and 'misses' for this file)
+    """
+    print(f"\nProcessing: {input_file}")
+    before = matcher.cache_stats()
+
+    stats = None
+    try:
+        stats = add_bioguide_ids_to_csv(input_file, output_file, matcher)
+
+        if stats:
+            print(f"  Total rows: {stats['total_rows']}")
+            print(f"  Senator rows: {stats['senator_rows']}")
+            print(f"  Matched: {stats['matched']}")
+            print(f"  Unmatched: {stats['unmatched']}")
+            if stats['already_had_id']:
+                print(f"  Already had ID: {stats['already_had_id']}")
+
+    except Exception as e:
+        print(f"  Error processing file: {e}")
+        traceback.print_exc()
+
+    after = matcher.cache_stats()
+    lookups = {'hits': after['hits'] - before['hits'], 'misses': after['misses'] - before['misses']}
+    return stats, lookups
+
+
+def _init_worker(matcher):
+    """Pool initializer: keep the pre-built matcher for every file this worker processes."""
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _process_file_in_worker(input_file):
+    """Run process_file() in a worker, capturing its output so files don't interleave."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        stats, lookups = process_file(input_file, None, _worker_matcher)
+    return output.getvalue(), stats, lookups
+
+
+def process_files_parallel(files, matcher, jobs):
+    """
+    Process files in a pool of worker processes sharing one pre-built matcher.
+
+    The loaded matcher is handed to each worker once when it starts (pickled
+    without its lookup cache), so no worker loads legislator data itself.
+    Workers are spawned rather than forked, since the legislator source's
+    background refresh thread may be running and holding locks. Each worker writes its files independently, and
+    each file's output is printed as a block when it finishes.
+
+    Yields:
+        (stats, lookups) for each file, as from process_file(), in completion order
+    """
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_init_worker, initargs=(matcher,)) as executor:
+        futures = [executor.submit(_process_file_in_worker, input_file) for input_file in files]
+        for future in as_completed(futures):
+            output, stats, lookups = future.result()
+            print(output, end='')
+            yield stats, lookups
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Add bioguide IDs to existing senate disbursement CSV files',
@@ -179,6 +338,12 @@ Examples:
 
   # Process files matching a pattern
   python3 add_bioguide_ids.py --pattern "data/*/senate_data_cleaned.csv"
+
+  # Use local legislator data instead of downloading it
+  python3 add_bioguide_ids.py --all --legislators-source /path/to/congress-legislators
+
+  # Process several files at once in 4 worker processes
+  python3 add_bioguide_ids.py --all --jobs 4
         """
     )
 
@@ -186,6 +351,10 @@ Examples:
     parser.add_argument('--output', '-o', help='Output CSV file (default: overwrites input)')
     parser.add_argument('--all', action='store_true', help='Process all *_cleaned.csv files in data/all_years/')
     parser.add_argument('--pattern', help='Process all files matching this glob pattern')
+    parser.add_argument('--legislators-source', default=None,
+                        help='Legislator data: "http" or a local file/directory (default: $BIOGUIDE_SOURCE or http)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of files to process in parallel worker processes (default: 1)')
 
     args = parser.parse_args()
 
@@ -214,7 +383,7 @@ Examples:
 
     # Initialize matcher once for all files
     print("\nInitializing bioguide matcher...")
-    matcher = BioguideIdMatcher()
+    matcher = BioguideIdMatcher(source=args.legislators_source)
 
     # Process each file
     total_stats = {
@@ -227,36 +396,29 @@ Examples:
         'already_had_id': 0
     }
 
-    for input_file in files_to_process:
-        print(f"\nProcessing: {input_file}")
+    lookup_totals = {'hits': 0, 'misses': 0}
 
+    if args.jobs > 1 and len(files_to_process) > 1:
+        jobs = min(args.jobs, len(files_to_process))
+        print(f"Processing {len(files_to_process)} files in {jobs} worker processes")
+        results = process_files_parallel(files_to_process, matcher, jobs)
+    else:
         output_file = args.output if args.output and len(files_to_process) == 1 else None
-
-        try:
-            stats = add_bioguide_ids_to_csv(input_file, output_file, matcher)
-
-            if stats:
-                total_stats['files_processed'] += 1
-                total_stats['total_rows'] += stats['total_rows']
-                total_stats['senator_rows'] += stats['senator_rows']
-                total_stats['matched'] += stats['matched']
-                total_stats['unmatched'] += stats['unmatched']
-                total_stats['already_had_id'] += stats['already_had_id']
-
-                print(f"  Total rows: {stats['total_rows']}")
-                print(f"  Senator rows: {stats['senator_rows']}")
-                print(f"  Matched: {stats['matched']}")
-                print(f"  Unmatched: {stats['unmatched']}")
-                if stats['already_had_id']:
-                    print(f"  Already had ID: {stats['already_had_id']}")
-            else:
-                total_stats['files_failed'] += 1
-
-        except Exception as e:
-            print(f"  Error processing file: {e}")
+        results = (process_file(input_file, output_file, matcher) for input_file in files_to_process)
+
+    for stats, lookups in results:
+        lookup_totals['hits'] += lookups['hits']
+        lookup_totals['misses'] += lookups['misses']
+
+        if stats:
+            total_stats['files_processed'] += 1
+            total_stats['total_rows'] += stats['total_rows']
+            total_stats['senator_rows'] += stats['senator_rows']
+            total_stats['matched'] += stats['matched']
+            total_stats['unmatched'] += stats['unmatched']
+            total_stats['already_had_id'] += stats['already_had_id']
+        else:
             total_stats['files_failed'] += 1
-            import traceback
-            traceback.print_exc()
 
     # Print summary
     print("\n" + "=" * 60)
@@ -276,6 +438,9 @@ Examples:
         match_rate = (total_stats['matched'] / total_stats['senator_rows']) * 100
         print(f"Match rate: {match_rate:.1f}%")
 
+    print(f"Bioguide lookups: {lookup_totals['hits'] + lookup_totals['misses']} "
+          f"({lookup_totals['misses']} distinct, {lookup_totals['hits']} cached)")
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Parser Benchmarks for Senate Disbursements
+
+Measures the page parser in process_senate_disbursements.py against extracted
+page corpora (directories of layout_N.txt files such as data/118sdoc13/pages),
+and runs the full parse / clean / bioguide benchmark suite against a stored
+baseline.
+
+Usage:
+    # Run the benchmark suite over every data/*/pages corpus and compare its
+    # output against benchmarks/baseline.json (exits 1 if it differs)
+    python3 benchmark_parser.py suite
+
+    # Record a new baseline after an intended output change
+    python3 benchmark_parser.py suite --save-baseline
+
+    # Rebuild benchmarks/legislators.yaml from the congress-legislators data
+    python3 benchmark_parser.py fixture
+
+    # Check that the line classifier gives the same output as the full regex
+    # cascade, and compare regex evaluations per line
+    python3 benchmark_parser.py classifier data/118sdoc13/pages
+
+    # Limit to a page range
+    python3 benchmark_parser.py classifier data/118sdoc13/pages --start 19 --end 500
+
+    # Compare fixed-width column parsing with the regex cascade
+    python3 benchmark_parser.py fixed-width data/118sdoc13/pages
+
+    # Time the guarded regexes against the original patterns
+    python3 benchmark_parser.py patterns data/118sdoc13/pages --start 19 --end 250
+"""
+
+import os
+import sys
+import io
+import csv
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+import process_senate_disbursements as psd
+
+# Stored suite results compared against by `suite`
+DEFAULT_BASELINE_FILE = os.path.join('benchmarks', 'baseline.json')
+
+SUITE_STAGES = ['parse', 'clean', 'bioguide']
+
+# Stage results that don't depend on the machine. Only these are stored in the
+# baseline and compared; timings and memory are reported but never compared,
+# since they vary too much between machines (and runs) to fail a change over.
+BASELINE_KEYS = ['pages', 'rows', 'matched', 'unmatched', 'sha256']
+
+# Legislators file the bioguide stage matches against, so it runs offline. It
+# isn't committed: `fixture` writes it from real congress-legislators data, and
+# the stage is skipped until it exists
+DEFAULT_LEGISLATORS_FIXTURE = os.path.join('benchmarks', 'legislators.yaml')
+DEFAULT_FIXTURE_CORPUS = '118sdoc13'
+
+
+def load_pages(pages_dir, start_page=None, end_page=None):
+    """Load (page_number, lines) for every layout file in pages_dir within the page range."""
+    page_numbers = [
+        page for page in psd.get_page_numbers_from_directory(pages_dir)
+        if (start_page is None or page >= start_page) and (end_page is None or page <= end_page)
+    ]
+    pages = []
+    for page in page_numbers:
+        pages.extend(psd.iter_page_files(page, page, pages_dir))
+    return pages
+
+
+def data_lines_of(pages):
+    """Yield (page_number, data_lines) for each page with a header."""
+    for page, page_array in pages:
+        header_index = psd.find_header_index(page_array)
+        if header_index is not None:
+            yield page, page_array[header_index+1:]
+
+
+def run_data_line_pass(pages, use_classifier):
+    """Run process_data_lines() over all pages and return (results, regex counts, seconds)."""
+    results = []
+    psd.USE_LINE_CLASSIFIER = use_classifier
+    try:
+        # process_data_lines() prints every line it can't parse
+        with contextlib.redirect_stdout(io.StringIO()), psd.instrument_patterns() as (patterns, stats):
+            start_time = time.perf_counter()
+            for page, data_lines in data_lines_of(pages):
+                results.append(psd.process_data_lines(page, data_lines, patterns=patterns))
+            elapsed = time.perf_counter() - start_time
+    finally:
+        psd.USE_LINE_CLASSIFIER = True
+    counts = {name: pattern_stats['attempts'] for name, pattern_stats in stats['patterns'].items()}
+    return results, counts, elapsed
+
+
+def benchmark_classifier(args):
+    """Compare the line classifier against the full regex cascade."""
+    pages = load_pages(args.pages_dir, args.start, args.end)
+    if not pages:
+        print(f"No layout_N.txt files found in {args.pages_dir}")
+        return 1
+
+    line_count = sum(len(data_lines) for _, data_lines in data_lines_of(pages))
+    print(f"Corpus: {args.pages_dir} ({len(pages)} pages, {line_count} data lines)")
+
+    cascade_results, cascade_counts, cascade_time = run_data_line_pass(pages, use_classifier=False)
+    classified_results, classified_counts, classified_time = run_data_line_pass(pages, use_classifier=True)
+
+    cascade_total = sum(cascade_counts.values())
+    classified_total = sum(classified_counts.values())
+
+    print(f"\n{'Pattern':<32} {'Cascade':>10} {'Classified':>10}")
+    for pattern in sorted(cascade_counts, key=lambda p: -cascade_counts[p]):
+        print(f"{pattern:<32} {cascade_counts[pattern]:>10} {classified_counts.get(pattern, 0):>10}")
+
+    print(f"\nRegex evaluations: {cascade_total} -> {classified_total} "
+          f"({cascade_total / max(line_count, 1):.2f} -> {classified_total / max(line_count, 1):.2f} per line)")
+    print(f"Time: {cascade_time:.2f}s -> {classified_time:.2f}s")
+
+    if cascade_results != classified_results:
+        for (page, _), expected, actual in zip(data_lines_of(pages), cascade_results, classified_results):
+            if expected != actual:
+                print(f"\nFAIL: classifier output differs from the full cascade on page {page}")
+                break
+        return 1
+
+    print("\nOK: classifier output is identical to the full cascade")
+    return 0
+
+
+def benchmark_fixed_width(args):
+    """Compare fixed-width column parsing with the regex cascade."""
+    pages = load_pages(args.pages_dir, args.start, args.end)
+    if not pages:
+        print(f"No layout_N.txt files found in {args.pages_dir}")
+        return 1
+
+    line_count = 0
+    fitted_count = 0
+    for page, page_array in pages:
+        header_index = psd.find_header_index(page_array)
+        if header_index is None:
+            continue
+        layout = psd.find_column_layout(page_array[header_index])
+        for line in page_array[header_index+1:]:
+            if psd.blank_line_re.match(line):
+                continue
+            line_count += 1
+            if layout and (psd.parse_fixed_width_line(line, layout) or
+                           psd.parse_fixed_width_continuation(line, layout)):
+                fitted_count += 1
+    print(f"Corpus: {args.pages_dir} ({len(pages)} pages, {line_count} non-blank data lines)")
+    print(f"Lines fitting the header columns: {fitted_count} ({fitted_count / max(line_count, 1):.1%})")
+
+    timings = {}
+    results = {}
+    for fixed_width in (False, True):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            results[fixed_width] = [psd.parse_page(page, page_array, fixed_width) for page, page_array in pages]
+            timings[fixed_width] = time.perf_counter() - start_time
+
+    regex_rows = sum(len(result['data']) for result in results[False] if result)
+    fixed_rows = sum(len(result['data']) for result in results[True] if result)
+    regex_missing = sum(len(result['missing_data']) for result in results[False] if result)
+    fixed_missing = sum(len(result['missing_data']) for result in results[True] if result)
+    same_pages = sum(1 for regex_result, fixed_result in zip(results[False], results[True])
+                     if regex_result == fixed_result)
+
+    print(f"\n{'':<24} {'Regex':>10} {'Fixed-width':>12}")
+    print(f"{'Time (s)':<24} {timings[False]:>10.2f} {timings[True]:>12.2f}")
+    print(f"{'Pages/sec':<24} {len(pages) / timings[False]:>10.1f} {len(pages) / timings[True]:>12.1f}")
+    print(f"{'Rows':<24} {regex_rows:>10} {fixed_rows:>12}")
+    print(f"{'Missing lines':<24} {regex_missing:>10} {fixed_missing:>12}")
+    print(f"\nPages with identical output: {same_pages} of {len(pages)}")
+    return 0
+
+
+def benchmark_patterns(args):
+    """Compare the guarded regexes with the original patterns."""
+    pages = load_pages(args.pages_dir, args.start, args.end)
+    if not pages:
+        print(f"No layout_N.txt files found in {args.pages_dir}")
+        return 1
+    print(f"Corpus: {args.pages_dir} ({len(pages)} pages)")
+
+    budget = args.budget / 1000
+    runs = {}
+    original_patterns = dict(psd.PARSER_PATTERNS, **psd.ORIGINAL_PATTERNS)
+    for label, patterns in (('original', original_patterns), ('guarded', psd.PARSER_PATTERNS)):
+        with contextlib.redirect_stdout(io.StringIO()), \
+                psd.instrument_patterns(patterns, budget) as (timed_patterns, stats):
+            start_time = time.perf_counter()
+            results = [psd.parse_page(page, page_array, patterns=timed_patterns) for page, page_array in pages]
+            elapsed = time.perf_counter() - start_time
+        runs[label] = (results, stats, elapsed)
+
+    original_stats = runs['original'][1]['patterns']
+    guarded_stats = runs['guarded'][1]['patterns']
+    print(f"\n{'Pattern':<32} {'Attempts':>9} {'Original (s)':>13} {'Max (ms)':>9} {'Guarded (s)':>12} {'Max (ms)':>9}")
+    for name in sorted(original_stats, key=lambda n: -original_stats[n]['seconds']):
+        before = original_stats[name]
+        after = guarded_stats.get(name, {'seconds': 0.0, 'max_seconds': 0.0})
+        print(f"{name:<32} {before['attempts']:>9} {before['seconds']:>13.3f} {before['max_seconds'] * 1000:>9.1f} "
+              f"{after['seconds']:>12.3f} {after['max_seconds'] * 1000:>9.1f}")
+
+    for label in ('original', 'guarded'):
+        results, stats, elapsed = runs[label]
+        print(f"\n{label.capitalize()}: {elapsed:.2f}s ({len(pages) / elapsed:.1f} pages/sec), "
+              f"{len(stats['slow_lines'])} lines over {args.budget:g} ms")
+        for slow_line in sorted(stats['slow_lines'], key=lambda s: -s['seconds'])[:args.top]:
+            print(f"  {slow_line['seconds'] * 1000:8.1f} ms  {slow_line['line'].strip()[:90]}")
+
+    if runs['original'][0] != runs['guarded'][0]:
+        for (page, _), expected, actual in zip(pages, runs['original'][0], runs['guarded'][0]):
+            if expected != actual:
+                print(f"\nFAIL: guarded patterns give different output on page {page}")
+                break
+        return 1
+
+    print("\nOK: guarded patterns give identical output")
+    return 0
+
+
+def find_corpora(data_dir='data'):
+    """Return (name, pages_dir) for every <data_dir>/<name>/pages directory with layout files."""
+    corpora = []
+    for name in sorted(os.listdir(data_dir)):
+        pages_dir = os.path.join(data_dir, name, 'pages')
+        if os.path.isdir(pages_dir) and psd.get_page_numbers_from_directory(pages_dir):
+            corpora.append((name, pages_dir))
+    return corpora
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in megabytes."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def count_csv_rows(csv_file, header_rows=0):
+    """Count the data rows in a CSV file."""
+    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+        return sum(1 for _ in csv.reader(f)) - header_rows
+
+
+def run_suite_stage(stage, name, pages_dir, work_dir, legislators_file=DEFAULT_LEGISLATORS_FIXTURE):
+    """
+    Run one suite stage for a corpus and measure it.
+
+    Runs in a fresh worker process (see run_suite()) so that peak memory
+    belongs to this stage alone. Each stage reads the previous stage's output
+    from work_dir. The bioguide stage matches against legislators_file, and
+    keeps the matcher's cache in work_dir so every run parses it afresh.
+
+    Returns:
+        Dictionary with seconds, rows, rows_per_second, peak_rss_mb and the
+        SHA-256 of the stage's output CSV (plus pages and pages_per_second for
+        parsing), or {'skipped': reason}
+    """
+    csv_file = os.path.join(work_dir, 'senate_data.csv')
+    cleaned_file = os.path.join(work_dir, 'senate_data_cleaned.csv')
+    result = {}
+
+    # The pipeline functions print progress and every unparsed line
+    with contextlib.redirect_stdout(io.StringIO()):
+        start_time = time.perf_counter()
+        if stage == 'parse':
+            page_numbers = psd.get_page_numbers_from_directory(pages_dir)
+            pages = (item for page in page_numbers for item in psd.iter_page_files(page, page, pages_dir))
+            psd.parse_pages(page_numbers[0], page_numbers[-1], pages_dir, csv_file,
+                            os.path.join(work_dir, 'missing_data.json'), pages)
+            elapsed = time.perf_counter() - start_time
+            result['pages'] = len(page_numbers)
+            result['pages_per_second'] = len(page_numbers) / elapsed
+            result['rows'] = count_csv_rows(csv_file)
+            output_file = csv_file
+        elif stage == 'clean':
+            psd.clean_csv(name, csv_file, cleaned_file, add_bioguide_ids=False)
+            elapsed = time.perf_counter() - start_time
+            result['rows'] = count_csv_rows(cleaned_file, header_rows=2)
+            output_file = cleaned_file
+        elif stage == 'bioguide':
+            if not os.path.exists(legislators_file):
+                return {'skipped': f"no legislators fixture at {legislators_file} "
+                                   f"(create it with `benchmark_parser.py fixture`)"}
+            try:
+                from add_bioguide_ids import add_bioguide_ids_to_csv
+                from bioguide_matcher import BioguideIdMatcher, LocalLegislatorSource
+                matcher = BioguideIdMatcher(cache_dir=os.path.join(work_dir, 'bioguide_cache'),
+                                            source=LocalLegislatorSource(legislators_file))
+            except Exception as e:
+                return {'skipped': f"bioguide matcher unavailable ({e})"}
+            load_seconds = time.perf_counter() - start_time
+            output_file = os.path.join(work_dir, 'bioguide.csv')
+            stats = add_bioguide_ids_to_csv(cleaned_file, output_file, matcher)
+            elapsed = time.perf_counter() - start_time
+            result['load_seconds'] = load_seconds
+            result['rows'] = stats['total_rows']
+            result['matched'] = stats['matched']
+            result['unmatched'] = stats['unmatched']
+        else:
+            raise ValueError(f"Unknown suite stage: {stage}")
+
+    result['seconds'] = elapsed
+    result['rows_per_second'] = result['rows'] / elapsed if elapsed else 0.0
+    result['peak_rss_mb'] = peak_rss_mb()
+    with open(output_file, 'rb') as f:
+        result['sha256'] = hashlib.sha256(f.read()).hexdigest()
+    return {key: round(value, 3) if isinstance(value, float) else value for key, value in result.items()}
+
+
+def run_suite(corpora, stages=SUITE_STAGES, legislators_file=DEFAULT_LEGISLATORS_FIXTURE):
+    """
+    Run the suite stages over each corpus, matching bioguide IDs against legislators_file.
+
+    Returns:
+        Dictionary of corpus name to {stage: result from run_suite_stage()}
+    """
+    results = {}
+    for name, pages_dir in corpora:
+        results[name] = {}
+        with tempfile.TemporaryDirectory() as work_dir:
+            for stage in stages:
+                print(f"Running {stage} on {name}...")
+                # A fresh process per stage keeps peak memory figures separate
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    results[name][stage] = executor.submit(
+                        run_suite_stage, stage, name, pages_dir, work_dir, legislators_file).result()
+    return results
+
+
+def build_legislators_fixture(name, pages_dir, legislators_source, fixture_file=DEFAULT_LEGISLATORS_FIXTURE):
+    """
+    Write the bioguide stage's legislators fixture from real legislator data.
+
+    Parses and cleans the corpus, matches its senator rows against the full
+    congress-legislators data from legislators_source (see
+    bioguide_matcher.get_legislator_source()), and writes the records of the
+    senators that matched, with only their Senate terms, to fixture_file.
+    Matching the corpus against the fixture then gives the same bioguide IDs
+    as matching it against the full data.
+
+    Returns:
+        Number of senators written
+    """
+    import yaml
+    from add_bioguide_ids import add_bioguide_ids_to_csv
+    from bioguide_matcher import BioguideIdMatcher, get_legislator_source
+
+    source = get_legislator_source(legislators_source)
+    with tempfile.TemporaryDirectory() as work_dir:
+        cache_dir = os.path.join(work_dir, 'bioguide_cache')
+        cleaned_file = os.path.join(work_dir, 'senate_data_cleaned.csv')
+        annotated_file = os.path.join(work_dir, 'bioguide.csv')
+        with contextlib.redirect_stdout(io.StringIO()):
+            page_numbers = psd.get_page_numbers_from_directory(pages_dir)
+            psd.parse_and_clean(name, page_numbers[0], page_numbers[-1], pages_dir, cleaned_file,
+                                os.path.join(work_dir, 'missing_data.json'), add_bioguide_ids=False)
+            matcher = BioguideIdMatcher(cache_dir=cache_dir, source=source)
+            add_bioguide_ids_to_csv(cleaned_file, annotated_file, matcher)
+            source_files = source.get_files(cache_dir)
+
+        with open(annotated_file, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader)
+            bioguide_column = next(reader).index('bioguide_id')
+            matched_ids = {row[bioguide_column] for row in reader if row[bioguide_column]}
+
+        senators = []
+        for source_file in source_files:
+            with open(source_file, 'r') as f:
+                for legislator in yaml.safe_load(f):
+                    if legislator['id'].get('bioguide') in matched_ids:
+                        senators.append({
+                            'id': {'bioguide': legislator['id']['bioguide']},
+                            'name': legislator['name'],
+                            'terms': [term for term in legislator['terms'] if term.get('type') == 'sen'],
+                        })
+
+    senators.sort(key=lambda senator: (senator['name'].get('last', ''), senator['id']['bioguide']))
+    with open(fixture_file, 'w') as f:
+        f.write(f"# Legislators fixture for the bioguide stage of `benchmark_parser.py suite`.\n"
+                f"#\n"
+                f"# The {len(senators)} senators the {name} report's senator rows match in the\n"
+                f"# unitedstates/congress-legislators data ({', '.join(p.name for p in source_files)}),\n"
+                f"# with their Senate terms. Written by `benchmark_parser.py fixture`; regenerate\n"
+                f"# it rather than editing it by hand.\n\n")
+        yaml.safe_dump(senators, f, sort_keys=False, allow_unicode=True)
+    return len(senators)
+
+
+def compare_to_baseline(results, baseline):
+    """
+    Compare suite results with a stored baseline.
+
+    A stage regresses when any of its BASELINE_KEYS (page and row counts,
+    matched and unmatched senator rows, output hash) differs from the
+    baseline. Timings are not compared.
+
+    Returns:
+        List of regression messages (empty if none)
+    """
+    regressions = []
+    for name, stages in results.items():
+        for stage, result in stages.items():
+            base = baseline.get(name, {}).get(stage)
+            if not base or 'skipped' in base or 'skipped' in result:
+                continue
+            label = f"{name} {stage}"
+            for key in BASELINE_KEYS:
+                if key in base and result.get(key) != base[key]:
+                    regressions.append(f"{label}: {key} changed from {base[key]} to {result.get(key)}")
+    return regressions
+
+
+def print_suite_results(results):
+    """Print suite results as a table. Timings are for this machine and run only."""
+    print(f"\n{'Corpus':<14} {'Stage':<9} {'Time (s)':>9} {'Pages/sec':>10} {'Rows/sec':>10} {'Peak MB':>8}")
+    for name, stages in results.items():
+        for stage, result in stages.items():
+            if 'skipped' in result:
+                print(f"{name:<14} {stage:<9} skipped: {result['skipped']}")
+                continue
+            pages_per_second = f"{result['pages_per_second']:.1f}" if 'pages_per_second' in result else ''
+            print(f"{name:<14} {stage:<9} {result['seconds']:>9.2f} {pages_per_second:>10} "
+                  f"{result['rows_per_second']:>10.1f} {result['peak_rss_mb']:>8.1f}")
+
+
+def benchmark_suite(args):
+    """Run the parse / clean / bioguide suite and compare against the baseline."""
+    corpora = find_corpora(args.data_dir)
+    if args.corpus:
+        corpora = [(name, pages_dir) for name, pages_dir in corpora if name in args.corpus]
+    if not corpora:
+        print(f"No page corpora found under {args.data_dir}")
+        return 1
+    print(f"Corpora: {', '.join(name for name, _ in corpora)}")
+
+    stages = [stage for stage in SUITE_STAGES if not (args.skip_bioguide and stage == 'bioguide')]
+    results = run_suite(corpora, stages)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)['corpora']
+
+    print_suite_results(results)
+
+    if args.save_baseline:
+        # Keep baseline entries for corpora or stages that weren't run this time
+        for name, stages_run in results.items():
+            for stage, result in stages_run.items():
+                if 'skipped' not in result:
+                    baseline.setdefault(name, {})[stage] = {key: result[key] for key in BASELINE_KEYS if key in result}
+        with open(args.baseline, 'w') as f:
+            json.dump({'corpora': baseline}, f, indent=4)
+            f.write('\n')
+        print(f"\nBaseline written to: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare_to_baseline(results, baseline)
+    if regressions:
+        print(f"\nFAIL: {len(regressions)} regression(s) against {args.baseline}")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"\nOK: output matches {args.baseline}")
+    return 0
+
+
+def benchmark_fixture(args):
+    """Regenerate the bioguide stage's legislators fixture from real legislator data."""
+    corpora = dict(find_corpora(args.data_dir))
+    if args.corpus not in corpora:
+        print(f"No page corpus {args.corpus} under {args.data_dir}")
+        return 1
+
+    count = build_legislators_fixture(args.corpus, corpora[args.corpus], args.legislators_source, args.output)
+    print(f"Wrote {count} senators to {args.output}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the Senate disbursement page parser',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Run the parse / clean / bioguide suite against benchmarks/baseline.json
+  python3 benchmark_parser.py suite
+
+  # Compare the line classifier with the full regex cascade
+  python3 benchmark_parser.py classifier data/118sdoc13/pages
+
+  # Compare fixed-width column parsing with the regex cascade
+  python3 benchmark_parser.py fixed-width data/118sdoc13/pages
+
+  # Compare the guarded regexes with the original patterns
+  python3 benchmark_parser.py patterns data/118sdoc13/pages --start 19 --end 250
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command')
+
+    suite_parser = subparsers.add_parser(
+        'suite', help='Benchmark parsing, cleaning and bioguide matching against a stored baseline')
+    suite_parser.add_argument('--data-dir', default='data', help='Directory holding <report>/pages corpora (default: data)')
+    suite_parser.add_argument('--corpus', action='append', help='Only run this corpus (can be repeated)')
+    suite_parser.add_argument('--baseline', default=DEFAULT_BASELINE_FILE,
+                              help=f'Baseline results file (default: {DEFAULT_BASELINE_FILE})')
+    suite_parser.add_argument('--save-baseline', action='store_true', help='Write these results as the new baseline')
+    suite_parser.add_argument('--skip-bioguide', action='store_true', help='Skip the bioguide matching stage')
+    suite_parser.set_defaults(func=benchmark_suite)
+
+    fixture_parser = subparsers.add_parser(
+        'fixture', help="Regenerate the bioguide stage's legislators fixture from real legislator data")
+    fixture_parser.add_argument('--data-dir', default='data', help='Directory holding <report>/pages corpora (default: data)')
+    fixture_parser.add_argument('--corpus', default=DEFAULT_FIXTURE_CORPUS,
+                                help=f'Corpus whose senators the fixture holds (default: {DEFAULT_FIXTURE_CORPUS})')
+    fixture_parser.add_argument('--legislators-source', default=None,
+                                help='Legislator data: "http" or a local file/directory (default: $BIOGUIDE_SOURCE or http)')
+    fixture_parser.add_argument('--output', default=DEFAULT_LEGISLATORS_FIXTURE,
+                                help=f'Fixture file to write (default: {DEFAULT_LEGISLATORS_FIXTURE})')
+    fixture_parser.set_defaults(func=benchmark_fixture)
+
+    classifier_parser = subparsers.add_parser(
+        'classifier', help='Check line classifier output and count regex evaluations per line')
+    classifier_parser.add_argument('pages_dir', help='Directory of layout_N.txt page files')
+    classifier_parser.add_argument('--start', type=int, help='First page to include')
+    classifier_parser.add_argument('--end', type=int, help='Last page to include')
+    classifier_parser.set_defaults(func=benchmark_classifier)
+
+    fixed_width_parser = subparsers.add_parser(
+        'fixed-width', help='Compare fixed-width column parsing with the regex cascade')
+    fixed_width_parser.add_argument('pages_dir', help='Directory of layout_N.txt page files')
+    fixed_width_parser.add_argument('--start', type=int, help='First page to include')
+    fixed_width_parser.add_argument('--end', type=int, help='Last page to include')
+    fixed_width_parser.set_defaults(func=benchmark_fixed_width)
+
+    patterns_parser = subparsers.add_parser(
+        'patterns', help='Time the guarded regexes against the original patterns and check output')
+    patterns_parser.add_argument('pages_dir', help='Directory of layout_N.txt page files')
+    patterns_parser.add_argument('--start', type=int, help='First page to include')
+    patterns_parser.add_argument('--end', type=int, help='Last page to include')
+    patterns_parser.add_argument('--budget', type=float, default=psd.LINE_TIME_BUDGET * 1000,
+                                 help='Flag lines whose regex time exceeds this many milliseconds (default: %(default)g)')
+    patterns_parser.add_argument('--top', type=int, default=10, help='Number of slowest lines to show (default: 10)')
+    patterns_parser.set_defaults(func=benchmark_patterns)
+
+    args = parser.parse_args()
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -6,20 +6,46 @@ This module downloads legislator data from the unitedstates/congress-legislators
 repository and provides functions to match senator names from disbursement records
 to their bioguide IDs.
 
+Legislator data comes from a pluggable source: the congress-legislators
+repository over HTTP (the default) or a local file or directory, which may
+hold a senators snapshot written with --export-snapshot. Choose one with the
+source argument, the BIOGUIDE_SOURCE environment variable, or
+--legislators-source on the command-line tools.
+
 Usage:
     from bioguide_matcher import BioguideIdMatcher
 
     matcher = BioguideIdMatcher()
     bioguide_id = matcher.get_bioguide_id("LAMAR ALEXANDER", 2014)
+
+    # A whole column at once; each distinct (name, year) is resolved once
+    bioguide_ids = matcher.resolve_many([("LAMAR ALEXANDER", 2014), ("BOB CORKER", 2014)])
+
+    # Offline, from a directory holding the two legislators YAML files
+    matcher = BioguideIdMatcher(source="/data/congress-legislators")
 """
 
 import os
 import re
-import yaml
+import json
+import pickle
+import hashlib
+import argparse
+import tempfile
+import threading
+import functools
+import urllib.error
 import urllib.request
 from datetime import datetime
 from pathlib import Path
 
+# Environment variable naming the default legislator source (see get_legislator_source())
+SOURCE_ENV_VAR = "BIOGUIDE_SOURCE"
+
+# Temporary files in the cache directory older than this (in seconds) were left
+# behind by an interrupted write and are removed
+STALE_TEMP_SECONDS = 3600
+
 
 class BioguideIdMatcher:
     """Match senator names to bioguide IDs using congress-legislators data."""
@@ -27,67 +53,101 @@ class BioguideIdMatcher:
     LEGISLATORS_CURRENT_URL = "https://raw.githubusercontent.com/unitedstates/congress-legislators/main/legislators-current.yaml"
     LEGISLATORS_HISTORICAL_URL = "https://raw.githubusercontent.com/unitedstates/congress-legislators/main/legislators-historical.yaml"
 
-    def __init__(self, cache_dir=".bioguide_cache"):
+    # Maximum number of (name, year, state) lookups remembered by get_bioguide_id()
+    LOOKUP_CACHE_SIZE = 4096
+
+    # Senators-only snapshot of the YAML files, kept in cache_dir
+    SNAPSHOT_FILENAME = "senators.pickle"
+    SNAPSHOT_VERSION = 1
+
+    # Version of the name matching rules, part of data_version(). Bump it with any
+    # change to normalization or matching that can change which ID a name gets.
+    MATCHER_VERSION = 1
+
+    def __init__(self, cache_dir=".bioguide_cache", lookup_cache_size=None, source=None):
         """
         Initialize the matcher and load legislator data.
 
         Args:
             cache_dir: Directory to cache downloaded YAML files
+            lookup_cache_size: Maximum number of remembered lookups (default: LOOKUP_CACHE_SIZE)
+            source: Legislator source object or spec string (see get_legislator_source())
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self.source = get_legislator_source(source)
         self.senators = []
+        self.name_index = {}
         self._load_legislators()
+        self._build_index()
+
+        if lookup_cache_size is None:
+            lookup_cache_size = self.LOOKUP_CACHE_SIZE
+        self.lookup_cache_size = lookup_cache_size
+        self._lookup = functools.lru_cache(maxsize=lookup_cache_size)(self._resolve)
+        self._warned = set()
+        self._warnings_suppressed = 0
+
+    def __getstate__(self):
+        """Pickle without the lookup cache (e.g. to send a loaded matcher to worker processes)."""
+        state = self.__dict__.copy()
+        del state['_lookup']
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled matcher with an empty lookup cache."""
+        self.__dict__.update(state)
+        self._lookup = functools.lru_cache(maxsize=self.lookup_cache_size)(self._resolve)
 
-    def _download_file(self, url, filename):
-        """Download a file from URL to cache directory."""
-        cache_path = self.cache_dir / filename
-
-        # Use cached file if it exists and is less than 7 days old
-        if cache_path.exists():
-            age_days = (datetime.now().timestamp() - cache_path.stat().st_mtime) / 86400
-            if age_days < 7:
-                print(f"Using cached {filename} (age: {age_days:.1f} days)")
-                return cache_path
+    def _load_legislators(self):
+        """Get legislator data from the source and load senators from the snapshot or the YAML files."""
+        print("\n=== Loading legislator data ===")
 
-        print(f"Downloading {filename}...")
-        try:
-            urllib.request.urlretrieve(url, cache_path)
-            print(f"Downloaded {filename}")
-        except Exception as e:
-            print(f"Error downloading {filename}: {e}")
-            if cache_path.exists():
-                print(f"Using existing cached file despite error")
-            else:
-                raise
+        source_files = self.source.get_files(self.cache_dir)
+
+        # A senators snapshot (see export_snapshot()) needs no YAML parsing at all
+        if len(source_files) == 1 and source_files[0].suffix == '.json':
+            with open(source_files[0], 'r', encoding='utf-8') as f:
+                self.senators = json.load(f)['senators']
+            print(f"Loaded {len(self.senators)} senators from {source_files[0]}")
+            return
+
+        # Parsing the YAML dominates startup, so reuse the snapshot while the files are unchanged
+        senators = self._load_snapshot(source_files)
+        if senators is not None:
+            self.senators = senators
+            print(f"Loaded {len(self.senators)} senators from {self.SNAPSHOT_FILENAME}")
+            return
+
+        # Each file is read once, and both its fingerprint and its senators come
+        # from those bytes, so a refresh replacing a file in between can't pair
+        # one version's fingerprint with the other version's senators
+        contents = [self._read_source_file(path) for path in source_files]
+        self.senators = self._parse_legislator_files([data for _, data in contents])
+        self._save_snapshot([fingerprint for fingerprint, _ in contents], self.senators)
+        print(f"Loaded {len(self.senators)} senators")
 
-        return cache_path
+    def _parse_legislator_files(self, source_data):
+        """
+        Parse congress-legislators YAML files and return their senators.
 
-    def _load_legislators(self):
-        """Download and load legislator data from YAML files."""
-        print("\n=== Loading legislator data ===")
+        Args:
+            source_data: Contents (bytes) of legislators-current.yaml and legislators-historical.yaml
 
-        # Download files
-        current_file = self._download_file(
-            self.LEGISLATORS_CURRENT_URL,
-            "legislators-current.yaml"
-        )
-        historical_file = self._download_file(
-            self.LEGISLATORS_HISTORICAL_URL,
-            "legislators-historical.yaml"
-        )
-
-        # Parse YAML files
-        print("Parsing legislator data...")
-        with open(current_file, 'r') as f:
-            current_legislators = yaml.safe_load(f)
+        Returns:
+            List of senator dictionaries with their Senate terms
+        """
+        import yaml
 
-        with open(historical_file, 'r') as f:
-            historical_legislators = yaml.safe_load(f)
+        # The LibYAML-based loader is much faster when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
-        # Combine and filter for senators
-        all_legislators = current_legislators + historical_legislators
+        print("Parsing legislator data...")
+        all_legislators = []
+        for data in source_data:
+            all_legislators.extend(yaml.load(data, Loader=loader))
 
+        senators = []
         for legislator in all_legislators:
             # Get senator terms only
             senator_terms = [
@@ -112,9 +172,166 @@ class BioguideIdMatcher:
                     'terms': senator_terms
                 }
 
-                self.senators.append(senator_info)
+                senators.append(senator_info)
 
-        print(f"Loaded {len(self.senators)} senators")
+        return senators
+
+    def export_snapshot(self, snapshot_file):
+        """
+        Write the loaded senators to a JSON snapshot usable as a legislator source.
+
+        Args:
+            snapshot_file: Output path, e.g. legislators/senators.json
+        """
+        snapshot_file = Path(snapshot_file)
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(snapshot_file, 'w', encoding='utf-8') as f:
+            json.dump({'senators': self._snapshot_senators()}, f, indent=1, default=str)
+            f.write('\n')
+
+    def _snapshot_senators(self):
+        """The loaded senators without the fields added by _build_index()."""
+        return [
+            {key: value for key, value in senator.items() if key != 'term_years'}
+            for senator in self.senators
+        ]
+
+    def data_version(self):
+        """
+        Fingerprint of the loaded legislator data and the matching rules (MATCHER_VERSION).
+
+        Callers that store matched IDs can compare it with the version they
+        matched against to tell whether the IDs need to be matched again.
+        Edits to this module that don't change matching, such as to logging or
+        downloads, leave it unchanged.
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{self.MATCHER_VERSION}\n".encode('utf-8'))
+        digest.update(json.dumps(self._snapshot_senators(), sort_keys=True, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_source_file(path):
+        """
+        Read a source file, fingerprinting exactly the bytes read.
+
+        The size and mtime come from the open file, so if the file is replaced
+        while it is being read, the fingerprint still describes the version read.
+
+        Returns:
+            Tuple of (fingerprint dictionary with name, size, mtime_ns and sha256, file bytes)
+        """
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        fingerprint = {
+            'name': path.name,
+            'size': len(data),
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': hashlib.sha256(data).hexdigest(),
+        }
+        return fingerprint, data
+
+    def _load_snapshot(self, source_files):
+        """
+        Load senators from the snapshot if it was built from the current source files.
+
+        A source file whose size and mtime match the snapshot is assumed
+        unchanged. If they differ (e.g. after a re-download), its hash is
+        compared instead, so touching a file doesn't force a YAML re-parse.
+
+        Returns:
+            List of senator dictionaries, or None if the snapshot is missing or stale
+        """
+        snapshot_path = self.cache_dir / self.SNAPSHOT_FILENAME
+        if not snapshot_path.exists():
+            return None
+
+        try:
+            with open(snapshot_path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable {self.SNAPSHOT_FILENAME}: {e}")
+            return None
+
+        sources = snapshot.get('sources', [])
+        if (snapshot.get('version') != self.SNAPSHOT_VERSION or
+                [source['name'] for source in sources] != [path.name for path in source_files]):
+            return None
+
+        restamp = False
+        fingerprints = []
+        for source, path in zip(sources, source_files):
+            stat = path.stat()
+            if source['size'] == stat.st_size and source['mtime_ns'] == stat.st_mtime_ns:
+                fingerprints.append(source)
+                continue
+            fingerprint, _ = self._read_source_file(path)
+            if source['sha256'] != fingerprint['sha256']:
+                print(f"{path.name} changed, rebuilding {self.SNAPSHOT_FILENAME}")
+                return None
+            fingerprints.append(fingerprint)
+            restamp = True
+
+        # Same content with new mtimes: record them so the next run skips hashing
+        if restamp:
+            self._save_snapshot(fingerprints, snapshot['senators'])
+
+        return snapshot['senators']
+
+    def _save_snapshot(self, sources, senators):
+        """
+        Write senators to the snapshot with the fingerprints (from
+        _read_source_file()) of the source files they were parsed from.
+        """
+        snapshot = {'version': self.SNAPSHOT_VERSION, 'sources': sources, 'senators': senators}
+
+        # Write to a temporary file first so a partial snapshot is never loaded
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_dir / self.SNAPSHOT_FILENAME)
+        except OSError as e:
+            print(f"Warning: Could not write {self.SNAPSHOT_FILENAME}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _build_index(self):
+        """
+        Index senators by every normalized name variant and precompute term years.
+
+        Each senator gets a 'term_years' list of (start_year, end_year) tuples,
+        and self.name_index maps each name from _get_senator_full_name() to the
+        senators with that name, in load order, so a lookup is a dict hit plus
+        a check of a few intervals.
+        """
+        current_year = datetime.now().year
+        self.name_index = {}
+
+        for senator in self.senators:
+            term_years = []
+            for term in senator['terms']:
+                start_str = term.get('start', '')
+                end_str = term.get('end', '')
+
+                if not start_str:
+                    continue
+
+                try:
+                    start_year = int(start_str.split('-')[0])
+                    end_year = int(end_str.split('-')[0]) if end_str else current_year
+                except (ValueError, IndexError):
+                    continue
+
+                term_years.append((start_year, end_year))
+            senator['term_years'] = term_years
+
+            for name in dict.fromkeys(self._get_senator_full_name(senator)):
+                self.name_index.setdefault(name, []).append(senator)
 
     def _normalize_name(self, name):
         """Normalize a name for comparison."""
@@ -166,25 +383,7 @@ class BioguideIdMatcher:
         if not year:
             return True  # If no year provided, consider all senators
 
-        for term in senator['terms']:
-            start_str = term.get('start', '')
-            end_str = term.get('end', '')
-
-            if not start_str:
-                continue
-
-            # Parse dates
-            try:
-                start_year = int(start_str.split('-')[0])
-                end_year = int(end_str.split('-')[0]) if end_str else datetime.now().year
-
-                # Check if year falls within term
-                if start_year <= year <= end_year:
-                    return True
-            except (ValueError, IndexError):
-                continue
-
-        return False
+        return any(start_year <= year <= end_year for start_year, end_year in senator['term_years'])
 
     def get_bioguide_id(self, senator_name, year=None, state=None):
         """
@@ -201,37 +400,88 @@ class BioguideIdMatcher:
         if not senator_name:
             return ""
 
-        normalized_input = self._normalize_name(senator_name)
+        # Names repeat on every row of a senator's office, so lookups are memoized
+        key = (self._normalize_name(senator_name), year or None, state.upper() if state else None)
+        bioguide_id, match_count = self._lookup(*key)
+
+        if match_count > 1:
+            # Warn once per lookup rather than once per row
+            if key in self._warned:
+                self._warnings_suppressed += 1
+            else:
+                self._warned.add(key)
+                print(f"Warning: Multiple matches for '{senator_name}' in year {year}")
+
+        return bioguide_id
+
+    def resolve_many(self, pairs):
+        """
+        Get bioguide IDs for a column of (senator_name, year) pairs.
+
+        Each distinct pair is resolved once and its result is broadcast back
+        to every position it appears in, so the work scales with the number of
+        distinct senator-years rather than the number of rows. Pairs may also
+        be (senator_name, year, state) triples.
 
+        Args:
+            pairs: Iterable of (senator_name, year) tuples
+
+        Returns:
+            List of bioguide ID strings (empty if not found), one per pair
+        """
+        pairs = list(pairs)
+        resolved = {}
+        for pair in pairs:
+            if pair not in resolved:
+                resolved[pair] = self.get_bioguide_id(*pair)
+        return [resolved[pair] for pair in pairs]
+
+    def _resolve(self, normalized_input, year, state):
+        """
+        Find the bioguide ID for an already normalized name, year and upper-case state.
+
+        Returns:
+            Tuple of (bioguide ID or empty string, number of matching senators)
+        """
         # Find matching senators
         matches = []
-        for senator in self.senators:
-            # Check if name matches
-            senator_names = self._get_senator_full_name(senator)
-            if normalized_input in senator_names:
-                # Check if senator was active in the given year
-                if self._is_senator_active(senator, year):
-                    # If state is provided, check if it matches
-                    if state:
-                        state_match = any(
-                            term.get('state', '').upper() == state.upper()
-                            for term in senator['terms']
-                        )
-                        if state_match:
-                            matches.append(senator)
-                    else:
+        for senator in self.name_index.get(normalized_input, []):
+            # Check if senator was active in the given year
+            if self._is_senator_active(senator, year):
+                # If state is provided, check if it matches
+                if state:
+                    state_match = any(
+                        term.get('state', '').upper() == state
+                        for term in senator['terms']
+                    )
+                    if state_match:
                         matches.append(senator)
+                else:
+                    matches.append(senator)
 
-        # Return the bioguide ID if we have exactly one match
-        if len(matches) == 1:
-            return matches[0]['bioguide_id']
-        elif len(matches) > 1:
-            # Multiple matches - log warning and return first match
-            print(f"Warning: Multiple matches for '{senator_name}' in year {year}")
-            return matches[0]['bioguide_id']
+        # With multiple matches, get_bioguide_id() warns and the first match is used
+        if matches:
+            return matches[0]['bioguide_id'], len(matches)
         else:
             # No matches found
-            return ""
+            return "", 0
+
+    def cache_stats(self):
+        """
+        Get statistics for the get_bioguide_id() lookup cache.
+
+        Returns:
+            Dictionary with hits, misses, size, maxsize and warnings_suppressed
+            (repeated "Multiple matches" warnings that were not printed again)
+        """
+        info = self._lookup.cache_info()
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'maxsize': info.maxsize,
+            'warnings_suppressed': self._warnings_suppressed,
+        }
 
     def get_match_info(self, senator_name, year=None):
         """
@@ -245,16 +495,14 @@ class BioguideIdMatcher:
         normalized_input = self._normalize_name(senator_name)
 
         matches = []
-        for senator in self.senators:
-            senator_names = self._get_senator_full_name(senator)
-            if normalized_input in senator_names:
-                if self._is_senator_active(senator, year):
-                    matches.append({
-                        'bioguide_id': senator['bioguide_id'],
-                        'full_name': senator['official_full'],
-                        'matched_name': normalized_input,
-                        'terms': senator['terms']
-                    })
+        for senator in self.name_index.get(normalized_input, []):
+            if self._is_senator_active(senator, year):
+                matches.append({
+                    'bioguide_id': senator['bioguide_id'],
+                    'full_name': senator['official_full'],
+                    'matched_name': normalized_input,
+                    'terms': senator['terms']
+                })
 
         return {
             'input_name': senator_name,
@@ -265,9 +513,216 @@ class BioguideIdMatcher:
         }
 
 
+class HttpLegislatorSource:
+    """
+    Legislator YAML files downloaded from congress-legislators into the cache directory.
+
+    Cached files are always used straight away. Files older than max_age_days
+    are revalidated in a background thread with a conditional GET
+    (If-None-Match / If-Modified-Since), so a run never waits on the network
+    while it has something to work with. Only a first run with an empty
+    cache downloads in the foreground.
+
+    A background refresh still running at interpreter exit is killed
+    mid-write, so temporary files it leaves behind are removed on the next
+    load.
+    """
+
+    FILES = [
+        ("legislators-current.yaml", BioguideIdMatcher.LEGISLATORS_CURRENT_URL),
+        ("legislators-historical.yaml", BioguideIdMatcher.LEGISLATORS_HISTORICAL_URL),
+    ]
+
+    def __init__(self, max_age_days=7, timeout=60, background=True):
+        """
+        Args:
+            max_age_days: Age after which cached files are revalidated
+            timeout: Network timeout in seconds for each request
+            background: Revalidate stale files in a background thread
+        """
+        self.max_age_days = max_age_days
+        self.timeout = timeout
+        self.background = background
+
+    def __str__(self):
+        return "http"
+
+    def get_files(self, cache_dir):
+        """Return the cached YAML paths, downloading or scheduling revalidation as needed."""
+        cache_dir = Path(cache_dir)
+        remove_stale_temp_files(cache_dir)
+
+        stale = []
+        for filename, url in self.FILES:
+            cache_path = cache_dir / filename
+            if not cache_path.exists():
+                print(f"Downloading {filename}...")
+                self._fetch(url, cache_path)
+                print(f"Downloaded {filename}")
+                continue
+
+            age_days = (datetime.now().timestamp() - cache_path.stat().st_mtime) / 86400
+            print(f"Using cached {filename} (age: {age_days:.1f} days)")
+            if age_days >= self.max_age_days:
+                stale.append((filename, url))
+
+        if stale:
+            self._start_refresh(cache_dir, stale)
+
+        return [cache_dir / filename for filename, _ in self.FILES]
+
+    def _start_refresh(self, cache_dir, files):
+        """Revalidate files in the background (or right away if background is off)."""
+        if not self.background:
+            self._refresh(cache_dir, files)
+            return
+        print("Checking for updated legislator data in the background")
+        threading.Thread(target=self._refresh, args=(cache_dir, files), daemon=True).start()
+
+    def _refresh(self, cache_dir, files):
+        """Revalidate each file, reporting errors instead of raising them."""
+        for filename, url in files:
+            try:
+                if self._fetch(url, Path(cache_dir) / filename):
+                    print(f"Updated {filename}")
+            except Exception as e:
+                print(f"Error updating {filename}: {e}")
+
+    def _fetch(self, url, cache_path):
+        """
+        Download url to cache_path with a conditional GET.
+
+        The response's ETag and Last-Modified headers are kept next to the file
+        (<file>.headers.json) for the next revalidation.
+
+        Returns:
+            True if new content was written, False if the cached copy is current
+        """
+        headers_path = cache_path.with_name(cache_path.name + '.headers.json')
+        validators = {}
+        if cache_path.exists() and headers_path.exists():
+            with open(headers_path, 'r') as f:
+                validators = json.load(f)
+
+        request = urllib.request.Request(url)
+        if validators.get('etag'):
+            request.add_header('If-None-Match', validators['etag'])
+        if validators.get('last_modified'):
+            request.add_header('If-Modified-Since', validators['last_modified'])
+
+        try:
+            response = urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                # Not modified: restart the max_age_days clock
+                os.utime(cache_path)
+                return False
+            raise
+
+        # Write to a temporary file first so readers never see a partial download
+        with response:
+            fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in iter(lambda: response.read(1024 * 1024), b''):
+                        f.write(chunk)
+                os.chmod(temp_path, 0o644)
+                os.replace(temp_path, cache_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+
+        with open(headers_path, 'w') as f:
+            json.dump(validators, f)
+        return True
+
+
+class LocalLegislatorSource:
+    """
+    Legislator data read from a local path, never from the network.
+
+    The path can be a directory holding legislators-current.yaml and
+    legislators-historical.yaml, a single legislators YAML file (such as a
+    small test fixture), or a senators JSON snapshot.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def __str__(self):
+        return str(self.path)
+
+    def get_files(self, cache_dir):
+        """Return the YAML or snapshot paths under self.path."""
+        if self.path.is_dir():
+            files = [self.path / filename for filename, _ in HttpLegislatorSource.FILES]
+        else:
+            files = [self.path]
+
+        for path in files:
+            if not path.exists():
+                raise FileNotFoundError(f"Legislator data not found: {path}")
+            print(f"Using local {path}")
+        return files
+
+
+def remove_stale_temp_files(cache_dir, max_age=STALE_TEMP_SECONDS):
+    """
+    Remove temporary files left in cache_dir by interrupted writes.
+
+    Only files untouched for max_age seconds are removed, so a download still
+    in progress in another process is left alone.
+    """
+    cutoff = datetime.now().timestamp() - max_age
+    for temp_path in Path(cache_dir).glob('*.tmp'):
+        try:
+            if temp_path.stat().st_mtime < cutoff:
+                temp_path.unlink()
+        except OSError:
+            pass
+
+
+def get_legislator_source(source=None):
+    """
+    Resolve a legislator source.
+
+    Args:
+        source: A source object (anything with get_files(cache_dir)), or a
+            spec string: "http" for congress-legislators over HTTP, or a local
+            file or directory path.
+            Defaults to the BIOGUIDE_SOURCE environment variable, then "http".
+
+    Returns:
+        Legislator source object
+    """
+    if source is None:
+        source = os.environ.get(SOURCE_ENV_VAR) or "http"
+    if not isinstance(source, str):
+        return source
+    if source == "http":
+        return HttpLegislatorSource()
+    return LocalLegislatorSource(source)
+
+
 def main():
     """Test the bioguide matcher."""
-    matcher = BioguideIdMatcher()
+    parser = argparse.ArgumentParser(description='Test the bioguide matcher or export a senators snapshot')
+    parser.add_argument('--legislators-source', default=None,
+                        help=f'Legislator data: "http" or a local file/directory (default: ${SOURCE_ENV_VAR} or http)')
+    parser.add_argument('--export-snapshot', metavar='PATH',
+                        help='Write the loaded senators to a JSON snapshot, usable later as --legislators-source PATH')
+    args = parser.parse_args()
+
+    matcher = BioguideIdMatcher(source=args.legislators_source)
+
+    if args.export_snapshot:
+        matcher.export_snapshot(args.export_snapshot)
+        print(f"Wrote {len(matcher.senators)} senators to {args.export_snapshot}")
+        return
 
     # Test cases
     test_cases = [
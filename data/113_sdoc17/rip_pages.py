@@ -6,11 +6,14 @@ end_page = 2077
 # this is including compensation to members. Is that ok? 
 
 
-page_range = range(start_page, end_page+1)
-for page_number in page_range:
-    output_filename = "pages/layout_%s.txt" % (page_number)
-    layout_cmd = "pdftotext -f %s -l %s -layout GPO-CDOC-113sdoc17.pdf %s" % (page_number, page_number, output_filename)
-    print layout_cmd
-    result = os.popen(layout_cmd).read()
-    print result
+# Run pdftotext once over the whole range and split the output on the
+# form feed that terminates each page
+layout_cmd = "pdftotext -f %s -l %s -layout GPO-CDOC-113sdoc17.pdf -" % (start_page, end_page)
+print layout_cmd
+pages = os.popen(layout_cmd).read().split('\f')[:-1]
+for offset, page_text in enumerate(pages):
+    output_filename = "pages/layout_%s.txt" % (start_page + offset)
+    output_file = open(output_filename, 'w')
+    output_file.write(page_text + '\f')
+    output_file.close()
 
@@ -6,16 +6,21 @@ def rip_pages(file_name, start_page, end_page):
     # Create pages directory if it doesn't exist
     os.makedirs("pages", exist_ok=True)
 
-    for page_number in range(start_page, end_page + 1):
-        output_filename = f"pages/layout_{page_number}.txt"
-        layout_cmd = ["pdftotext", "-f", str(page_number), "-l", str(page_number),
-                      "-layout", file_name, output_filename]
-        print(f"Extracting page {page_number}: {' '.join(layout_cmd)}")
-        try:
-            result = subprocess.run(layout_cmd, capture_output=True, text=True, check=True)
-            if result.stderr:
-                print(result.stderr)
-        except subprocess.CalledProcessError as e:
-            print(f"Error extracting page {page_number}: {e}")
-            if e.stderr:
-                print(e.stderr)
\ No newline at end of file
+    # Run pdftotext once over the whole range and split the output on the
+    # form feed that terminates each page
+    layout_cmd = ["pdftotext", "-f", str(start_page), "-l", str(end_page),
+                  "-layout", file_name, "-"]
+    print(f"Extracting pages {start_page}-{end_page}: {' '.join(layout_cmd)}")
+    try:
+        result = subprocess.run(layout_cmd, capture_output=True, check=True)
+        if result.stderr:
+            print(result.stderr.decode('utf-8', 'replace'))
+    except subprocess.CalledProcessError as e:
+        print(f"Error extracting pages {start_page}-{end_page}: {e}")
+        if e.stderr:
+            print(e.stderr.decode('utf-8', 'replace'))
+        return
+
+    for offset, page_text in enumerate(result.stdout.split(b'\f')[:-1]):
+        with open(f"pages/layout_{start_page + offset}.txt", 'wb') as fh:
+            fh.write(page_text + b'\f')
\ No newline at end of file
@@ -2,9 +2,13 @@ import os
 
 def rip_pages(file_name, start_page, end_page):
 
-    for page_number in range(start_page, end_page+1):
-        output_filename = "pages/layout_%s.txt" % (page_number)
-        layout_cmd = "pdftotext -f %s -l %s -layout %s %s" % (page_number, page_number, file_name, output_filename)
-        print layout_cmd
-        result = os.popen(layout_cmd).read()
-        print result
\ No newline at end of file
+    # Run pdftotext once over the whole range and split the output on the
+    # form feed that terminates each page
+    layout_cmd = "pdftotext -f %s -l %s -layout %s -" % (start_page, end_page, file_name)
+    print layout_cmd
+    pages = os.popen(layout_cmd).read().split('\f')[:-1]
+    for offset, page_text in enumerate(pages):
+        output_filename = "pages/layout_%s.txt" % (start_page + offset)
+        output_file = open(output_filename, 'w')
+        output_file.write(page_text + '\f')
+        output_file.close()
\ No newline at end of file
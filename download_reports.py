@@ -8,7 +8,7 @@ and organizes them in the data/ directory (e.g., data/114_sdoc13/).
 The reports are available at: https://www.govinfo.gov/app/collection/cdoc
 
 Requirements:
-    - wget (recommended) or Python requests library
+    - Python requests library
     - Internet connection without restrictive proxies
 
 Usage:
@@ -21,12 +21,29 @@ Usage:
     # Download from a list file
     python3 download_reports.py --list-file report_ids.txt
 
+    # Download with 8 parallel connections, at most 2 requests/second to govinfo.gov
+    python3 download_reports.py --list-file report_ids.txt --concurrency 8 --rate-limit 2
+
+    # Check downloaded PDFs against their recorded SHA-256 hashes
+    python3 download_reports.py --doc 118sdoc13 --verify
+
     # Dry run (show what would be downloaded)
     python3 download_reports.py --doc 118sdoc13 --dry-run
 
     # Generate wget commands for manual download
     python3 download_reports.py --doc 118sdoc13 --generate-commands
 
+Interrupted downloads are kept as .part files and resumed with HTTP Range
+requests on the next run. A resume sends If-Range with the ETag (or
+Last-Modified date) of the original response, so if the file changed on the
+server in between it is downloaded again from the start. Each report's
+data/<doc_id>/manifest.json records the size and SHA-256 of every file
+downloaded.
+
+The PDF files a report is split into are looked up once (from the package's
+MODS metadata, or by probing the possible part names) and saved to
+data/<doc_id>/parts.json, so later runs request only files that exist.
+
 Known Report IDs:
     118sdoc13, 118sdoc11, 118sdoc2  (118th Congress - 2023-2025)
     117sdoc10, 117sdoc2             (117th Congress - 2021-2023)
@@ -41,16 +58,30 @@ Note: govinfo.gov may block automated downloads. If you encounter 403 errors,
 """
 
 import os
+import re
 import sys
+import json
+import hashlib
 import argparse
+import threading
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Base URL for govinfo.gov
 GOVINFO_BASE = "https://www.govinfo.gov/content/pkg"
 
+# Base URL for govinfo.gov package metadata (mods.xml lists a package's PDF files)
+GOVINFO_METADATA = "https://www.govinfo.gov/metadata/pkg"
+
+# Per-report cache of discovered PDF files
+PARTS_INDEX_FILENAME = 'parts.json'
+
 # Headers to avoid 403 errors
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -59,6 +90,82 @@ HEADERS = {
     'Referer': 'https://www.govinfo.gov/'
 }
 
+# Parallel downloads and the most requests per second sent to any one host
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE_LIMIT = 1.0
+
+# Bytes read per chunk when streaming a download to disk
+CHUNK_SIZE = 64 * 1024
+
+# Suffix for files still being downloaded, and how many times to resume one per run
+PART_SUFFIX = '.part'
+RESUME_ATTEMPTS = 3
+
+# Suffix (after PART_SUFFIX) of the file holding a partial download's If-Range validator
+VALIDATOR_SUFFIX = '.validator'
+
+# Seconds to wait before the second attempt at a file, doubling for each attempt after that
+RESUME_BACKOFF = 2
+
+# Keeps lines from concurrent downloads from interleaving
+_print_lock = threading.Lock()
+
+
+def log(message):
+    """Print a message from any download thread."""
+    with _print_lock:
+        print(message)
+
+
+class HostRateLimiter:
+    """
+    Space out requests so each host sees at most `rate` requests per second,
+    however many threads are downloading.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE_LIMIT):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        """Block until a request to the host of `url` may be sent."""
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def create_session(concurrency=DEFAULT_CONCURRENCY):
+    """
+    Create an HTTP session whose connection pool is shared by all download threads.
+
+    Args:
+        concurrency (int): Number of threads that will use the session
+
+    Returns:
+        requests.Session: Session with browser headers, pooled keep-alive
+        connections and retries for connections that fail to open
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    # Byte ranges must refer to the file itself, not a compressed encoding of it
+    session.headers['Accept-Encoding'] = 'identity'
+    # Only retry connections that never reached the server. Error responses
+    # (429, 5xx) are retried by download_file(), which waits on the rate
+    # limiter before each attempt; retrying them here would bypass it.
+    retries = Retry(total=3, connect=3, read=False, status=0, other=0, backoff_factor=2,
+                    allowed_methods=['HEAD', 'GET'])
+    adapter = HTTPAdapter(pool_maxsize=max(concurrency, 1), max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 def get_pdf_urls(doc_id):
     """
@@ -86,18 +193,83 @@ def get_pdf_urls(doc_id):
     return urls
 
 
-def check_url_exists(url):
+def file_sha256(filepath, initial=None):
+    """
+    Hash a file's contents.
+
+    Args:
+        filepath (str): File to hash
+        initial: hashlib object to update instead of starting a new one
+
+    Returns:
+        hashlib object updated with the file's contents
+    """
+    hasher = initial or hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher
+
+
+class ReportManifest:
+    """
+    Size and SHA-256 of each file downloaded for a report, kept in
+    data/<doc_id>/manifest.json. Entries are saved as soon as they are
+    recorded, so files finished before an interruption stay recorded.
+    """
+
+    FILENAME = 'manifest.json'
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, self.FILENAME)
+        self.files = {}
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.files = json.load(f).get('files', {})
+            except (OSError, ValueError) as e:
+                print(f"  Warning: Ignoring unreadable manifest {self.path}: {e}")
+
+    def get(self, filename):
+        """Return the recorded entry for a file, or None."""
+        return self.files.get(filename)
+
+    def record(self, filename, url, size, sha256):
+        """Record a file's size and hash and save the manifest."""
+        with self._lock:
+            self.files[filename] = {
+                'url': url,
+                'size': size,
+                'sha256': sha256,
+                'recorded': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            }
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump({'files': self.files}, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+
+def check_url_exists(url, session=None, limiter=None):
     """
     Check if a URL exists without downloading the full file.
 
     Args:
         url (str): URL to check
+        session (requests.Session): Session to use (default: a one-off request)
+        limiter (HostRateLimiter): Rate limiter to wait on before the request
 
     Returns:
         tuple: (exists: bool, size: int or None)
     """
+    if limiter:
+        limiter.wait(url)
     try:
-        response = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
+        if session:
+            response = session.head(url, timeout=10, allow_redirects=True)
+        else:
+            response = requests.head(url, headers=HEADERS, timeout=10, allow_redirects=True)
         if response.status_code == 200:
             size = int(response.headers.get('content-length', 0))
             return True, size
@@ -106,119 +278,342 @@ def check_url_exists(url):
         return False, None
 
 
-def download_file(url, filepath, dry_run=False):
+def _content_range_total(response):
+    """Total file size from a Content-Range header ('bytes 0-99/1234' or 'bytes */1234'), or None."""
+    total = response.headers.get('content-range', '').rpartition('/')[2]
+    return int(total) if total.isdigit() else None
+
+
+def _response_validator(response):
+    """Validator to resume a response's download with (If-Range): a strong ETag, else Last-Modified, else None."""
+    etag = response.headers.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return response.headers.get('last-modified')
+
+
+def _fetch_to_part(url, part_path, session, limiter=None):
     """
-    Download a file from URL to filepath using wget (more reliable for govinfo.gov).
+    Fetch a URL into a .part file, resuming from whatever the file already holds.
+
+    The validator of the response that started the file is kept next to it
+    (part_path + VALIDATOR_SUFFIX) and sent as If-Range when resuming. If the
+    file changed on the server, the server sends all of it and the partial
+    file is replaced. A partial file without a validator is never resumed.
+
+    Args:
+        url (str): URL to download from
+        part_path (str): Partial file to create or extend
+        session (requests.Session): Session to use
+        limiter (HostRateLimiter): Rate limiter to wait on before the request
+
+    Returns:
+        tuple: (size, SHA-256 hex digest) of the complete file, or None if the URL doesn't exist
+
+    Raises:
+        requests.RequestException, OSError: If the download fails; the partial
+        file is left in place to resume from
+    """
+    filename = os.path.basename(url)
+    validator_path = part_path + VALIDATOR_SUFFIX
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+    validator = None
+    if offset and os.path.exists(validator_path):
+        with open(validator_path, 'r') as f:
+            validator = f.read().strip() or None
+    if offset and not validator:
+        # Appending could mix two versions of the file, so start over
+        log(f"    ⬇ Restarting: {filename} (partial file can't be matched to the server's file)")
+        offset = 0
+
+    headers = {'Range': f'bytes={offset}-', 'If-Range': validator} if offset else {}
+
+    if limiter:
+        limiter.wait(url)
+
+    with session.get(url, headers=headers, timeout=120, stream=True) as response:
+        # Silently fail for non-existent parts (404 is expected for part 2, 3, etc.)
+        if response.status_code == 404:
+            return None
+
+        if response.status_code == 416:
+            # Nothing left to fetch: either the partial file is already complete,
+            # or it's longer than the file on the server and has to start over
+            if _content_range_total(response) == offset:
+                return offset, file_sha256(part_path).hexdigest()
+            os.remove(part_path)
+            if os.path.exists(validator_path):
+                os.remove(validator_path)
+            raise requests.HTTPError("partial file doesn't match the server's file, restarting")
+
+        response.raise_for_status()
+
+        if response.status_code == 206 and offset:
+            expected = _content_range_total(response)
+            log(f"    ⬇ Resuming: {filename} from {offset / (1024 * 1024):.1f} MB")
+            hasher = file_sha256(part_path)
+            mode = 'ab'
+        else:
+            # Full response: a new download, the file changed on the server, or the server ignored the range
+            expected = int(response.headers['content-length']) if 'content-length' in response.headers else None
+            if offset:
+                log(f"    ⬇ Restarting: {filename} (changed on the server)")
+            else:
+                log(f"    ⬇ Downloading: {filename}")
+            hasher = hashlib.sha256()
+            mode = 'wb'
+
+            new_validator = _response_validator(response)
+            if new_validator:
+                with open(validator_path, 'w') as f:
+                    f.write(new_validator)
+            elif os.path.exists(validator_path):
+                os.remove(validator_path)
+
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+                    hasher.update(chunk)
+
+    size = os.path.getsize(part_path)
+    if expected is not None and size != expected:
+        raise requests.exceptions.ChunkedEncodingError(f"connection closed after {size} of {expected} bytes")
+
+    return size, hasher.hexdigest()
+
+
+def download_file(url, filepath, dry_run=False, session=None, limiter=None, manifest=None,
+                  attempts=RESUME_ATTEMPTS):
+    """
+    Download a file from URL to filepath, resuming interrupted downloads.
+
+    The file is written to filepath + '.part' and only renamed into place once
+    complete. If the connection drops, the partial file is kept and the download
+    resumes with an HTTP Range request (up to `attempts` times, backing off
+    RESUME_BACKOFF seconds and doubling between attempts, and again on the next
+    run). Error responses such as 429 and 5xx are retried the same way, each
+    attempt waiting on the rate limiter first.
 
     Args:
         url (str): URL to download from
         filepath (str): Local file path to save to
         dry_run (bool): If True, only check if file exists
+        session (requests.Session): Pooled session to use (default: a new one)
+        limiter (HostRateLimiter): Rate limiter to wait on before each request
+        manifest (ReportManifest): Manifest to record the file's size and SHA-256 in
+        attempts (int): Maximum number of requests to make for the file
 
     Returns:
-        bool: True if successful, False otherwise
+        True if the file was downloaded, None if it doesn't exist on the server
+        (404), False if the download failed
     """
+    filename = os.path.basename(url)
+
     if dry_run:
         # In dry run, try a simple HEAD request to check existence
-        exists, size = check_url_exists(url)
+        exists, size = check_url_exists(url, session, limiter)
         if exists:
             size_mb = size / (1024 * 1024) if size else 0
-            print(f"    [DRY RUN] Would download: {os.path.basename(url)} ({size_mb:.1f} MB)")
+            log(f"    [DRY RUN] Would download: {filename} ({size_mb:.1f} MB)")
             return True
         else:
             # Even if HEAD fails, the file might exist - report optimistically
-            print(f"    [DRY RUN] Attempting: {os.path.basename(url)} (HEAD check failed, but file may exist)")
+            log(f"    [DRY RUN] Attempting: {filename} (HEAD check failed, but file may exist)")
             return True
 
-    print(f"    ⬇ Downloading: {os.path.basename(url)}")
-    print(f"       URL: {url}")
+    if session is None:
+        session = create_session(1)
+    part_path = filepath + PART_SUFFIX
+
+    for attempt in range(1, attempts + 1):
+        if attempt > 1:
+            time.sleep(RESUME_BACKOFF * 2 ** (attempt - 2))
+        try:
+            result = _fetch_to_part(url, part_path, session, limiter)
+        except (requests.RequestException, OSError) as e:
+            kept = os.path.getsize(part_path) / (1024 * 1024) if os.path.exists(part_path) else 0
+            log(f"       ✗ {filename}: Error (attempt {attempt}/{attempts}): {e}")
+            if kept:
+                log(f"         {kept:.1f} MB kept in {os.path.basename(part_path)}")
+            continue
+
+        if result is None:
+            return None
 
-    # Use wget which is more reliable for govinfo.gov than Python requests
-    import subprocess
+        size, sha256 = result
+        os.replace(part_path, filepath)
+        if os.path.exists(part_path + VALIDATOR_SUFFIX):
+            os.remove(part_path + VALIDATOR_SUFFIX)
+        if manifest is not None:
+            manifest.record(filename, url, size, sha256)
+        log(f"       ✓ {filename}: Downloaded {size / (1024 * 1024):.1f} MB")
+        return True
+
+    return False
+
+
+def load_parts_index(doc_id):
+    """
+    Read a report's cached list of PDF URLs from data/<doc_id>/parts.json.
 
+    Args:
+        doc_id (str): Document ID (e.g., '118sdoc13')
+
+    Returns:
+        list: PDF URLs, or None if the report's parts haven't been discovered yet
+    """
+    path = os.path.join('data', doc_id, PARTS_INDEX_FILENAME)
     try:
-        # wget options:
-        # -O: output file
-        # -q: quiet (no wget output)
-        # --show-progress: show progress bar
-        # --timeout=120: timeout after 120 seconds
-        # --tries=3: try up to 3 times
-        result = subprocess.run(
-            ['wget', '-O', filepath, '-q', '--show-progress', '--timeout=120', '--tries=3', url],
-            capture_output=True,
-            text=True,
-            timeout=180
-        )
-
-        if result.returncode == 0 and os.path.exists(filepath):
-            file_size_mb = os.path.getsize(filepath) / (1024 * 1024)
-            print(f"       ✓ Downloaded: {file_size_mb:.1f} MB")
-            return True
-        else:
-            # File doesn't exist or download failed
-            if os.path.exists(filepath):
-                os.remove(filepath)  # Clean up partial download
-            # Silently fail for non-existent parts (404 is expected for part 2, 3, etc.)
-            if result.returncode == 8:  # wget error code 8 is 404
-                return False
-            # For other errors, report them
-            if result.stderr:
-                print(f"       ✗ Error: {result.stderr.strip()}")
-            return False
-
-    except subprocess.TimeoutExpired:
-        print(f"       ✗ Error: Download timed out")
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        return False
+        with open(path, 'r') as f:
+            index = json.load(f)
     except FileNotFoundError:
-        # wget not installed, fall back to requests
-        print(f"       Note: wget not found, using Python requests (may fail due to bot protection)")
-        return download_file_with_requests(url, filepath)
-    except Exception as e:
-        print(f"       ✗ Error: {e}")
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        return False
+        return None
+    except (OSError, ValueError) as e:
+        log(f"  Warning: Ignoring unreadable parts index {path}: {e}")
+        return None
+
+    urls = [part['url'] for part in index.get('parts', [])]
+    return urls or None
 
 
-def download_file_with_requests(url, filepath):
-    """Fallback download using Python requests library."""
+def save_parts_index(doc_id, urls, source):
+    """
+    Save a report's discovered PDF URLs to data/<doc_id>/parts.json.
+
+    Args:
+        doc_id (str): Document ID (e.g., '118sdoc13')
+        urls (list): PDF URLs that exist
+        source (str): How the list was found ('mods.xml' or 'probe')
+    """
+    directory = os.path.join('data', doc_id)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, PARTS_INDEX_FILENAME)
+
+    index = {
+        'doc_id': doc_id,
+        'source': source,
+        'discovered': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'parts': [{'filename': os.path.basename(url), 'url': url} for url in urls],
+    }
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(index, f, indent=2)
+    os.replace(temp_path, path)
+
+
+def _parts_from_mods(doc_id, session, limiter=None):
+    """
+    List a report's PDF files from the package's MODS metadata on govinfo.gov.
+
+    Returns:
+        list: PDF URLs in the order listed, or None if the metadata is unavailable
+        or names no PDFs
+    """
+    url = f"{GOVINFO_METADATA}/GPO-CDOC-{doc_id}/mods.xml"
+    if limiter:
+        limiter.wait(url)
     try:
-        response = requests.get(url, headers=HEADERS, timeout=120, stream=True)
-        response.raise_for_status()
+        response = session.get(url, timeout=30)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
 
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
-        chunk_size = 8192
+    base_url = os.path.dirname(get_pdf_urls(doc_id)[0])
+    filenames = []
+    for match in re.finditer(rf'GPO-CDOC-{re.escape(doc_id)}(-\d+)?\.pdf', response.text, re.IGNORECASE):
+        filename = f"GPO-CDOC-{doc_id}{match.group(1) or ''}.pdf"
+        if filename not in filenames:
+            filenames.append(filename)
 
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
+    return [f"{base_url}/{filename}" for filename in filenames] or None
 
-        downloaded_mb = downloaded / (1024 * 1024)
-        print(f"       ✓ Downloaded: {downloaded_mb:.1f} MB")
-        return True
 
-    except requests.RequestException as e:
-        print(f"       ✗ Error: {e}")
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        return False
+def _probe_parts(doc_id, session, limiter=None):
+    """
+    Find which of the possible PDF URLs exist by requesting the first byte of each.
 
+    GET is used rather than HEAD because govinfo.gov may block HEAD requests.
 
-def download_report(doc_id, dry_run=False):
+    Returns:
+        tuple: (list of URLs that exist, True if every URL gave a definite answer)
     """
-    Download a Senate disbursement report by document ID.
+    found = []
+    complete = True
+
+    for url in get_pdf_urls(doc_id):
+        if limiter:
+            limiter.wait(url)
+        try:
+            with session.get(url, headers={'Range': 'bytes=0-0'}, timeout=30, stream=True) as response:
+                status = response.status_code
+        except requests.RequestException:
+            complete = False
+            continue
+
+        if status in (200, 206):
+            found.append(url)
+        elif status != 404:
+            complete = False
+
+    return found, complete
+
+
+def discover_parts(doc_id, session, limiter=None, dry_run=False, refresh=False):
+    """
+    Find which PDF files a report is actually split into.
+
+    Uses data/<doc_id>/parts.json if a previous run saved it (no requests at all).
+    Otherwise reads the package's mods.xml, falling back to probing the possible
+    part names, and saves what it finds for next time.
 
     Args:
         doc_id (str): Document ID (e.g., '118sdoc13')
-        dry_run (bool): If True, only check what would be downloaded
+        session (requests.Session): Session to use
+        limiter (HostRateLimiter): Rate limiter to wait on before each request
+        dry_run (bool): If True, don't save the parts index
+        refresh (bool): If True, ignore any saved parts index
 
     Returns:
-        int: Number of files successfully downloaded
+        list: PDF URLs to download
+    """
+    if not refresh:
+        urls = load_parts_index(doc_id)
+        if urls:
+            return urls
+
+    urls = _parts_from_mods(doc_id, session, limiter)
+    source = 'mods.xml'
+
+    if urls is None:
+        urls, complete = _probe_parts(doc_id, session, limiter)
+        source = 'probe'
+        if not complete:
+            # Some requests failed; don't cache a possibly incomplete list,
+            # and let the download stage try every possible file
+            log(f"  {doc_id.upper()}: Couldn't check every possible part - trying all of them")
+            return get_pdf_urls(doc_id)
+
+    if urls and not dry_run:
+        save_parts_index(doc_id, urls, source)
+    log(f"  {doc_id.upper()}: Found {len(urls)} PDF file(s) ({source})")
+    return urls
+
+
+def plan_report(doc_id, dry_run=False, urls=None):
+    """
+    List the files to fetch for a report, skipping ones already downloaded.
+
+    Args:
+        doc_id (str): Document ID (e.g., '118sdoc13')
+        dry_run (bool): If True, don't create the report directory
+        urls (list): PDF URLs the report has (default: every possible part)
+
+    Returns:
+        tuple: (list of (url, filepath) to download, number of files already present,
+        the report's ReportManifest)
     """
     doc_id = doc_id.lower().strip()
     directory = os.path.join('data', doc_id)
@@ -229,47 +624,162 @@ def download_report(doc_id, dry_run=False):
 
     print(f"\n[{doc_id.upper()}]")
 
-    # Get possible PDF URLs
-    pdf_urls = get_pdf_urls(doc_id)
-
-    success_count = 0
-    found_any = False
+    manifest = ReportManifest(directory)
+    downloads = []
+    existing = 0
 
-    for url in pdf_urls:
+    for url in (get_pdf_urls(doc_id) if urls is None else urls):
         # Extract filename from URL
         filename = os.path.basename(url)
         filepath = os.path.join(directory, filename)
 
-        # Check if already downloaded
+        # Check if already downloaded (no request needed)
         if os.path.exists(filepath):
             file_size_mb = os.path.getsize(filepath) / (1024 * 1024)
             print(f"  ✓ {filename}: Already exists ({file_size_mb:.1f} MB) - skipping")
-            success_count += 1
-            found_any = True
+            existing += 1
             continue
 
-        # Try to download the file
-        # Note: We skip HEAD check because govinfo.gov may block HEAD requests
-        # but allow GET requests. We'll just try to download and handle errors.
-        if download_file(url, filepath, dry_run):
-            success_count += 1
-            found_any = True
-        elif dry_run:
-            # In dry run mode, we tried and failed - that's expected for non-existent parts
-            pass
-        else:
-            # In actual download mode, the file doesn't exist - that's OK for optional parts
-            pass
+        if os.path.exists(filepath + PART_SUFFIX):
+            part_size_mb = os.path.getsize(filepath + PART_SUFFIX) / (1024 * 1024)
+            print(f"  … {filename}: {part_size_mb:.1f} MB downloaded previously - will resume")
+
+        downloads.append((url, filepath))
+
+    if downloads:
+        print(f"  {len(downloads)} file(s) to fetch")
+
+    return downloads, existing, manifest
+
+
+def download_reports(doc_ids, dry_run=False, concurrency=DEFAULT_CONCURRENCY,
+                     rate_limit=DEFAULT_RATE_LIMIT, refresh_parts=False):
+    """
+    Download several reports, fetching their files in parallel.
+
+    All files from all reports share one pool of worker threads and one pooled
+    HTTP session, and requests to each host are spaced out by a shared rate
+    limiter rather than a fixed sleep after every file. Each report's real
+    list of files is discovered first (see discover_parts()), so only files
+    that exist are requested.
+
+    Args:
+        doc_ids (list): Document IDs (e.g., ['118sdoc13', '117sdoc10'])
+        dry_run (bool): If True, only check what would be downloaded
+        concurrency (int): Maximum number of files fetched at once
+        rate_limit (float): Maximum requests per second to any one host (0 for no limit)
+        refresh_parts (bool): If True, rediscover each report's files instead of
+            using data/<doc_id>/parts.json
+
+    Returns:
+        dict: Number of files available for each doc ID (downloaded or already present)
+    """
+    doc_ids = [doc_id.lower().strip() for doc_id in doc_ids]
+    counts = {}
+    tasks = []
+
+    session = create_session(concurrency)
+    limiter = HostRateLimiter(rate_limit)
+
+    with session, ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        part_urls = list(executor.map(
+            lambda doc_id: discover_parts(doc_id, session, limiter, dry_run, refresh_parts), doc_ids))
+
+        for doc_id, urls in zip(doc_ids, part_urls):
+            downloads, existing, manifest = plan_report(doc_id, dry_run, urls)
+            counts[doc_id] = existing
+            tasks.extend((doc_id, url, filepath, manifest) for url, filepath in downloads)
 
-        # Be nice to the server
-        time.sleep(1)
+        if tasks:
+            print(f"\nFetching {len(tasks)} file(s) with up to {concurrency} connection(s)...")
 
-    if not found_any:
-        print(f"  ✗ No files found for {doc_id.upper()}")
-        print(f"     This report may not exist or may use a different naming convention")
-        print(f"     Check https://www.govinfo.gov/app/collection/cdoc for available reports")
+            # Note: We skip HEAD checks because govinfo.gov may block HEAD requests
+            # but allow GET requests. We just try to download and handle errors.
+            futures = [(doc_id, executor.submit(download_file, url, filepath, dry_run, session, limiter, manifest))
+                       for doc_id, url, filepath, manifest in tasks]
+            for doc_id, future in futures:
+                if future.result():
+                    counts[doc_id] += 1
 
-    return success_count
+    for doc_id, count in counts.items():
+        if not count:
+            print(f"\n  ✗ No files found for {doc_id.upper()}")
+            print(f"     This report may not exist or may use a different naming convention")
+            print(f"     Check https://www.govinfo.gov/app/collection/cdoc for available reports")
+
+    return counts
+
+
+def download_report(doc_id, dry_run=False):
+    """
+    Download a Senate disbursement report by document ID.
+
+    Args:
+        doc_id (str): Document ID (e.g., '118sdoc13')
+        dry_run (bool): If True, only check what would be downloaded
+
+    Returns:
+        int: Number of files successfully downloaded
+    """
+    return sum(download_reports([doc_id], dry_run=dry_run).values())
+
+
+def verify_report(doc_id):
+    """
+    Re-hash a report's downloaded PDFs and compare them with its manifest.
+
+    Files with no manifest entry yet (e.g. downloaded by hand or by an older
+    version of this script) have their hash recorded so later checks can use it.
+
+    Args:
+        doc_id (str): Document ID (e.g., '118sdoc13')
+
+    Returns:
+        tuple: (number of files verified or newly recorded, number of files that failed)
+    """
+    doc_id = doc_id.lower().strip()
+    directory = os.path.join('data', doc_id)
+
+    print(f"\n[{doc_id.upper()}]")
+
+    if not os.path.isdir(directory):
+        print(f"  ✗ No directory {directory} - nothing downloaded yet")
+        return 0, 0
+
+    manifest = ReportManifest(directory)
+    base_url = os.path.dirname(get_pdf_urls(doc_id)[0])
+    filenames = sorted(set(manifest.files) | {name for name in os.listdir(directory)
+                                              if name.lower().endswith('.pdf')})
+    ok = failed = 0
+
+    for filename in filenames:
+        filepath = os.path.join(directory, filename)
+        entry = manifest.get(filename)
+
+        if not os.path.exists(filepath):
+            print(f"  ✗ {filename}: Missing (recorded in {ReportManifest.FILENAME})")
+            failed += 1
+            continue
+
+        size = os.path.getsize(filepath)
+        sha256 = file_sha256(filepath).hexdigest()
+
+        if entry is None:
+            manifest.record(filename, f"{base_url}/{filename}", size, sha256)
+            print(f"  + {filename}: Not in manifest - recorded SHA-256 {sha256[:12]}…")
+            ok += 1
+        elif sha256 == entry['sha256'] and size == entry['size']:
+            print(f"  ✓ {filename}: OK ({size / (1024 * 1024):.1f} MB)")
+            ok += 1
+        else:
+            print(f"  ✗ {filename}: SHA-256 mismatch (expected {entry['sha256'][:12]}…, got {sha256[:12]}…)")
+            print(f"     Delete it and download again to replace it")
+            failed += 1
+
+    if not filenames:
+        print(f"  ✗ No PDFs found in {directory}")
+
+    return ok, failed
 
 
 def read_doc_ids_from_file(filepath):
@@ -309,6 +819,15 @@ Examples:
   # Dry run (check what would be downloaded)
   python3 download_reports.py --doc 118sdoc13 --dry-run
 
+  # Download with 8 parallel connections, at most 2 requests/second to govinfo.gov
+  python3 download_reports.py --list-file reports.txt --concurrency 8 --rate-limit 2
+
+  # Check downloaded PDFs against their recorded SHA-256 hashes (no downloading)
+  python3 download_reports.py --doc 118sdoc13 --verify
+
+  # Look up a report's PDF files again instead of using data/<doc_id>/parts.json
+  python3 download_reports.py --doc 118sdoc13 --refresh-parts
+
 Known Report IDs (as of 2025):
   118sdoc13, 118sdoc11, 118sdoc2  (118th Congress, 2023-2025)
   117sdoc10, 117sdoc2             (117th Congress, 2021-2023)
@@ -330,6 +849,14 @@ For more reports, visit: https://www.govinfo.gov/app/collection/cdoc
                        help='Show what would be downloaded without actually downloading')
     parser.add_argument('--generate-commands', action='store_true',
                        help='Generate wget/curl commands for manual download instead of downloading')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, metavar='N',
+                       help=f'Maximum number of files to download at once (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--rate-limit', type=float, default=DEFAULT_RATE_LIMIT, metavar='PER_SEC',
+                       help=f'Maximum requests per second to each host, 0 for no limit (default: {DEFAULT_RATE_LIMIT:g})')
+    parser.add_argument('--verify', action='store_true',
+                       help='Re-hash downloaded PDFs against each report\'s manifest instead of downloading')
+    parser.add_argument('--refresh-parts', action='store_true',
+                       help=f'Rediscover which PDF files each report has, ignoring data/<doc_id>/{PARTS_INDEX_FILENAME}')
 
     args = parser.parse_args()
 
@@ -363,23 +890,34 @@ For more reports, visit: https://www.govinfo.gov/app/collection/cdoc
             directory = os.path.join('data', doc_id_lower)
             print(f"# {doc_id.upper()}")
             print(f"mkdir -p {directory}")
-            for i in ['', '-1', '-2', '-3']:
-                filename = f"GPO-CDOC-{doc_id_lower}{i}.pdf"
-                url = f"https://www.govinfo.gov/content/pkg/GPO-CDOC-{doc_id_lower}/pdf/{filename}"
+            # Only the known files if a previous run discovered them
+            for url in load_parts_index(doc_id_lower) or get_pdf_urls(doc_id_lower):
                 print(f"wget -nc -P {directory} {url}  # Use -nc to skip if already downloaded")
             print()
         print("\n# After downloading, process with:")
         print(f"# python3 process_senate_disbursements.py data/<doc_id>/GPO-CDOC-<DOC_ID>.pdf --start XX --end YY")
         return 0
 
+    # Verify mode
+    if args.verify:
+        total_ok = total_failed = 0
+        for doc_id in doc_ids:
+            ok, failed = verify_report(doc_id)
+            total_ok += ok
+            total_failed += failed
+
+        print(f"\n{'='*80}")
+        print(f"Verified: {total_ok} file(s) OK, {total_failed} failed across {len(doc_ids)} report(s)")
+        print(f"{'='*80}")
+        return 1 if total_failed else 0
+
     if args.dry_run:
         print("[DRY RUN MODE - No files will be downloaded]")
     print(f"\nProcessing {len(doc_ids)} report(s)...")
 
-    total_files = 0
-    for doc_id in doc_ids:
-        files_downloaded = download_report(doc_id, dry_run=args.dry_run)
-        total_files += files_downloaded
+    counts = download_reports(doc_ids, dry_run=args.dry_run, concurrency=args.concurrency,
+                              rate_limit=args.rate_limit, refresh_parts=args.refresh_parts)
+    total_files = sum(counts.values())
 
     # Summary
     print(f"\n{'='*80}")
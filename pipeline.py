@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""
+Senate Disbursements Pipeline
+
+Runs every step from a report's doc ID to its cleaned CSV with one command:
+
+    download -> extract -> parse -> clean -> bioguide
+
+- download: fetch the report's PDF(s) from govinfo.gov (see download_reports.py)
+- extract:  pdftotext the itemization pages into pages/layout_N.txt
+- parse:    parse the pages into senate_data.csv and missing_data.json
+- clean:    reformat into senate_data_cleaned.csv
+- bioguide: fill in the cleaned CSV's bioguide_id column (see add_bioguide_ids.py)
+
+Each stage's key is a hash of the previous stage's key and the stage's own
+inputs (page range, parser version, cleaning version, legislator data, ...),
+starting from the PDF's SHA-256. Keys are recorded in pipeline_state.json next
+to the outputs, and a stage whose key and outputs are unchanged since the last
+run is skipped, so re-running after a parser change (a PARSER_VERSION bump)
+only re-parses and re-cleans, and
+re-running with nothing changed does no work at all.
+
+Reports are independent, so they run concurrently: downloads share one pooled
+HTTP session and rate limiter, while extract, parse, clean and bioguide stages
+from every report share a pool of worker processes. One report can download
+while another is in pdftotext and a third is parsing.
+
+Each PDF's outputs go in data/<doc_id>/ (data/<doc_id>/<part>/ for reports
+split into several PDFs), with the stages' full output in pipeline.log there.
+
+PDFs without a page range are scanned for their itemization pages (see
+process_senate_disbursements.detect_page_range()), and the detected range is
+remembered for that PDF.
+
+Usage:
+    python3 pipeline.py 114sdoc13 118sdoc13
+    python3 pipeline.py 114sdoc13:18-2264
+    python3 pipeline.py 118sdoc13-3:19-2973 114sdoc13:18-2264 --jobs 4
+    python3 pipeline.py --list-file reports.txt --ranges page_ranges.json
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import time
+import hashlib
+import argparse
+import threading
+import contextlib
+import subprocess
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import add_bioguide_ids
+import download_reports
+import process_senate_disbursements as psd
+
+
+# Stages run for each PDF after it has been downloaded, in order
+PROCESSING_STAGES = ['extract', 'parse', 'clean', 'bioguide']
+
+STATE_FILENAME = 'pipeline_state.json'
+LOG_FILENAME = 'pipeline.log'
+
+# Worker processes shared by the extract/parse/clean/bioguide stages of all reports
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+
+# Matcher used by pool worker processes, set once per worker by _init_worker()
+_worker_matcher = None
+
+
+def stage_key(*inputs):
+    """Hash a stage's inputs (the previous stage's key and its own parameters) into its key."""
+    return hashlib.sha256(json.dumps(inputs).encode('utf-8')).hexdigest()
+
+
+class PipelineState:
+    """
+    Keys of the stages last completed for one PDF, kept in
+    <output_dir>/pipeline_state.json.
+    """
+
+    def __init__(self, output_dir):
+        self.path = os.path.join(output_dir, STATE_FILENAME)
+        self.stages = {}
+
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.stages = json.load(f).get('stages', {})
+            except (OSError, ValueError) as e:
+                download_reports.log(f"Warning: Ignoring unreadable pipeline state {self.path}: {e}")
+
+    def is_current(self, stage, key):
+        """True if the stage last completed with this key."""
+        return self.stages.get(stage, {}).get('key') == key
+
+    def record(self, stage, key, seconds, **details):
+        """Record a completed stage, with any details worth keeping, and save the state."""
+        self.stages[stage] = {
+            'key': key,
+            'seconds': round(seconds, 3),
+            'completed': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            **details,
+        }
+        self._save()
+
+    def forget(self, stages):
+        """Drop stages that are about to be re-run, so a failure can't leave them looking current."""
+        for stage in stages:
+            self.stages.pop(stage, None)
+        self._save()
+
+    def _save(self):
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'stages': self.stages}, f, indent=2, sort_keys=True)
+        os.replace(temp_path, self.path)
+
+
+def parse_report_spec(spec):
+    """
+    Parse a report argument of the form DOC_ID, DOC_ID:START-END or, for a
+    report split into several PDFs, PART:START-END (e.g. 118sdoc13-3:19-2973).
+
+    Returns:
+        tuple: (doc_id, name the page range applies to, (start, end) or None)
+    """
+    name, _, page_range = spec.partition(':')
+    name = name.lower().strip()
+    doc_id = re.sub(r'-\d+$', '', name)
+    if not page_range:
+        return doc_id, name, None
+
+    start, _, end = page_range.partition('-')
+    try:
+        return doc_id, name, (int(start), int(end))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid page range in {spec!r} (expected DOC_ID:START-END)")
+
+
+def load_page_ranges(ranges_file):
+    """
+    Read page ranges from a JSON file mapping a doc ID (e.g. "114sdoc13") or a
+    PDF part (e.g. "118sdoc13-3") to [start, end].
+    """
+    with open(ranges_file, 'r') as f:
+        return {name.lower(): tuple(page_range) for name, page_range in json.load(f).items()}
+
+
+def download_stage(doc_id, session, limiter, download_slots, skip_download=False):
+    """
+    Download a report's PDFs (skipping files already on disk) and hash them.
+
+    Args:
+        doc_id (str): Document ID (e.g., '118sdoc13')
+        session (requests.Session): Pooled session shared by all reports
+        limiter (HostRateLimiter): Rate limiter shared by all reports
+        download_slots (threading.Semaphore): Limits files downloading at once across reports
+        skip_download (bool): If True, use the PDFs already in data/<doc_id>/
+
+    Returns:
+        list: (pdf_file, sha256) for each of the report's PDFs on disk
+
+    Raises:
+        RuntimeError: If any of the report's files failed to download (parts
+        that don't exist on the server are left out, not counted as failures)
+    """
+    directory = os.path.join('data', doc_id)
+
+    if skip_download:
+        pdf_files = sorted(glob.glob(os.path.join(directory, 'GPO-CDOC-*.pdf')))
+        manifest = download_reports.ReportManifest(directory)
+    else:
+        urls = download_reports.discover_parts(doc_id, session, limiter)
+        downloads, _, manifest = download_reports.plan_report(doc_id, urls=urls)
+        failed = []
+        for url, filepath in downloads:
+            with download_slots:
+                # None means the part doesn't exist, which is expected when
+                # discover_parts() falls back to every possible part name
+                if download_reports.download_file(url, filepath, session=session, limiter=limiter,
+                                                  manifest=manifest) is False:
+                    failed.append(os.path.basename(filepath))
+        # A report missing a part must not be processed (and cached) as complete
+        if failed:
+            raise RuntimeError(f"{len(failed)} file(s) failed to download: {', '.join(failed)}")
+        pdf_files = [os.path.join(directory, os.path.basename(url)) for url in urls]
+        pdf_files = [pdf_file for pdf_file in pdf_files if os.path.exists(pdf_file)]
+
+    # Use the download manifest's hash when it still matches the file's size
+    hashed = []
+    for pdf_file in pdf_files:
+        filename = os.path.basename(pdf_file)
+        entry = manifest.get(filename)
+        size = os.path.getsize(pdf_file)
+        if entry and entry['size'] == size:
+            sha256 = entry['sha256']
+        else:
+            sha256 = download_reports.file_sha256(pdf_file).hexdigest()
+            url = f"{os.path.dirname(download_reports.get_pdf_urls(doc_id)[0])}/{filename}"
+            manifest.record(filename, url, size, sha256)
+        hashed.append((pdf_file, sha256))
+
+    return hashed
+
+
+def detect_stage(pdf_file, pdf_sha256, output_dir, name, jobs=DEFAULT_JOBS):
+    """
+    Find a PDF's itemization pages, reusing the range detected for the same
+    PDF (and DETECT_VERSION) on an earlier run.
+
+    Returns:
+        (start, end), or None if the pages couldn't be detected
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    state = PipelineState(output_dir)
+    key = stage_key('detect', pdf_sha256, psd.DETECT_VERSION)
+    if state.is_current('detect', key):
+        return tuple(state.stages['detect']['page_range'])
+
+    download_reports.log(f"[{name}] detect: finding itemization pages")
+    start_time = time.perf_counter()
+    try:
+        page_range = psd.detect_page_range(pdf_file, jobs=jobs)
+    except (subprocess.CalledProcessError, OSError, ValueError) as e:
+        download_reports.log(f"[{name}] detect: FAILED: {e}")
+        return None
+
+    if page_range is None:
+        download_reports.log(f"[{name}] detect: no itemization pages found")
+        return None
+
+    seconds = time.perf_counter() - start_time
+    state.record('detect', key, seconds, page_range=list(page_range))
+    download_reports.log(f"[{name}] detect: pages {page_range[0]}-{page_range[1]} in {seconds:.1f}s")
+    return page_range
+
+
+def build_job(doc_id, pdf_file, page_range, output_dir, fixed_width=False):
+    """Describe one PDF's processing: its page range and the paths of each stage's outputs."""
+    pdf_basename = os.path.basename(pdf_file)
+    start, end = page_range
+    return {
+        'doc_id': doc_id,
+        'pdf_file': pdf_file,
+        'source_doc': pdf_basename.replace('GPO-CDOC-', '').replace('.pdf', ''),
+        'start': start,
+        'end': end,
+        'fixed_width': fixed_width,
+        'output_dir': output_dir,
+        'pages_dir': os.path.join(output_dir, 'pages'),
+        'csv_file': os.path.join(output_dir, 'senate_data.csv'),
+        'missing_file': os.path.join(output_dir, 'missing_data.json'),
+        'cleaned_file': os.path.join(output_dir, 'senate_data_cleaned.csv'),
+        'log_file': os.path.join(output_dir, LOG_FILENAME),
+    }
+
+
+def stage_outputs(stage, job):
+    """Files a stage leaves behind; it is re-run if any of them are missing."""
+    if stage == 'extract':
+        return [os.path.join(job['pages_dir'], f"layout_{page}.txt") for page in range(job['start'], job['end'] + 1)]
+    if stage == 'parse':
+        return [job['csv_file'], job['missing_file']]
+    return [job['cleaned_file']]
+
+
+def stage_keys(job, pdf_sha256, bioguide_version=None):
+    """
+    Compute the key of every processing stage for a PDF.
+
+    Args:
+        job (dict): From build_job()
+        pdf_sha256 (str): SHA-256 of the PDF
+        bioguide_version (str): Legislator data and matching rules fingerprint,
+            or None to leave out the bioguide stage
+
+    Returns:
+        dict: Stage name to key
+    """
+    keys = {}
+    keys['extract'] = stage_key('extract', pdf_sha256, job['start'], job['end'])
+    # Each stage is versioned by its own constant (PARSER_VERSION, CLEAN_VERSION),
+    # so edits that don't change a stage's output don't re-run it
+    keys['parse'] = stage_key('parse', keys['extract'], psd.parser_version(job['fixed_width']))
+    keys['clean'] = stage_key('clean', keys['parse'], job['source_doc'], psd.CLEAN_VERSION)
+    if bioguide_version:
+        keys['bioguide'] = stage_key('bioguide', keys['clean'], bioguide_version)
+    return keys
+
+
+def first_stale_stage(job, keys, state, force=False):
+    """
+    Find the first stage that has to run; every stage after it runs too.
+
+    Returns:
+        Stage name, or None if every stage is up to date
+    """
+    for stage in PROCESSING_STAGES:
+        if stage not in keys:
+            continue
+        outputs_exist = all(os.path.exists(path) for path in stage_outputs(stage, job))
+        if force or not state.is_current(stage, keys[stage]) or not outputs_exist:
+            # bioguide fills in the cleaned CSV in place, so matching IDs again
+            # against new legislator data means starting from a fresh clean
+            if stage == 'bioguide' and 'bioguide' in state.stages:
+                return 'clean'
+            return stage
+    return None
+
+
+def _init_worker(matcher):
+    """Pool initializer: keep the pre-built matcher for every bioguide stage this worker runs."""
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def run_stage(stage, job):
+    """
+    Pool entry point: run one processing stage for a PDF.
+
+    The stage's output is appended to the PDF's pipeline.log rather than
+    printed, since stages from several reports run at once.
+
+    Returns:
+        float: Seconds the stage took
+    """
+    start_time = time.perf_counter()
+
+    with open(job['log_file'], 'a') as log_file, \
+            contextlib.redirect_stdout(log_file), contextlib.redirect_stderr(log_file):
+        print(f"\n##### {stage} ({time.strftime('%Y-%m-%d %H:%M:%S')}) #####")
+
+        if stage == 'extract':
+            failed_batches = psd.extract_pages(job['pdf_file'], job['start'], job['end'], job['pages_dir'])
+            if failed_batches:
+                raise RuntimeError(f"pdftotext failed on {len(failed_batches)} page batch(es)")
+
+        elif stage == 'parse':
+            psd.parse_pages(job['start'], job['end'], job['pages_dir'], job['csv_file'], job['missing_file'],
+                            fixed_width=job['fixed_width'])
+
+        elif stage == 'clean':
+            psd.clean_csv(job['source_doc'], job['csv_file'], job['cleaned_file'], add_bioguide_ids=False)
+
+        elif stage == 'bioguide':
+            stats = add_bioguide_ids.add_bioguide_ids_to_csv(job['cleaned_file'], None, _worker_matcher)
+            if stats is None:
+                raise RuntimeError("could not add bioguide IDs")
+            print(f"Matched {stats['matched']} of {stats['senator_rows']} senator rows")
+
+    return time.perf_counter() - start_time
+
+
+def process_pdf(job, pdf_sha256, executor, bioguide_version=None, force=False):
+    """
+    Run a PDF through the processing stages that aren't up to date.
+
+    Returns:
+        dict: Stage name to status ('up to date', 'ran 1.2s', 'failed' or 'not run')
+    """
+    name = job['source_doc']
+    os.makedirs(job['output_dir'], exist_ok=True)
+
+    keys = stage_keys(job, pdf_sha256, bioguide_version)
+    state = PipelineState(job['output_dir'])
+    stale = first_stale_stage(job, keys, state, force)
+
+    stages = [stage for stage in PROCESSING_STAGES if stage in keys]
+    statuses = {stage: 'up to date' for stage in stages}
+    if stale is None:
+        download_reports.log(f"[{name}] All stages up to date")
+        return statuses
+
+    to_run = stages[stages.index(stale):]
+    state.forget(to_run)
+
+    for stage in to_run:
+        download_reports.log(f"[{name}] {stage}: running")
+        try:
+            seconds = executor.submit(run_stage, stage, job).result()
+        except Exception as e:
+            download_reports.log(f"[{name}] {stage}: FAILED: {e} (see {job['log_file']})")
+            statuses[stage] = 'failed'
+            for later_stage in to_run[to_run.index(stage) + 1:]:
+                statuses[later_stage] = 'not run'
+            return statuses
+
+        state.record(stage, keys[stage], seconds)
+        statuses[stage] = f"ran {seconds:.1f}s"
+        download_reports.log(f"[{name}] {stage}: done in {seconds:.1f}s")
+
+    return statuses
+
+
+def run_report(doc_id, page_ranges, executor, session, limiter, download_slots, options):
+    """
+    Download one report and process each of its PDFs.
+
+    Returns:
+        list: (name, statuses) for each PDF, where statuses maps stage name to status
+    """
+    try:
+        pdfs = download_stage(doc_id, session, limiter, download_slots, options['skip_download'])
+    except Exception as e:
+        download_reports.log(f"[{doc_id}] download: FAILED: {e}")
+        return [(doc_id, {'download': 'failed'})]
+
+    if not pdfs:
+        download_reports.log(f"[{doc_id}] download: no PDFs found")
+        return [(doc_id, {'download': 'failed'})]
+
+    results = []
+    for pdf_file, pdf_sha256 in pdfs:
+        source_doc = os.path.basename(pdf_file).replace('GPO-CDOC-', '').replace('.pdf', '')
+        page_range = page_ranges.get(source_doc.lower())
+        if page_range is None and len(pdfs) == 1:
+            page_range = page_ranges.get(doc_id)
+
+        # Reports split into several PDFs get a directory per part
+        output_dir = os.path.dirname(pdf_file)
+        if len(pdfs) > 1:
+            output_dir = os.path.join(output_dir, source_doc)
+
+        if page_range is None:
+            page_range = detect_stage(pdf_file, pdf_sha256, output_dir, source_doc, options['jobs'])
+
+        if page_range is None:
+            download_reports.log(f"[{source_doc}] No page range - skipping "
+                                 f"(pass {source_doc}:START-END or add it to --ranges)")
+            results.append((source_doc, {'download': 'done', 'pages': 'not found'}))
+            continue
+
+        job = build_job(doc_id, pdf_file, page_range, output_dir, options['fixed_width'])
+        try:
+            statuses = process_pdf(job, pdf_sha256, executor, options['bioguide_version'], options['force'])
+        except Exception:
+            download_reports.log(f"[{source_doc}] FAILED:\n{traceback.format_exc()}")
+            statuses = {'extract': 'failed'}
+        results.append((source_doc, {'download': 'done', 'pages': f"{page_range[0]}-{page_range[1]}", **statuses}))
+
+    return results
+
+
+def run_pipeline(reports, page_ranges, jobs=DEFAULT_JOBS, concurrency=download_reports.DEFAULT_CONCURRENCY,
+                 rate_limit=download_reports.DEFAULT_RATE_LIMIT, fixed_width=False, legislators_source=None,
+                 skip_bioguide=False, skip_download=False, force=False):
+    """
+    Run every report through the pipeline, reports concurrently.
+
+    Args:
+        reports (list): Doc IDs
+        page_ranges (dict): Doc ID or PDF part name to (start, end)
+        jobs (int): Worker processes for the extract/parse/clean/bioguide stages
+        concurrency (int): Maximum number of files downloading at once
+        rate_limit (float): Maximum requests per second to govinfo.gov
+        fixed_width (bool): Parse with column offsets (see process_senate_disbursements.py --fixed-width)
+        legislators_source: Legislator data for bioguide IDs (see bioguide_matcher.get_legislator_source())
+        skip_bioguide (bool): If True, leave out the bioguide stage
+        skip_download (bool): If True, use the PDFs already in data/<doc_id>/
+        force (bool): If True, run every stage even if it is up to date
+
+    Returns:
+        list: (name, statuses) for each PDF
+    """
+    matcher = None
+    bioguide_version = None
+    if not skip_bioguide:
+        # Loaded once here and handed to every worker, like add_bioguide_ids.py --jobs
+        matcher = psd.load_bioguide_matcher(legislators_source)
+        if matcher:
+            bioguide_version = stage_key(matcher.data_version(), add_bioguide_ids.ADD_IDS_VERSION)
+        else:
+            print("Bioguide stage will be skipped")
+
+    options = {
+        'jobs': jobs,
+        'fixed_width': fixed_width,
+        'bioguide_version': bioguide_version,
+        'skip_download': skip_download,
+        'force': force,
+    }
+
+    session = download_reports.create_session(concurrency)
+    limiter = download_reports.HostRateLimiter(rate_limit)
+    download_slots = threading.BoundedSemaphore(max(concurrency, 1))
+
+    # Workers are spawned rather than forked, since this process already has
+    # download threads running
+    executor = ProcessPoolExecutor(max_workers=max(jobs, 1), mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=_init_worker, initargs=(matcher,))
+
+    with session, executor, ThreadPoolExecutor(max_workers=max(len(reports), 1)) as report_threads:
+        futures = [report_threads.submit(run_report, doc_id, page_ranges, executor, session, limiter,
+                                         download_slots, options)
+                   for doc_id in reports]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+    return results
+
+
+def print_results(results, elapsed):
+    """Print each PDF's page range and stage statuses."""
+    stages = ['download', 'pages'] + PROCESSING_STAGES
+
+    print(f"\n{'='*80}")
+    print("PIPELINE SUMMARY")
+    print(f"{'='*80}")
+    print(f"{'PDF':<18}" + ''.join(f"{stage:>13}" for stage in stages))
+    for name, statuses in results:
+        print(f"{name:<18}" + ''.join(f"{statuses.get(stage, '-'):>13}" for stage in stages))
+    print(f"\nTotal time: {elapsed:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Download and process Senate disbursement reports from doc ID to cleaned CSV',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Download, extract, parse, clean and add bioguide IDs for one report
+  python3 pipeline.py 114sdoc13:18-2264
+
+  # Detect the itemization page ranges automatically
+  python3 pipeline.py 114sdoc13 118sdoc13
+
+  # A report split into several PDFs takes a page range per part
+  python3 pipeline.py 118sdoc13-3:19-2973
+
+  # Several reports at once, with 4 worker processes
+  python3 pipeline.py 118sdoc13-3:19-2973 114sdoc13:18-2264 --jobs 4
+
+  # Doc IDs from a file, page ranges from a JSON file
+  # ({"114sdoc13": [18, 2264], "118sdoc13-3": [19, 2973]})
+  python3 pipeline.py --list-file reports.txt --ranges page_ranges.json
+
+  # Re-run every stage even if nothing changed
+  python3 pipeline.py 118sdoc13-3:19-2973 --force
+
+Reports without a page range have their itemization pages detected. Stages
+that are up to date (same inputs, parser code and legislator data as the last
+run, outputs still present) are skipped.
+        """
+    )
+
+    parser.add_argument('reports', nargs='*', metavar='DOC_ID[:START-END]',
+                        help='Reports to process, optionally with the itemization page range (detected if omitted)')
+    parser.add_argument('--list-file', metavar='FILE',
+                        help='File containing doc IDs (one per line, optionally DOC_ID:START-END)')
+    parser.add_argument('--ranges', metavar='FILE',
+                        help='JSON file mapping doc IDs or PDF parts (e.g. 118sdoc13-3) to [start, end] pages')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS,
+                        help=f'Worker processes for extract/parse/clean/bioguide stages (default: {DEFAULT_JOBS})')
+    parser.add_argument('--concurrency', type=int, default=download_reports.DEFAULT_CONCURRENCY, metavar='N',
+                        help=f'Maximum number of files to download at once (default: {download_reports.DEFAULT_CONCURRENCY})')
+    parser.add_argument('--rate-limit', type=float, default=download_reports.DEFAULT_RATE_LIMIT, metavar='PER_SEC',
+                        help=f'Maximum requests per second to govinfo.gov (default: {download_reports.DEFAULT_RATE_LIMIT:g})')
+    parser.add_argument('--fixed-width', action='store_true',
+                        help='Split expense lines by the column offsets of each page header')
+    parser.add_argument('--legislators-source', default=None,
+                        help='Legislator data for bioguide IDs: "http" or a local file/directory '
+                             '(default: $BIOGUIDE_SOURCE or http)')
+    parser.add_argument('--skip-bioguide', action='store_true',
+                        help='Leave out the bioguide stage')
+    parser.add_argument('--skip-download', action='store_true',
+                        help='Use the PDFs already in data/<doc_id>/ without contacting govinfo.gov')
+    parser.add_argument('--force', action='store_true',
+                        help='Run every stage even if it is up to date')
+
+    args = parser.parse_args()
+
+    specs = list(args.reports)
+    if args.list_file:
+        specs.extend(download_reports.read_doc_ids_from_file(args.list_file))
+
+    if not specs:
+        parser.print_help()
+        print("\nError: Please specify reports as arguments or with --list-file")
+        return 1
+
+    page_ranges = load_page_ranges(args.ranges) if args.ranges else {}
+    reports = []
+    for spec in specs:
+        try:
+            doc_id, name, page_range = parse_report_spec(spec)
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+        if page_range:
+            page_ranges[name] = page_range
+        if doc_id not in reports:
+            reports.append(doc_id)
+
+    print(f"{'='*80}")
+    print("Senate Disbursements Pipeline")
+    print(f"{'='*80}")
+    print(f"Reports: {', '.join(reports)}")
+    print(f"Worker processes: {args.jobs}")
+
+    start_time = time.perf_counter()
+    results = run_pipeline(reports, page_ranges, jobs=args.jobs, concurrency=args.concurrency,
+                           rate_limit=args.rate_limit, fixed_width=args.fixed_width,
+                           legislators_source=args.legislators_source, skip_bioguide=args.skip_bioguide,
+                           skip_download=args.skip_download, force=args.force)
+    print_results(results, time.perf_counter() - start_time)
+
+    failed = any(status == 'failed' for _, statuses in results for status in statuses.values())
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
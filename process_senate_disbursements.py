@@ -25,7 +25,7 @@ Usage:
     python3 process_senate_disbursements.py GPO-CDOC-114sdoc13.pdf --start 18 --end 2264
     python3 process_senate_disbursements.py GPO-CDOC-118sdoc13.pdf --start 24 --end 591
 
-Or use the interactive mode:
+Or let the script find the itemization pages itself:
     python3 process_senate_disbursements.py <pdf_file>
 """
 
@@ -36,16 +36,15 @@ import subprocess
 import re
 import csv
 import json
+import io
+import hashlib
+import time
+import contextlib
+import collections
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-# Import bioguide matcher for adding bioguide IDs to senator records
-try:
-    from bioguide_matcher import BioguideIdMatcher
-except ImportError:
-    print("Warning: bioguide_matcher.py not found. Bioguide IDs will not be added.")
-    BioguideIdMatcher = None
-
-
 # Regular expressions for parsing
 header_end = re.compile(r"\s+START\s+END\s+")
 
@@ -139,47 +138,635 @@ SUBTOTAL_PATTERNS = [
     re.compile(r"\s+BENEFITS FOR NON SENATE/FORMER PERSONNEL\s+"),
 ]
 
+# First word of every subtotal pattern, used to skip them cheaply in classify_line()
+SUBTOTAL_FIRST_WORDS = frozenset([
+    'TRAVEL', 'INTERDEPARTMENTAL', 'OTHER', 'ACQUISITION', 'PERSONNEL', 'NET', 'RE-EMPLOYED', 'BENEFITS',
+])
+
+# Names of the pattern groups tried by process_data_lines(), as returned by classify_line()
+LINE_PATTERN_NAMES = frozenset([
+    'page_number', 'subtotal', 'five_data', 'three_data', 'five_data_missing_date',
+    'expense_record_flexible', 'salary_with_amount_flexible', 'salary_no_amount_flexible',
+    'expense_record_partial', 'expense_with_leading_date', 'salary_with_complex_name', 'amount_only_line',
+])
+
+# How far (in characters) a start date may sit from the header's START label in fixed-width parsing
+COLUMN_TOLERANCE = 2
+
+# Words in a salary line's position that mark it as a payroll total rather than a salary
+SALARY_EXCLUDED_WORDS = ['NET PAYROLL', 'ORGANIZATION', 'UNEXPENDED', 'TOTAL', 'AUTHORIZATION']
+
+# Route each data line to only the patterns that could match it (see classify_line())
+USE_LINE_CLASSIFIER = True
+
+# Necessary-condition guards for the patterns whose nested lazy groups backtrack badly
+# on lines they don't match. Each guard is a lookahead prepended to the original
+# pattern; it uses only possessive quantifiers and atomic groups, so
+# it runs in roughly linear time and rejects a line before the full pattern starts
+# backtracking. A guard only checks something the full pattern requires, so the
+# guarded pattern matches and captures exactly what the original does.
+_DATE = r"\d\d/\d\d/\d\d\d\d"
+# Ends with whitespace, a run of amount characters and optional trailing whitespace
+_AMOUNT_AT_END_GUARD = r"(?=(?s:.*?)\s[\d\.\-\,]++\s*+\Z)"
+PATTERN_GUARDS = {
+    'five_data_re': (
+        r"(?=\s*+[\w\d]++\s++" + _DATE + r"\s)" + _AMOUNT_AT_END_GUARD
+    ),
+    'five_data_missing_date': (
+        r"(?=\s*+[\w\d]++\s++" + _DATE + r"\s(?s:.*?)\s{10})" + _AMOUNT_AT_END_GUARD
+    ),
+    'three_data_re': (
+        # The name run reaches a 10-space gap, with a 4-space gap and an amount after it
+        r"(?=\s++\w(?>[\w\,\s\.\-\']*?\s{10})(?s:.*?)\s{4}[\d\.\-\,])"
+    ),
+    'salary_with_amount_flexible': (
+        r"(?=\s++[A-Z](?>[A-Z\s\,\.\-\']*?\s\s))"
+        r"(?=(?s:.*?)\s\s\$?[\d\,\.]++\s*+(?:B-\d++)?\s*+$)"
+    ),
+    'continuation_with_amount_re': (
+        r"(?=(?s:.*?)\s{10}[\d\.\-\,]++\s++\Z)"
+    ),
+}
+
+# The unguarded patterns, kept for comparison (see benchmark_parser.py patterns)
+ORIGINAL_PATTERNS = {
+    'five_data_re': five_data_re,
+    'five_data_missing_date': five_data_missing_date,
+    'three_data_re': three_data_re,
+    'salary_with_amount_flexible': salary_with_amount_flexible,
+    'continuation_with_amount_re': continuation_with_amount_re,
+}
+
+# The guarded patterns the parser uses
+five_data_re = re.compile(PATTERN_GUARDS['five_data_re'] + five_data_re.pattern)
+five_data_missing_date = re.compile(PATTERN_GUARDS['five_data_missing_date'] + five_data_missing_date.pattern)
+three_data_re = re.compile(PATTERN_GUARDS['three_data_re'] + three_data_re.pattern)
+salary_with_amount_flexible = re.compile(PATTERN_GUARDS['salary_with_amount_flexible']
+                                         + salary_with_amount_flexible.pattern)
+continuation_with_amount_re = re.compile(PATTERN_GUARDS['continuation_with_amount_re']
+                                         + continuation_with_amount_re.pattern)
+
+# Every pattern parse_page() uses, by name. Parsing functions take a mapping like
+# this as an argument rather than reading the module's patterns, so timed or
+# alternative patterns (see instrument_patterns()) are passed in, never swapped in.
+PARSER_PATTERNS = {
+    'header_end': header_end,
+    'top_matter_end_re': top_matter_end_re,
+    'blank_line_re': blank_line_re,
+    'page_number_re': page_number_re,
+    'page_number_alt_re': page_number_alt_re,
+    'page_number_old_re': page_number_old_re,
+    'SUBTOTAL_PATTERNS': SUBTOTAL_PATTERNS,
+    'five_data_re': five_data_re,
+    'five_data_missing_date': five_data_missing_date,
+    'three_data_re': three_data_re,
+    'expense_record_flexible': expense_record_flexible,
+    'expense_record_partial': expense_record_partial,
+    'expense_with_leading_date': expense_with_leading_date,
+    'salary_with_complex_name': salary_with_complex_name,
+    'salary_with_amount_flexible': salary_with_amount_flexible,
+    'salary_no_amount_flexible': salary_no_amount_flexible,
+    'amount_only_line': amount_only_line,
+    'continuation_with_amount_re': continuation_with_amount_re,
+}
+
+# Regex time (in seconds) spent on one line above which instrument_patterns() flags it
+LINE_TIME_BUDGET = 0.005
+
+# Version of the parsing rules, which keys the parse cache (see parser_version()).
+# Bump it with any change to the page parser or its patterns that changes what
+# parse_page() returns.
+PARSER_VERSION = 2
+
+# Version of the page range detection, which keys the pipeline's detect stage.
+# Bump it with any change to detect_page_range() or the constants and patterns
+# it uses that can change the range it finds.
+DETECT_VERSION = 1
+
+# Version of the cleaning rules, which keys the pipeline's clean stage. Bump it
+# with any change to clean_rows() (parse_office() and the cleaning patterns
+# included) that changes the cleaned CSV.
+CLEAN_VERSION = 1
+
 # Cleaning patterns
 FUNDING_YEAR_RE = re.compile(r'(Funding Year) (\d+)')
 FISCAL_YEAR_RE = re.compile(r'(FY) (\d+)')
 CONGRESS_NUMBER = re.compile(r'\((\d+)TH\)')
 
+# Number of pages extracted per pdftotext process
+EXTRACT_BATCH_SIZE = 250
+
+# Pages queued per parser process with --parse-jobs; bounds how many pages are held in memory
+PARSE_PAGES_PER_JOB = 8
+
+# Number of pages sampled across a PDF when detecting the itemization page range,
+# and how many pages past each end are checked for more itemizations
+DETECT_SAMPLES = 64
+DETECT_WINDOW = 10
 
-def is_subtotal(line):
+# Number of slowest pages listed in a --profile report
+PROFILE_TOP_PAGES = 10
+
+
+def is_subtotal(line, subtotal_patterns=SUBTOTAL_PATTERNS):
     """Check if a line is a subtotal line."""
-    return any(pattern.match(line) for pattern in SUBTOTAL_PATTERNS)
+    return any(pattern.match(line) for pattern in subtotal_patterns)
+
+
+def _is_date_token(token):
+    """Check if a token is exactly a MM/DD/YYYY date."""
+    return (len(token) == 10 and token[2] == '/' and token[5] == '/'
+            and (token[:2] + token[3:5] + token[6:]).isdecimal())
+
+
+def _is_document_number_token(token, min_length, max_length):
+    """Check if a token is min_length to max_length characters of [A-Z0-9]."""
+    return (min_length <= len(token) <= max_length and token.isascii()
+            and token.isalnum() and token.upper() == token)
+
+
+def classify_line(line):
+    """
+    Work out which of the patterns in process_data_lines() could match a line.
+
+    Cheap string checks on the line's shape (indentation, the first two tokens,
+    slash count, wide column gaps) rule out patterns that cannot possibly
+    match, so most lines are only tried against one or two regexes. Every
+    check is a necessary condition of the pattern it gates, so skipping a
+    pattern never changes the parse result.
+
+    Returns:
+        frozenset of names from LINE_PATTERN_NAMES
+    """
+    tokens = line.split(None, 2)
+    if not tokens:
+        return frozenset()
+
+    first = tokens[0]
+    second = tokens[1] if len(tokens) > 1 else ''
+    indented = line[0].isspace()
+    lead = first[0]
+
+    # Column gaps are runs of \s; when the line only contains plain spaces (and
+    # its newline) a substring test finds them, otherwise assume a gap exists
+    probe = line.replace('\n', ' ')
+    wide_gap = not probe.isprintable() or ' ' * 10 in probe
+
+    candidates = []
+    if indented and '-' in line:
+        candidates.append('page_number')
+    if indented and first in SUBTOTAL_FIRST_WORDS:
+        candidates.append('subtotal')
+    if first.replace('_', 'a').isalnum() and _is_date_token(second):
+        if line.count('/') >= 6:
+            candidates.append('five_data')
+        if wide_gap:
+            candidates.append('five_data_missing_date')
+    if indented and wide_gap and (lead.isalnum() or lead == '_'):
+        candidates.append('three_data')
+    if _is_document_number_token(first, 4, 12):
+        candidates.append('expense_record_partial')
+        if _is_document_number_token(first, 8, 12) and _is_date_token(second):
+            candidates.append('expense_record_flexible')
+    if indented:
+        if 'A' <= lead <= 'Z':
+            candidates.extend(('salary_with_amount_flexible', 'salary_no_amount_flexible', 'salary_with_complex_name'))
+        elif _is_date_token(first):
+            candidates.append('expense_with_leading_date')
+        elif lead in '$,.' or lead.isdecimal():
+            candidates.append('amount_only_line')
+
+    return frozenset(candidates)
+
+
+class TimedPattern:
+    """
+    Wrap a compiled regex and record its attempts, matches and match time.
+
+    Used by instrument_patterns(); each wrapper adds to the shared stats
+    dictionary under its pattern name, and adds up the time spent on each line
+    so lines over the budget can be flagged.
+    """
+
+    def __init__(self, name, pattern, stats):
+        self.name = name
+        self.pattern = pattern
+        self.stats = stats
+
+    def match(self, string, *args):
+        start_time = time.perf_counter()
+        result = self.pattern.match(string, *args)
+        self._record(string, time.perf_counter() - start_time, result)
+        return result
+
+    def search(self, string, *args):
+        start_time = time.perf_counter()
+        result = self.pattern.search(string, *args)
+        self._record(string, time.perf_counter() - start_time, result)
+        return result
+
+    def _record(self, string, elapsed, result):
+        pattern_stats = self.stats['patterns'].setdefault(
+            self.name, {'attempts': 0, 'matches': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+        pattern_stats['attempts'] += 1
+        pattern_stats['matches'] += result is not None
+        pattern_stats['seconds'] += elapsed
+        pattern_stats['max_seconds'] = max(pattern_stats['max_seconds'], elapsed)
+
+        # Every pattern is tried on the same line object, so a new object means a new line
+        current = self.stats['current_line']
+        if current['line'] is not string:
+            _flag_slow_line(self.stats)
+            current['line'] = string
+            current['seconds'] = 0.0
+            current['patterns'] = {}
+        current['seconds'] += elapsed
+        current['patterns'][self.name] = current['patterns'].get(self.name, 0.0) + elapsed
+
+
+def _flag_slow_line(stats):
+    """Add the line being timed to stats['slow_lines'] if it went over the line budget."""
+    current = stats['current_line']
+    if current['line'] is not None and current['seconds'] > stats['line_budget']:
+        stats['slow_lines'].append({
+            'line': current['line'],
+            'seconds': current['seconds'],
+            'patterns': current['patterns'],
+        })
+
+
+@contextlib.contextmanager
+def instrument_patterns(patterns=PARSER_PATTERNS, line_budget=LINE_TIME_BUDGET, stats=None):
+    """
+    Time parser regexes: yields (timed_patterns, stats).
+
+    timed_patterns is a copy of patterns with every regex (and each of the
+    SUBTOTAL_PATTERNS) wrapped in a TimedPattern, to pass to parse_page().
+    The module's own patterns are left alone, so other parsing, in this or
+    any other thread, is neither timed nor affected. The wrappers fill in
+    stats:
+
+        patterns:   {name: {attempts, matches, seconds, max_seconds}}
+        slow_lines: [{line, seconds, patterns}] for lines whose regex time
+                    went over line_budget seconds
+
+    The per-line timing lives in stats, so a stats dictionary must not be
+    shared by threads parsing at the same time.
+
+    Args:
+        patterns: Mapping of pattern name to compiled regex, like PARSER_PATTERNS
+        line_budget: Regex time per line (in seconds) above which a line is flagged
+        stats: Existing stats dictionary to add to (default: a new one)
+    """
+    if stats is None:
+        stats = {'patterns': {}, 'slow_lines': []}
+    stats['line_budget'] = line_budget
+    stats['current_line'] = {'line': None, 'seconds': 0.0, 'patterns': {}}
+
+    timed_patterns = {
+        name: ([TimedPattern('subtotal', subtotal, stats) for subtotal in pattern]
+               if name == 'SUBTOTAL_PATTERNS' else TimedPattern(name, pattern, stats))
+        for name, pattern in patterns.items()
+    }
+    try:
+        yield timed_patterns, stats
+    finally:
+        _flag_slow_line(stats)
+        del stats['current_line']
+
+
+def run_pdftotext(pdf_file, first_page, last_page):
+    """
+    Run pdftotext once over a page range and split its output into pages.
+
+    pdftotext terminates every page with a form feed, so the combined output
+    can be split on form-feed boundaries. Each returned page keeps its trailing
+    form feed, making it byte-identical to a single-page pdftotext run.
+
+    Returns:
+        List of (page_number, page_bytes) tuples in ascending page order
+    """
+    layout_cmd = ["pdftotext", "-f", str(first_page), "-l", str(last_page),
+                  "-layout", pdf_file, "-"]
+    result = subprocess.run(layout_cmd, capture_output=True, check=True)
+    if result.stderr:
+        print(f"Warning on pages {first_page}-{last_page}: {result.stderr.decode('utf-8', 'replace')}")
+
+    # The text after the final form feed is empty, so drop it
+    page_texts = result.stdout.split(b'\f')[:-1]
+    return [(first_page + offset, page_text + b'\f') for offset, page_text in enumerate(page_texts)]
+
+
+def page_batches(start_page, end_page, batch_size=EXTRACT_BATCH_SIZE, jobs=1):
+    """
+    Split a page range into (first_page, last_page) batches for pdftotext.
+
+    A batch_size of 0 or None means the whole range. Batches are shrunk if
+    needed so that there are at least as many batches as jobs.
+    """
+    total_pages = end_page - start_page + 1
+    if not batch_size:
+        batch_size = total_pages
+    # Make sure there are enough batches to keep every worker busy
+    batch_size = max(1, min(batch_size, -(-total_pages // jobs)))
+
+    return [(first_page, min(first_page + batch_size - 1, end_page))
+            for first_page in range(start_page, end_page + 1, batch_size)]
+
+
+def run_pdftotext_batch(pdf_file, first_page, last_page):
+    """
+    Run pdftotext over one batch of pages, retrying page by page on failure.
+
+    If pdftotext fails on the batch, it is retried one page at a time so a
+    single bad page doesn't lose the whole batch. Only the pages that still
+    fail are then reported; a batch whose pages all extract on retry has no
+    errors.
+
+    Returns:
+        Tuple of (list of (page_number, page_bytes) extracted, list of error
+        messages (empty if every page was extracted))
+    """
+    errors = []
+    try:
+        pages = run_pdftotext(pdf_file, first_page, last_page)
+    except (subprocess.CalledProcessError, OSError) as e:
+        pages = []
+        if first_page == last_page or isinstance(e, OSError):
+            stderr = getattr(e, 'stderr', None)
+            errors.append(f"pages {first_page}-{last_page}: {e}" +
+                          (f"\n{stderr.decode('utf-8', 'replace')}" if stderr else ''))
+        else:
+            for page_number in range(first_page, last_page + 1):
+                try:
+                    pages.extend(run_pdftotext(pdf_file, page_number, page_number))
+                except (subprocess.CalledProcessError, OSError) as page_error:
+                    errors.append(f"page {page_number}: {page_error}")
+
+    return pages, errors
+
+
+def extract_page_batch(pdf_file, first_page, last_page, output_dir="pages"):
+    """
+    Extract one batch of pages to pages/layout_N.txt files (see run_pdftotext_batch()).
+
+    Returns:
+        List of error messages (empty if every page was extracted)
+    """
+    pages, errors = run_pdftotext_batch(pdf_file, first_page, last_page)
+    for page_number, page_text in pages:
+        output_filename = os.path.join(output_dir, f"layout_{page_number}.txt")
+        with open(output_filename, 'wb') as fh:
+            fh.write(page_text)
+
+    return errors
 
 
-def extract_pages(pdf_file, start_page, end_page, output_dir="pages"):
-    """Extract individual pages from PDF using pdftotext with layout preservation."""
+class ExtractionError(RuntimeError):
+    """A batch of pages could not be extracted from the PDF."""
+
+
+def extract_pages(pdf_file, start_page, end_page, output_dir="pages", batch_size=EXTRACT_BATCH_SIZE, jobs=1):
+    """
+    Extract individual pages from PDF using pdftotext with layout preservation.
+
+    Rather than launching pdftotext (and re-opening the PDF) once per page, pages
+    are extracted in batches of batch_size pages per pdftotext process and split
+    on form-feed boundaries into pages/layout_N.txt files. A batch_size of 0 or
+    None extracts the whole range in a single process.
+
+    With jobs > 1, batches are extracted concurrently by that many pdftotext
+    workers. The range is split so every worker gets at least one batch, and
+    output file names depend only on page numbers, so the result is the same
+    as a sequential run.
+
+    Returns:
+        Dictionary mapping (first_page, last_page) of each failed batch to its error messages
+    """
     print(f"\n=== Extracting pages {start_page} to {end_page} from {pdf_file} ===")
 
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
 
-    for page_number in range(start_page, end_page + 1):
-        output_filename = os.path.join(output_dir, f"layout_{page_number}.txt")
-        layout_cmd = ["pdftotext", "-f", str(page_number), "-l", str(page_number),
-                      "-layout", pdf_file, output_filename]
+    jobs = max(1, jobs or 1)
+    batches = page_batches(start_page, end_page, batch_size, jobs)
+    if jobs > 1:
+        print(f"Using {jobs} workers for {len(batches)} page batches")
+
+    failed_batches = {}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(extract_page_batch, pdf_file, first_page, last_page, output_dir): (first_page, last_page)
+            for first_page, last_page in batches
+        }
+        for future in as_completed(futures):
+            first_page, last_page = futures[future]
+            errors = future.result()
+            if errors:
+                failed_batches[(first_page, last_page)] = errors
+                print(f"Error extracting pages {first_page}-{last_page}:")
+                for error in errors:
+                    print(f"  {error}")
+            else:
+                print(f"Extracted pages {first_page}-{last_page}")
 
-        # Show progress every 100 pages or at start
-        if page_number % 100 == 0 or page_number == start_page:
-            print(f"Extracting pages {page_number}-{min(page_number + 99, end_page)}...")
+    if failed_batches:
+        print(f"Extraction finished with errors in {len(failed_batches)} of {len(batches)} batches:")
+        for first_page, last_page in sorted(failed_batches):
+            print(f"  pages {first_page}-{last_page}")
+    print(f"Extraction complete! Pages saved to {output_dir}/")
 
-        try:
-            result = subprocess.run(layout_cmd, capture_output=True, text=True, check=True)
-            if result.stderr:
-                print(f"Warning on page {page_number}: {result.stderr}")
-        except subprocess.CalledProcessError as e:
-            print(f"Error extracting page {page_number}: {e}")
-            if e.stderr:
-                print(e.stderr)
+    return failed_batches
 
-    print(f"Extraction complete! Pages saved to {output_dir}/")
 
+def decode_page(page_bytes):
+    """
+    Decode raw pdftotext output for one page into a list of lines.
+
+    Tries UTF-8 first and falls back to latin-1 for pages with special
+    characters. Lines are split exactly as readlines() on a text-mode file
+    would split them.
+    """
+    try:
+        page_text = page_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        page_text = page_bytes.decode('latin-1')
+    return io.StringIO(page_text, newline=None).readlines()
+
+
+def iter_page_files(start_page, end_page, pages_dir="pages"):
+    """Yield (page_number, lines) for each extracted layout_N.txt file in numeric page order."""
+    page_file_unfilled = os.path.join(pages_dir, "layout_%s.txt")
+    for page in range(start_page, end_page + 1):
+        with open(page_file_unfilled % (page), 'rb') as fh:
+            yield page, decode_page(fh.read())
 
-def process_top_matter(page_num, top_matter):
+
+def iter_pdf_pages(pdf_file, start_page, end_page, batch_size=EXTRACT_BATCH_SIZE, jobs=1, pages_dir=None):
+    """
+    Yield (page_number, lines) straight from pdftotext without writing page files.
+
+    Batches are extracted as in extract_pages() (concurrently when jobs > 1) but
+    yielded in numeric page order, so the text flows directly into the parser.
+    Only 2 * jobs batches are extracted ahead of the one being yielded, so the
+    whole document is never held in memory.
+    If pages_dir is given, each page is also written there as layout_N.txt for
+    debugging.
+
+    A batch that fails is retried page by page, as in extract_pages(), so
+    both modes finish (or fail) on the same input.
+
+    Raises:
+        ExtractionError: If pages of a batch still fail after the retry, so the
+        parse never silently misses them
+    """
+    print(f"\n=== Streaming pages {start_page} to {end_page} from {pdf_file} ===")
+
+    if pages_dir:
+        os.makedirs(pages_dir, exist_ok=True)
+
+    jobs = max(1, jobs or 1)
+    batches = page_batches(start_page, end_page, batch_size, jobs)
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = collections.deque()
+        remaining = iter(batches)
+        for first_page, last_page in remaining:
+            pending.append((first_page, last_page, executor.submit(run_pdftotext_batch, pdf_file, first_page, last_page)))
+            if len(pending) >= 2 * jobs:
+                break
+
+        while pending:
+            first_page, last_page, future = pending.popleft()
+            next_batch = next(remaining, None)
+            if next_batch:
+                pending.append((*next_batch, executor.submit(run_pdftotext_batch, pdf_file, *next_batch)))
+
+            pages, errors = future.result()
+            if errors:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise ExtractionError(f"Error extracting pages {first_page}-{last_page}: " + '; '.join(errors))
+
+            for page_number, page_text in pages:
+                if pages_dir:
+                    with open(os.path.join(pages_dir, f"layout_{page_number}.txt"), 'wb') as fh:
+                        fh.write(page_text)
+                yield page_number, decode_page(page_text)
+
+
+def pdf_page_count(pdf_file):
+    """Get the number of pages in a PDF from pdfinfo."""
+    result = subprocess.run(["pdfinfo", pdf_file], capture_output=True, check=True)
+    match = re.search(rb"^Pages:\s+(\d+)", result.stdout, re.MULTILINE)
+    if not match:
+        raise ValueError(f"pdfinfo did not report a page count for {pdf_file}")
+    return int(match.group(1))
+
+
+def is_itemization_page(pdf_file, page):
+    """Extract a single page and check it for the itemization column header or top matter marker."""
+    pages = run_pdftotext(pdf_file, page, page)
+    # A blank or unreadable page can come back with no form feed at all
+    if not pages:
+        return False
+    page_lines = decode_page(pages[0][1])
+    return any(header_end.search(line) or top_matter_end_re.match(line) for line in page_lines)
+
+
+def detect_page_range(pdf_file, samples=DETECT_SAMPLES, window=DETECT_WINDOW, jobs=1):
+    """
+    Find the first and last itemization pages of a report PDF.
+
+    Instead of extracting the whole PDF, pages are checked one at a time with
+    single-page pdftotext runs. First `samples` pages spread evenly over the
+    document are checked (concurrently when jobs > 1). The itemizations are
+    taken to run from the first sampled page with a header to the last one,
+    so headerless pages in between (blank or divider pages) don't matter. Each
+    end is then narrowed to the exact page by binary search between that
+    sample and its neighbouring sample. Since the search can stop at a
+    headerless page just inside the itemizations, the `window` pages beyond
+    each end are also checked, and the end is moved out while they have headers.
+    Once they have none, every `window`-th page out to two samples away is
+    checked too, so a longer headerless gap next to an end (which the samples
+    can skip over) is crossed, with a warning, rather than silently ending the
+    range early.
+
+    Returns:
+        (start_page, end_page), or None if no sampled page has an itemization header
+    """
+    page_count = pdf_page_count(pdf_file)
+    checked = {}
+
+    def check(pages):
+        pages = [page for page in pages if page not in checked]
+        with ThreadPoolExecutor(max_workers=max(1, jobs or 1)) as executor:
+            for page, found in zip(pages, executor.map(lambda page: is_itemization_page(pdf_file, page), pages)):
+                checked[page] = found
+
+    def widen(end, direction, limit):
+        """Move an end page outwards (direction -1 or 1) while there are header pages beyond it, up to limit."""
+        while True:
+            near = [end + direction * offset for offset in range(1, window + 1)]
+            near = [page for page in near if 1 <= page <= page_count]
+            check(near)
+            found = [page for page in near if checked[page]]
+            if found:
+                end = found[-1]
+                continue
+
+            far = [end + direction * offset for offset in range(2 * window, abs(limit - end) + 1, window)]
+            check(far)
+            found = [page for page in far if checked[page]]
+            if not found:
+                return end
+            print(f"Warning: the {window} pages beyond page {end} have no itemization header, but page "
+                  f"{found[0]} has one; extending the range to it (check the detected range)")
+            end = found[0]
+
+    stride = max(1, -(-page_count // samples))
+    sample_pages = list(range(1, page_count + 1, stride))
+    if sample_pages[-1] != page_count:
+        sample_pages.append(page_count)
+    check(sample_pages)
+
+    hits = [index for index, page in enumerate(sample_pages) if checked[page]]
+    if not hits:
+        return None
+
+    # First page: between the last sample without a header and the first with one
+    low = sample_pages[hits[0] - 1] if hits[0] > 0 else 0
+    high = sample_pages[hits[0]]
+    while high - low > 1:
+        middle = (low + high) // 2
+        check([middle])
+        if checked[middle]:
+            high = middle
+        else:
+            low = middle
+    start_page = widen(high, -1, sample_pages[max(hits[0] - 2, 0)])
+
+    # Last page: between the last sample with a header and the next one without
+    low = sample_pages[hits[-1]]
+    high = sample_pages[hits[-1] + 1] if hits[-1] + 1 < len(sample_pages) else page_count + 1
+    while high - low > 1:
+        middle = (low + high) // 2
+        check([middle])
+        if checked[middle]:
+            low = middle
+        else:
+            high = middle
+    end_page = widen(low, 1, sample_pages[min(hits[-1] + 2, len(sample_pages) - 1)])
+
+    print(f"Detected itemization pages {start_page}-{end_page} "
+          f"(checked {len(checked)} of {page_count} pages)")
+    return start_page, end_page
+
+
+def process_top_matter(page_num, top_matter, patterns=PARSER_PATTERNS):
     """Extract office/expense description from the top matter of a page."""
+    top_matter_end_re = patterns['top_matter_end_re']
+    blank_line_re = patterns['blank_line_re']
+
     # Increased from 48 to 80 to capture longer office names
     top_matter_top_left_column_delimiter = 80
 
@@ -204,44 +791,261 @@ def process_top_matter(page_num, top_matter):
     return expense_description
 
 
-def test_carryover_line(line_offset, line):
+def test_carryover_line(line_offset, line, blank_re=blank_line_re):
     """Check if a line is a continuation of a previous line."""
     line_start = line[:line_offset]
-    if blank_line_re.match(line_start):
+    if blank_re.match(line_start):
         line_end = line[line_offset:]
-        if not blank_line_re.match(line_end):
+        if not blank_re.match(line_end):
             return True
     return False
 
 
-def process_data_lines(page_num, data_lines):
-    """Process data lines from a page and extract expense records."""
+def find_column_layout(header_line):
+    """
+    Derive fixed-width column positions from a page's START/END header line.
+
+    The obligation/service START and END dates of every expense record are
+    printed under the START label, so its offset anchors the date columns.
+    Everything to the left of it is document number, date posted and payee;
+    everything to the right of the dates is description and amount.
+
+    Returns:
+        Dictionary with the 'start' column offset, or None if the header has no START label
+    """
+    start_col = header_line.find('START')
+    if start_col < 0:
+        return None
+    return {'start': start_col}
+
+
+def _is_page_reference(token):
+    """Check if a token is a page reference such as B-42, C-3 or B-2-163."""
+    return (len(token) > 2 and token[0].isalpha() and token[1] == '-'
+            and token[2:].replace('-', '').isdigit() and not token.endswith('-'))
+
+
+def _split_amount(text):
+    """
+    Split a trailing amount (and optional page reference such as B-42) off the end of text.
+
+    The amount has to stand in its own column, at least two spaces from the
+    text before it, so a number ending a description ("TO SEP. 30") stays put.
+    """
+    text = text.rstrip()
+    head, _, token = text.rpartition(' ')
+    if _is_page_reference(token):
+        text = head.rstrip()
+        head, _, token = text.rpartition(' ')
+
+    # Credits are printed with a leading minus sign: -$5,000.00
+    amount = token.replace('$', '', 1) if token[1:2] == '$' else token.lstrip('$')
+    if (amount and amount.lstrip('-').strip('0123456789,.') == '' and any(c.isdigit() for c in amount)
+            and (head.endswith(' ') or not head.strip())):
+        return head.strip(), amount
+    return text.strip(), ''
+
+
+def parse_fixed_width_line(line, layout):
+    """
+    Split an expense or salary line into fields by column offset instead of by regex.
+
+    Only lines that fit the layout are handled. They start in the payee
+    columns, left of the dates: either with a document number in the first
+    column, or indented with a payee (or employee name) and no document
+    number. The START date column (within COLUMN_TOLERANCE characters of the
+    header's START label) holds either a start/end date pair or nothing. An
+    indented line whose text runs into the date columns without a date, as
+    salary positions often do, is split at the first gap after the name
+    instead. Anything else, including lines starting with a date, returns None
+    so the caller can fall back to the regex cascade.
+
+    Returns:
+        (fields, description_column) where fields are document number, date
+        posted, payee, start date, end date, description and amount, or None
+    """
+    start_col = layout['start']
+    indent = len(line) - len(line.lstrip())
+    if len(line) <= start_col or indent >= start_col - COLUMN_TOLERANCE:
+        return None
+
+    # Locate the start date near the START column, or confirm the date columns are empty
+    date_col = None
+    for col in range(max(start_col - COLUMN_TOLERANCE, 1), start_col + COLUMN_TOLERANCE + 1):
+        if line[col - 1] == ' ' and _is_date_token(line[col:col + 10]) and line[col + 10:col + 11] in (' ', '\n', ''):
+            date_col = col
+            break
+    if date_col is not None:
+        payee_end = date_col
+    elif line[start_col - COLUMN_TOLERANCE:start_col + 10].isspace():
+        payee_end = start_col - COLUMN_TOLERANCE
+    elif indent:
+        # A salary position starting in the date columns: the name ends at the first gap
+        payee_end = line.find('  ', indent)
+        if payee_end < 0 or payee_end > start_col:
+            return None
+    else:
+        return None
+
+    # Left of the dates: document number, optional date posted, payee
+    left = line[:payee_end]
+    doc_num = ''
+    if not indent:
+        doc_num = left.split(None, 1)[0]
+        if not _is_document_number_token(doc_num, 4, 12):
+            return None
+    remainder = left[len(doc_num):].lstrip()
+    date_posted = ''
+    if _is_date_token(remainder[:10]) and remainder[10:11] in (' ', ''):
+        if indent:
+            return None
+        date_posted = remainder[:10]
+        remainder = remainder[10:]
+    payee = remainder.strip()
+
+    # Right of the START column: end date, description, amount
+    start_date = end_date = ''
+    if date_col is not None:
+        start_date = line[date_col:date_col + 10]
+        rest = line[date_col + 10:].lstrip()
+        if not (_is_date_token(rest[:10]) and rest[10:11] in (' ', '\n', '')):
+            return None
+        end_date = rest[:10]
+        rest = rest[10:]
+    else:
+        rest = line[payee_end:]
+        if _is_date_token(rest.lstrip()[:10]):
+            return None
+
+    description, amount = _split_amount(rest)
+    if indent and any(word in description.upper() for word in SALARY_EXCLUDED_WORDS):
+        return None
+    description_col = len(line) - len(rest.lstrip()) if description else None
+
+    return [doc_num, date_posted, payee, start_date, end_date, description, amount], description_col
+
+
+def parse_fixed_width_continuation(line, layout):
+    """
+    Split a description continuation line by column offset.
+
+    These lines carry on the description (and sometimes the amount) of the
+    record above: their text starts in or right of the date columns, and not
+    with a date. Lines without any description text (amount-only lines) and
+    payroll total lines are left to the regex cascade.
+
+    So are lines ending in a page number (B-983). pdftotext puts the page
+    footer on whatever line sits beside it, and on payroll pages that is as
+    often a running total ("$2,041,538.11  B-983") as a salary, so the
+    columns alone can't tell which record, if any, the amount belongs to.
+
+    For description lines that wrap, the attribution here is the right one:
+    the amount printed on the wrapped line ("WASHINGTON DC TO BENTONVILLE,
+    ... $12.61" under a "STAFF TRANSPORTATION" record) belongs to the record
+    above. The regex cascade reads such a line as a salary line with the
+    description as payee.
+
+    Returns:
+        (description, amount), or None if the line isn't a continuation
+    """
+    start_col = layout['start']
+    indent = len(line) - len(line.lstrip())
+    if indent < start_col - COLUMN_TOLERANCE or _is_date_token(line[indent:indent + 10]):
+        return None
+    if _is_page_reference(line.rstrip().rpartition(' ')[2]):
+        return None
+    description, amount = _split_amount(line)
+    if not description or any(word in description.upper() for word in SALARY_EXCLUDED_WORDS):
+        return None
+    return description, amount
+
+
+def process_data_lines(page_num, data_lines, column_layout=None, patterns=PARSER_PATTERNS):
+    """
+    Process data lines from a page and extract expense records.
+
+    If column_layout is given (see find_column_layout()), expense and salary
+    lines that fit the page's columns are split by offset with
+    parse_fixed_width_line(), description continuations are attached to the
+    record above with parse_fixed_width_continuation(), and only the remaining
+    lines go through the regex cascade. The regexes are taken from patterns
+    (see PARSER_PATTERNS).
+    """
+    blank_line_re = patterns['blank_line_re']
+    page_number_re = patterns['page_number_re']
+    page_number_alt_re = patterns['page_number_alt_re']
+    page_number_old_re = patterns['page_number_old_re']
+    subtotal_patterns = patterns['SUBTOTAL_PATTERNS']
+    five_data_re = patterns['five_data_re']
+    five_data_missing_date = patterns['five_data_missing_date']
+    three_data_re = patterns['three_data_re']
+    expense_record_flexible = patterns['expense_record_flexible']
+    expense_record_partial = patterns['expense_record_partial']
+    expense_with_leading_date = patterns['expense_with_leading_date']
+    salary_with_complex_name = patterns['salary_with_complex_name']
+    salary_with_amount_flexible = patterns['salary_with_amount_flexible']
+    salary_no_amount_flexible = patterns['salary_no_amount_flexible']
+    amount_only_line = patterns['amount_only_line']
+    continuation_with_amount_re = patterns['continuation_with_amount_re']
+
     missing_data = []
     return_data = []
     return_data_index = 0
     one_part_continuation_register = []
     last_line_data_index = None
+    # return_data_index at the last subtotal: lines under it don't continue the record above it
+    subtotal_index = 0
 
     for data_line in data_lines:
         if blank_line_re.match(data_line):
             continue
 
-        if page_number_re.match(data_line) or page_number_old_re.match(data_line):
+        candidates = classify_line(data_line) if USE_LINE_CLASSIFIER else LINE_PATTERN_NAMES
+
+        if 'page_number' in candidates and (page_number_re.match(data_line) or page_number_old_re.match(data_line)):
             continue
 
-        if is_subtotal(data_line):
+        if 'subtotal' in candidates and is_subtotal(data_line, subtotal_patterns):
             last_line_data_index = None
+            subtotal_index = return_data_index
             continue
 
+        if column_layout:
+            fixed_width = parse_fixed_width_line(data_line, column_layout)
+            if fixed_width:
+                fields, description_col = fixed_width
+                # Lines without a document number or dates are salary lines, as with the regexes
+                line_type = 'five data line' if fields[0] or fields[3] else 'three data line'
+                return_data.append([line_type, False, page_num] + fields)
+                return_data_index += 1
+                # Like five_data_re, a complete record lets following description-only lines continue it
+                last_line_data_index = str(description_col) if all(fields) else None
+                continue
+
+            continuation = (return_data_index > subtotal_index
+                            and parse_fixed_width_continuation(data_line, column_layout))
+            if continuation:
+                description, amount = continuation
+                previous_result = return_data[return_data_index - 1]
+                if amount and previous_result[9]:
+                    # A second amount under the same record, as continuation_with_amount_re handles
+                    return_data.append(['continuation_data', True] + previous_result[2:8] + [description, amount])
+                    return_data_index += 1
+                else:
+                    if amount:
+                        previous_result[9] = amount
+                    one_part_continuation_register.append({'array_index': return_data_index, 'data': description})
+                continue
+
         # Try original strict patterns first (for backward compatibility)
-        found_data = five_data_re.match(data_line)
+        found_data = 'five_data' in candidates and five_data_re.match(data_line)
         if found_data:
             return_data.append(['five data line', False, page_num] + list(found_data.groups()))
             return_data_index += 1
             last_line_data_index = str(found_data.start(6))
         else:
-            found_data2 = three_data_re.match(data_line)
-            found_data_missing_date = five_data_missing_date.match(data_line)
+            found_data2 = 'three_data' in candidates and three_data_re.match(data_line)
+            found_data_missing_date = 'five_data_missing_date' in candidates and five_data_missing_date.match(data_line)
 
             if found_data2:
                 results = list(found_data2.groups())
@@ -260,7 +1064,7 @@ def process_data_lines(page_num, data_lines):
 
             else:
                 # Try flexible patterns for newer format documents
-                expense_flex = expense_record_flexible.match(data_line)
+                expense_flex = 'expense_record_flexible' in candidates and expense_record_flexible.match(data_line)
                 if expense_flex:
                     doc_num, date_posted, payee, start_date, end_date, description, amount = expense_flex.groups()
                     result_formatted = ['five data line', False, page_num,
@@ -273,24 +1077,22 @@ def process_data_lines(page_num, data_lines):
                     continue
 
                 # Try flexible salary patterns
-                salary_flex_amount = salary_with_amount_flexible.match(data_line)
+                salary_flex_amount = 'salary_with_amount_flexible' in candidates and salary_with_amount_flexible.match(data_line)
                 if salary_flex_amount:
                     name, position, amount = salary_flex_amount.groups()
                     # Filter out non-salary lines
-                    if not any(word in position.upper() for word in
-                              ['NET PAYROLL', 'ORGANIZATION', 'UNEXPENDED', 'TOTAL', 'AUTHORIZATION']):
+                    if not any(word in position.upper() for word in SALARY_EXCLUDED_WORDS):
                         result_formatted = ['three data line', False, page_num, '', '', name, '', '', position, amount]
                         return_data.append(result_formatted)
                         return_data_index += 1
                         last_line_data_index = None
                         continue
 
-                salary_flex_no_amount = salary_no_amount_flexible.match(data_line)
+                salary_flex_no_amount = 'salary_no_amount_flexible' in candidates and salary_no_amount_flexible.match(data_line)
                 if salary_flex_no_amount:
                     name, position = salary_flex_no_amount.groups()
                     # Filter out non-salary lines
-                    if not any(word in position.upper() for word in
-                              ['NET PAYROLL', 'ORGANIZATION', 'UNEXPENDED', 'TOTAL', 'AUTHORIZATION']):
+                    if not any(word in position.upper() for word in SALARY_EXCLUDED_WORDS):
                         result_formatted = ['three data line', False, page_num, '', '', name, '', '', position, '']
                         return_data.append(result_formatted)
                         return_data_index += 1
@@ -298,7 +1100,7 @@ def process_data_lines(page_num, data_lines):
                         continue
 
                 # NEW: Try partial expense record pattern
-                expense_partial = expense_record_partial.match(data_line)
+                expense_partial = 'expense_record_partial' in candidates and expense_record_partial.match(data_line)
                 if expense_partial:
                     doc_num, date_posted, payee, start_date, end_date, description, amount = expense_partial.groups()
                     result_formatted = ['five data line', False, page_num,
@@ -311,7 +1113,7 @@ def process_data_lines(page_num, data_lines):
                     continue
 
                 # NEW: Try date-first expense record (continuation lines)
-                expense_date_first = expense_with_leading_date.match(data_line)
+                expense_date_first = 'expense_with_leading_date' in candidates and expense_with_leading_date.match(data_line)
                 if expense_date_first:
                     date1, payee, date2, date3, description, amount = expense_date_first.groups()
                     # This is likely a continuation, try to attach to previous record
@@ -338,13 +1140,12 @@ def process_data_lines(page_num, data_lines):
                         continue
 
                 # NEW: Try complex name salary record
-                salary_complex = salary_with_complex_name.match(data_line)
+                salary_complex = 'salary_with_complex_name' in candidates and salary_with_complex_name.match(data_line)
                 if salary_complex:
                     name, position, amount = salary_complex.groups()
                     # Validate it's a person name (at least 2 parts)
                     name_parts = name.strip().split()
-                    if len(name_parts) >= 2 and not any(word in position.upper() for word in
-                              ['NET PAYROLL', 'ORGANIZATION', 'UNEXPENDED', 'TOTAL', 'AUTHORIZATION']):
+                    if len(name_parts) >= 2 and not any(word in position.upper() for word in SALARY_EXCLUDED_WORDS):
                         result_formatted = ['three data line', False, page_num, '', '', name, '', '', position, amount or '']
                         return_data.append(result_formatted)
                         return_data_index += 1
@@ -352,7 +1153,7 @@ def process_data_lines(page_num, data_lines):
                         continue
 
                 # NEW: Try amount-only line (attach to previous record)
-                amount_match = amount_only_line.match(data_line)
+                amount_match = 'amount_only_line' in candidates and amount_only_line.match(data_line)
                 if amount_match and return_data_index > 0:
                     amount = amount_match.group(1)
                     prev_record = return_data[return_data_index - 1]
@@ -362,15 +1163,14 @@ def process_data_lines(page_num, data_lines):
                         continue
 
                 # Check if it's a page number
-                is_page_num = page_number_re.match(data_line)
-                is_page_num_alt = page_number_alt_re.match(data_line)
-                is_page_num_old = page_number_old_re.match(data_line)
-                if is_page_num or is_page_num_alt or is_page_num_old:
+                if 'page_number' in candidates and (page_number_re.match(data_line) or
+                                                    page_number_alt_re.match(data_line) or
+                                                    page_number_old_re.match(data_line)):
                     continue
 
                 # Check for continuation lines
                 if last_line_data_index:
-                    carryover_found = test_carryover_line(int(last_line_data_index), data_line)
+                    carryover_found = test_carryover_line(int(last_line_data_index), data_line, blank_line_re)
 
                     if carryover_found:
                         continuation_data = continuation_with_amount_re.match(data_line)
@@ -419,12 +1219,12 @@ def get_page_numbers_from_directory(pages_dir):
     return sorted(page_numbers)
 
 
-def find_header_index(line_array):
+def find_header_index(line_array, header_re=header_end):
     """Find the index of the header line in a page."""
     matches = 0
     header_index = None
     for index, line in enumerate(line_array):
-        r = header_end.search(line)
+        r = header_re.search(line)
         if r:
             matches += 1
             header_index = index
@@ -438,193 +1238,621 @@ def find_header_index(line_array):
     return header_index
 
 
-def parse_pages(start_page, end_page, pages_dir="pages", out_file='senate_data.csv', missing_file='missing_data.json'):
-    """Parse extracted pages and create CSV output."""
+def parse_page(page, page_array, fixed_width=False, patterns=PARSER_PATTERNS):
+    """
+    Parse a single page of text into expense records.
+
+    Everything here is page-local, so pages can be parsed independently (and
+    in parallel). The only state carried across pages, the office description,
+    is returned for the caller to carry forward.
+
+    With fixed_width, data lines are split using column offsets from the
+    page's START/END header (see parse_fixed_width_line()). patterns holds
+    the regexes to parse with (see PARSER_PATTERNS and instrument_patterns()).
+
+    Returns:
+        None for pages without a header (blank pages, summary pages, etc.),
+        otherwise a dictionary with the page's header_index, the description
+        from its top matter (None if the page has no top matter), its parsed
+        data rows and its missing_data entries
+    """
+    header_index = find_header_index(page_array, patterns['header_end'])
+    if header_index is None:
+        return None
+
+    # Extract top matter if present
+    description = None
+    if header_index > 6:
+        the_top_matter = page_array[:header_index+1]
+        description = process_top_matter(page, the_top_matter, patterns)
+
+    # Process data lines
+    data_lines = page_array[header_index+1:]
+    column_layout = find_column_layout(page_array[header_index]) if fixed_width else None
+    data_found = process_data_lines(page, data_lines, column_layout, patterns)
+    data_lines = data_found['data']
+    one_line_continuation_register = data_found['register']
+
+    # Append continuation lines to the right places
+    for cl in one_line_continuation_register:
+        all_related_lines_found = False
+        current_line_position = cl['array_index'] - 1
+
+        while not all_related_lines_found:
+            data_lines[current_line_position][8] = data_lines[current_line_position][8] + " + " + cl['data']
+            if data_lines[current_line_position][0] != 'continuation_data':
+                all_related_lines_found = True
+            else:
+                current_line_position -= 1
+
+    return {
+        'header_index': header_index,
+        'description': description,
+        'data': data_lines,
+        'missing_data': data_found['missing_data'],
+    }
+
+
+def _parse_page_item(page_item):
+    """Process pool entry point: parse one (page_number, lines, fixed_width) item."""
+    page, page_array, fixed_width = page_item
+    return parse_page(page, page_array, fixed_width)
+
+
+def parser_version(fixed_width=False):
+    """
+    Version of the parsing rules, used to invalidate the parse cache.
+
+    This is PARSER_VERSION, so changes elsewhere in the module (cleaning, the
+    command line) keep cached pages. Fixed-width parsing gets its own version
+    since it produces different rows.
+    """
+    return f"{PARSER_VERSION}" + ('-fixed-width' if fixed_width else '')
+
+
+def page_text_hash(page_array):
+    """Hash the text of a page for parse cache lookups."""
+    return hashlib.sha256(''.join(page_array).encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def load_parse_cache(cache_file, fixed_width=False):
+    """
+    Load a parse cache file.
+
+    The cache maps each page number to the hash of the page's text and its
+    parse_page() result. Caches written by a different parser version are
+    discarded.
+    """
+    version = parser_version(fixed_width)
+    cache = {'parser_version': version, 'pages': {}}
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as fh:
+                stored_cache = json.load(fh)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read parse cache {cache_file}: {e}")
+        else:
+            if stored_cache.get('parser_version') == version:
+                cache = stored_cache
+            else:
+                print("Parser has changed since the parse cache was written; re-parsing all pages")
+    return cache
+
+
+def save_parse_cache(cache_file, cache):
+    """Write a parse cache file."""
+    with open(cache_file, 'w') as fh:
+        json.dump(cache, fh)
+
+
+def iter_parsed_pages(pages, jobs=1, cache=None, cache_stats=None, fixed_width=False, page_seconds=None,
+                      pattern_stats=None):
+    """
+    Parse pages and yield (page_number, page_result) in page order.
+
+    If cache is given (see load_parse_cache()), pages whose text hash matches
+    the cached entry reuse the cached result and only the remaining pages are
+    parsed. New results are stored back into the cache, and if cache_stats is
+    given its 'hits' and 'misses' counts are updated.
+
+    With jobs > 1, pages are parsed in a pool of worker processes, with at
+    most jobs * PARSE_PAGES_PER_JOB pages read ahead of the one being yielded,
+    so pages streamed from the PDF are never all held in memory. See
+    parse_page() for fixed_width.
+
+    If page_seconds is given (serial parsing only), the time spent parsing
+    each page is stored in it by page number. Likewise, if pattern_stats is
+    given, each page is parsed with timed patterns (see instrument_patterns())
+    that add their regex timings to it.
+    """
+    cached_pages = cache['pages'] if cache is not None else None
+    if cache_stats is None:
+        cache_stats = {}
+    cache_stats.setdefault('hits', 0)
+    cache_stats.setdefault('misses', 0)
+
+    def lookups():
+        for page, page_array in pages:
+            if cached_pages is None:
+                yield page, page_array, None, None
+                continue
+            text_hash = page_text_hash(page_array)
+            entry = cached_pages.get(str(page))
+            if entry and entry['text_hash'] == text_hash:
+                cache_stats['hits'] += 1
+                yield page, None, text_hash, entry
+            else:
+                cache_stats['misses'] += 1
+                yield page, page_array, text_hash, None
+
+    def store(page, text_hash, page_result):
+        if cached_pages is not None:
+            cached_pages[str(page)] = {'text_hash': text_hash, 'result': page_result}
+
+    if not jobs or jobs <= 1:
+        for page, page_array, text_hash, entry in lookups():
+            if entry is not None:
+                yield page, entry['result']
+            else:
+                instrumentation = (instrument_patterns(stats=pattern_stats) if pattern_stats is not None
+                                   else contextlib.nullcontext((PARSER_PATTERNS, None)))
+                start_time = time.perf_counter()
+                with instrumentation as (patterns, _):
+                    page_result = parse_page(page, page_array, fixed_width, patterns)
+                if page_seconds is not None:
+                    page_seconds[page] = time.perf_counter() - start_time
+                store(page, text_hash, page_result)
+                yield page, page_result
+        return
+
+    print(f"Using {jobs} parser processes")
+    def resolve(page, text_hash, page_result, future):
+        if future is not None:
+            page_result = future.result()
+            store(page, text_hash, page_result)
+        return page, page_result
+
+    # Workers are spawned rather than forked: a worker forked while pages are
+    # streaming would inherit the write end of a running pdftotext's output
+    # pipe, and reading that pipe would then never reach end of file
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn')) as executor:
+        # Submit only the pages that need parsing and resolve in page order,
+        # keeping a bounded window of pages in flight
+        pending = collections.deque()
+        for page, page_array, text_hash, entry in lookups():
+            if entry is not None:
+                pending.append((page, text_hash, entry['result'], None))
+            else:
+                pending.append((page, text_hash, None, executor.submit(_parse_page_item, (page, page_array, fixed_width))))
+            if len(pending) >= jobs * PARSE_PAGES_PER_JOB:
+                yield resolve(*pending.popleft())
+
+        while pending:
+            yield resolve(*pending.popleft())
+
+
+def build_parse_profile(pattern_stats, page_seconds, page_rows, elapsed, top_pages=PROFILE_TOP_PAGES):
+    """
+    Summarize a profiled parse_pages() run.
+
+    Args:
+        pattern_stats: Stats dictionary filled in by instrument_patterns()
+        page_seconds: Dictionary of page number to parse time in seconds
+        page_rows: Dictionary of page number to rows written
+        elapsed: Wall-clock seconds for the whole parse, not counting time
+            spent writing or cleaning the parsed rows
+        top_pages: Number of slowest pages to list
+
+    Returns:
+        Dictionary suitable for json.dump()
+    """
+    page_count = len(page_seconds)
+    row_count = sum(page_rows.values())
+    slowest = sorted(page_seconds, key=lambda page: -page_seconds[page])[:top_pages]
+
+    return {
+        'pages': page_count,
+        'rows': row_count,
+        'seconds': elapsed,
+        'parse_seconds': sum(page_seconds.values()),
+        'pages_per_second': page_count / elapsed if elapsed else 0.0,
+        'rows_per_second': row_count / elapsed if elapsed else 0.0,
+        'patterns': dict(sorted(pattern_stats['patterns'].items(), key=lambda item: -item[1]['seconds'])),
+        'line_budget': pattern_stats['line_budget'],
+        'slow_lines': sorted(pattern_stats['slow_lines'], key=lambda line: -line['seconds']),
+        'top_pages': [
+            {'page': page, 'seconds': page_seconds[page], 'rows': page_rows.get(page, 0)}
+            for page in slowest
+        ],
+    }
+
+
+def print_parse_profile(report):
+    """Print a profile report from build_parse_profile() as tables."""
+    print(f"\n=== Parse profile ===")
+    print(f"Pages: {report['pages']} ({report['pages_per_second']:.1f} pages/sec)")
+    print(f"Rows: {report['rows']} ({report['rows_per_second']:.1f} rows/sec)")
+    print(f"Time: {report['seconds']:.2f}s ({report['parse_seconds']:.2f}s in parse_page())")
+
+    print(f"\n{'Pattern':<32} {'Attempts':>9} {'Matches':>9} {'Time (s)':>9} {'Max (ms)':>9}")
+    for name, stats in report['patterns'].items():
+        print(f"{name:<32} {stats['attempts']:>9} {stats['matches']:>9} "
+              f"{stats['seconds']:>9.3f} {stats['max_seconds'] * 1000:>9.1f}")
+
+    print(f"\n{'Page':>6} {'Time (ms)':>10} {'Rows':>6}")
+    for page in report['top_pages']:
+        print(f"{page['page']:>6} {page['seconds'] * 1000:>10.1f} {page['rows']:>6}")
+
+    if report['slow_lines']:
+        print(f"\n{len(report['slow_lines'])} lines took over {report['line_budget'] * 1000:g} ms of regex time")
+
+
+def iter_parsed_rows(start_page, end_page, pages_dir="pages", missing_file='missing_data.json', pages=None, jobs=1,
+                     cache_file=None, fixed_width=False, profile_file=None):
+    """
+    Parse extracted pages and yield each parsed row ([office description] + fields) in order.
+
+    This is the generator behind parse_pages(), for callers that want the rows
+    themselves rather than a CSV file (see parse_and_clean()). The arguments
+    are as for parse_pages(). Once the rows are exhausted, missing data is
+    written to missing_file, the parse cache and profile are saved and the
+    parsing summary is printed.
+    """
     print(f"\n=== Parsing pages {start_page} to {end_page} ===")
 
-    page_file_unfilled = os.path.join(pages_dir, "layout_%s.txt")
+    page_seconds = None
+    page_rows = {}
+    if profile_file:
+        if jobs and jobs > 1 or cache_file:
+            print("Profiling parses every page in one process; ignoring parse jobs and parse cache")
+        jobs = 1
+        cache_file = None
+        page_seconds = {}
+
     header_index_hash = {}
 
-    # Generate page numbers in ascending numeric order (1, 2, 3, ... not 1, 19, 100, 200)
-    # Using range() ensures proper numeric ordering
-    page_numbers = list(range(start_page, end_page + 1))
+    # Pages are read in ascending numeric order (1, 2, 3, ... not 1, 19, 100, 200)
+    if pages is None:
+        pages = iter_page_files(start_page, end_page, pages_dir)
+
+    cache = load_parse_cache(cache_file, fixed_width) if cache_file else None
+    cache_stats = {}
 
     # Collect all missing data groups first to avoid trailing comma
     all_missing_data_groups = []
 
-    with open(out_file, 'w', newline='') as csvfile:
-        datawriter = csv.writer(csvfile)
-        current_description = None
-        description = None
-
-        for page in page_numbers:
-                if page % 100 == 0 or page == start_page:
-                    print(f"Processing pages {page}-{min(page + 99, end_page)}...")
-
-                filename = page_file_unfilled % (page)
-                try:
-                    with open(filename, 'r', encoding='utf-8') as fh:
-                        page_array = fh.readlines()
-                except UnicodeDecodeError:
-                    # Fall back to latin-1 encoding for pages with special characters
-                    with open(filename, 'r', encoding='latin-1') as fh:
-                        page_array = fh.readlines()
-
-                header_index = find_header_index(page_array)
-
-                # Skip pages without headers (blank pages, summary pages, etc.)
-                if header_index is None:
-                    if page % 100 == 0 or page == start_page:
-                        print(f"  Skipping page {page} (no header found)")
-                    continue
-
-                # Keep stats on where we find the index
-                header_index_hash[header_index] = header_index_hash.get(header_index, 0) + 1
+    pattern_stats = {'patterns': {}, 'slow_lines': [], 'line_budget': LINE_TIME_BUDGET} if profile_file else None
+    start_time = time.perf_counter()
+    # Time spent by the caller between rows, left out of the profiled parse time
+    consumer_seconds = 0.0
 
-                # Extract top matter if present
-                if header_index > 6:
-                    the_top_matter = page_array[:header_index+1]
-                    description = process_top_matter(page, the_top_matter)
+    description = None
 
-                current_description = description
+    for page, page_result in iter_parsed_pages(pages, jobs, cache, cache_stats, fixed_width, page_seconds,
+                                               pattern_stats):
+        if page % 100 == 0 or page == start_page:
+            print(f"Processing pages {page}-{min(page + 99, end_page)}...")
 
-                # Process data lines
-                data_lines = page_array[header_index+1:]
-                data_found = process_data_lines(page, data_lines)
-                data_lines = data_found['data']
-                one_line_continuation_register = data_found['register']
+        # Skip pages without headers (blank pages, summary pages, etc.)
+        if page_result is None:
+            if page % 100 == 0 or page == start_page:
+                print(f"  Skipping page {page} (no header found)")
+            continue
 
-                # Append continuation lines to the right places
-                for cl in one_line_continuation_register:
-                    all_related_lines_found = False
-                    current_line_position = cl['array_index'] - 1
+        # Keep stats on where we find the index
+        header_index = page_result['header_index']
+        header_index_hash[header_index] = header_index_hash.get(header_index, 0) + 1
 
-                    while not all_related_lines_found:
-                        data_lines[current_line_position][8] = data_lines[current_line_position][8] + " + " + cl['data']
-                        if data_lines[current_line_position][0] != 'continuation_data':
-                            all_related_lines_found = True
-                        else:
-                            current_line_position -= 1
+        # Pages without top matter continue the previous page's office
+        if page_result['description'] is not None:
+            description = page_result['description']
 
-                # Write data
-                for data in data_lines:
-                    datawriter.writerow([current_description] + data)
+        # Yield data
+        yield_start = time.perf_counter()
+        for data in page_result['data']:
+            yield [description] + data
+        consumer_seconds += time.perf_counter() - yield_start
+        page_rows[page] = len(page_result['data'])
 
-                # Collect missing data
-                if data_found['missing_data']:
-                    all_missing_data_groups.append(data_found['missing_data'])
+        # Collect missing data
+        if page_result['missing_data']:
+            all_missing_data_groups.append(page_result['missing_data'])
 
     # Write missing data as properly formatted JSON
     with open(missing_file, 'w') as missing_data_file:
         json.dump(all_missing_data_groups, missing_data_file, indent=4)
 
+    if cache is not None:
+        save_parse_cache(cache_file, cache)
+
     print(f"\nParsing complete!")
-    print(f"Data written to: {out_file}")
     print(f"Missing data written to: {missing_file}")
+    if cache is not None:
+        print(f"Parse cache: {cache_stats['hits']} pages reused, {cache_stats['misses']} pages parsed ({cache_file})")
     print(f"\nHeader index statistics:")
     for k, v in sorted(header_index_hash.items()):
         print(f"  {k}: {v}")
 
+    if profile_file:
+        report = build_parse_profile(pattern_stats, page_seconds, page_rows,
+                                     time.perf_counter() - start_time - consumer_seconds)
+        print_parse_profile(report)
+        with open(profile_file, 'w') as f:
+            json.dump(report, f, indent=4)
+        print(f"\nProfile written to: {profile_file}")
+
+
+def parse_pages(start_page, end_page, pages_dir="pages", out_file='senate_data.csv', missing_file='missing_data.json',
+                pages=None, jobs=1, cache_file=None, fixed_width=False, profile_file=None):
+    """
+    Parse extracted pages and create CSV output.
+
+    Pages are read from layout_N.txt files in pages_dir unless pages is given,
+    in which case it should be an iterable of (page_number, lines) in page
+    order, such as the generator returned by iter_pdf_pages().
+
+    With jobs > 1, pages are parsed in a pool of worker processes and the
+    results are merged back in page order, carrying each page's office
+    description forward exactly as a serial run does, so the output files are
+    identical.
+
+    If cache_file is given, each page's parse result is cached there keyed by
+    the page text hash and parser version, and only pages whose text or
+    parsing rules changed since the last run are re-parsed.
+
+    With fixed_width, expense lines are split by the column offsets of each
+    page's header instead of by regex, falling back to the regex cascade for
+    lines that don't fit the columns.
+
+    If profile_file is given, every regex and page is timed (see
+    instrument_patterns()) and a report of per-pattern attempts, matches and
+    time, pages/sec, rows/sec and the slowest pages is printed and written to
+    profile_file as JSON. Profiling parses every page in this process, so
+    jobs and cache_file are ignored.
+    """
+    with open(out_file, 'w', newline='') as csvfile:
+        csv.writer(csvfile).writerows(iter_parsed_rows(start_page, end_page, pages_dir, missing_file, pages, jobs,
+                                                       cache_file, fixed_width, profile_file))
+
+    print(f"Data written to: {out_file}")
 
-def clean_csv(source_doc, csv_file='senate_data.csv', cleaned_file='senate_data_cleaned.csv', add_bioguide_ids=True):
-    """Clean and reformat the CSV file."""
-    print(f"\n=== Cleaning CSV data ===")
 
-    # Initialize bioguide matcher if available and requested
+def load_bioguide_matcher(legislators_source=None):
+    """
+    Import bioguide_matcher and load a BioguideIdMatcher.
+
+    The import is deferred to here so that runs which never need a bioguide ID
+    don't pay for loading legislator data.
+
+    Args:
+        legislators_source: Legislator source spec (see bioguide_matcher.get_legislator_source())
+
+    Returns:
+        BioguideIdMatcher instance, or None if it can't be imported or loaded
+    """
+    try:
+        from bioguide_matcher import BioguideIdMatcher
+    except ImportError:
+        print("Warning: bioguide_matcher.py not found. Bioguide IDs will not be added.")
+        return None
+
+    try:
+        return BioguideIdMatcher(source=legislators_source)
+    except Exception as e:
+        print(f"Warning: Could not initialize bioguide matcher: {e}")
+        print("Continuing without bioguide IDs...")
+        return None
+
+
+def parse_office(office):
+    """
+    Derive the office-level fields from a raw office description.
+
+    Args:
+        office: Office description (the first column of senate_data.csv)
+
+    Returns:
+        Tuple of (senator_flag, senator_name, funding_year, fiscal_year,
+        congress_number); years and congress number are '' when not found
+    """
+    senator_flag = 1 if 'senator' in office.lower() else 0
+    senator_name = office.split('Funding')[0].replace('SENATOR', '').strip() if senator_flag else ''
+
+    try:
+        funding_year = int(FUNDING_YEAR_RE.search(office).group(2))
+    except AttributeError:
+        funding_year = ''
+
+    try:
+        fiscal_year = int(FISCAL_YEAR_RE.search(office).group(2))
+    except AttributeError:
+        fiscal_year = ''
+
+    try:
+        congress_number = int(CONGRESS_NUMBER.search(office).group(1))
+    except AttributeError:
+        congress_number = ''
+
+    return senator_flag, senator_name, funding_year, fiscal_year, congress_number
+
+
+def clean_rows(source_doc, rows, add_bioguide_ids=True, legislators_source=None, stats=None):
+    """
+    Clean and reformat raw parsed rows, yielding the cleaned CSV's rows.
+
+    The two header rows come first, then one cleaned row per raw row (rows
+    with too few fields are skipped). Raw rows must be lists of strings, as
+    read back from senate_data.csv (see csv_row_text()).
+
+    If add_bioguide_ids is set, the bioguide matcher is loaded from
+    legislators_source when the first senator row needs an ID, so reports
+    without senator offices never load it.
+
+    The same office description repeats for hundreds of consecutive rows, so
+    its derived fields and bioguide ID are worked out once per distinct
+    description (see parse_office()) and reused.
+
+    If stats is given, it is filled in with rows_processed, rows_skipped,
+    offices (distinct office descriptions), office_cache_hits and
+    bioguide_matcher (the matcher used, or None).
+    """
+    if stats is None:
+        stats = {}
+    stats.update({'rows_processed': 0, 'rows_skipped': 0, 'offices': 0, 'office_cache_hits': 0,
+                  'bioguide_matcher': None})
+
     bioguide_matcher = None
-    if add_bioguide_ids and BioguideIdMatcher:
+    matcher_needed = add_bioguide_ids
+
+    # Office description -> (senator_flag, senator_name, funding_year, fiscal_year, congress_number, bioguide_id)
+    office_fields = {}
+
+    # Header rows
+    yield [
+        "This data was parsed on an experimental basis by the Sunlight Foundation from Senate disbursement reports. "
+        "Please cite 'The Sunlight Foundation' in any usage. "
+        "For more information see the readme at http://assets-reporting.s3.amazonaws.com/1.0/senate_disbursements/readme.txt."
+    ]
+    yield [
+        'source_doc', 'senator_flag', 'senator_name', 'bioguide_id', 'raw_office', 'funding_year', 'fiscal_year',
+        'congress_number', 'reference_page', 'document_number', 'date_posted', 'start_date',
+        'end_date', 'description', 'salary_flag', 'amount', 'payee'
+    ]
+
+    for line_num, line in enumerate(rows, start=1):
         try:
-            bioguide_matcher = BioguideIdMatcher()
+            # Skip lines with insufficient fields
+            if len(line) < 11:
+                stats['rows_skipped'] += 1
+                continue
+
+            raw_office = line[0]
+
+            fields = office_fields.get(raw_office)
+            if fields is None:
+                senator_flag, senator_name, funding_year, fiscal_year, congress_number = parse_office(raw_office)
+
+                # Get bioguide ID for senators
+                bioguide_id = ''
+                if matcher_needed and senator_flag and senator_name:
+                    bioguide_matcher = stats['bioguide_matcher'] = load_bioguide_matcher(legislators_source)
+                    matcher_needed = False
+                if bioguide_matcher and senator_flag and senator_name:
+                    # Use funding_year if available, otherwise fiscal_year
+                    year = funding_year if funding_year else fiscal_year
+                    bioguide_id = bioguide_matcher.get_bioguide_id(senator_name, year)
+
+                fields = office_fields[raw_office] = (senator_flag, senator_name, funding_year, fiscal_year,
+                                                      congress_number, bioguide_id)
+                stats['offices'] += 1
+            else:
+                stats['office_cache_hits'] += 1
+            senator_flag, senator_name, funding_year, fiscal_year, congress_number, bioguide_id = fields
+
+            reference_page = line[3]
+            document_number = line[4]
+            date_posted = line[5]
+            payee = line[6]
+            start_date = line[7]
+            end_date = line[8]
+            description = line[9]
+            amount = line[10]
+
+            # Salary flag: 1 if expense record (has dates), 0 if salary record (no dates)
+            salary_flag = 1 if start_date != '' or end_date != '' else 0
+
+            cleaned_row = [
+                source_doc, senator_flag, senator_name, bioguide_id, raw_office, funding_year,
+                fiscal_year, congress_number, reference_page, document_number, date_posted,
+                start_date, end_date, description, salary_flag, amount, payee
+            ]
+
         except Exception as e:
-            print(f"Warning: Could not initialize bioguide matcher: {e}")
-            print("Continuing without bioguide IDs...")
-    elif add_bioguide_ids:
-        print("Warning: BioguideIdMatcher not available. Skipping bioguide ID matching.")
-
-    with open(csv_file, 'r') as in_file:
-        unclean_data_reader = csv.reader(in_file)
-
-        with open(cleaned_file, 'w', newline='') as out_file:
-            cleaned_data_writer = csv.writer(out_file)
-
-            # Write header rows
-            cleaned_data_writer.writerow([
-                "This data was parsed on an experimental basis by the Sunlight Foundation from Senate disbursement reports. "
-                "Please cite 'The Sunlight Foundation' in any usage. "
-                "For more information see the readme at http://assets-reporting.s3.amazonaws.com/1.0/senate_disbursements/readme.txt."
-            ])
-            cleaned_data_writer.writerow([
-                'source_doc', 'senator_flag', 'senator_name', 'bioguide_id', 'raw_office', 'funding_year', 'fiscal_year',
-                'congress_number', 'reference_page', 'document_number', 'date_posted', 'start_date',
-                'end_date', 'description', 'salary_flag', 'amount', 'payee'
-            ])
-
-            # Process data rows
-            rows_processed = 0
-            rows_skipped = 0
-
-            for line_num, line in enumerate(unclean_data_reader, start=1):
-                try:
-                    # Skip lines with insufficient fields
-                    if len(line) < 11:
-                        rows_skipped += 1
-                        continue
+            print(f"Warning: Error processing line {line_num}: {e}")
+            print(f"  Line content: {line[:100] if len(line) > 100 else line}")
+            stats['rows_skipped'] += 1
+            continue
 
-                    senator_flag = 1 if 'senator' in line[0].lower() else 0
-                    senator_name = line[0].split('Funding')[0].replace('SENATOR', '').strip() if senator_flag else ''
-                    raw_office = line[0]
-
-                    try:
-                        funding_year = int(re.search(FUNDING_YEAR_RE, line[0]).group(2))
-                    except:
-                        funding_year = ''
-
-                    try:
-                        fiscal_year = int(re.search(FISCAL_YEAR_RE, line[0]).group(2))
-                    except:
-                        fiscal_year = ''
-
-                    try:
-                        congress_number = int(re.search(CONGRESS_NUMBER, line[0]).group(1))
-                    except:
-                        congress_number = ''
-
-                    reference_page = line[3]
-                    document_number = line[4]
-                    date_posted = line[5]
-                    payee = line[6]
-                    start_date = line[7]
-                    end_date = line[8]
-                    description = line[9]
-                    amount = line[10]
-
-                    # Salary flag: 1 if expense record (has dates), 0 if salary record (no dates)
-                    salary_flag = 1 if start_date != '' or end_date != '' else 0
-
-                    # Get bioguide ID for senators
-                    bioguide_id = ''
-                    if bioguide_matcher and senator_flag and senator_name:
-                        # Use funding_year if available, otherwise fiscal_year
-                        year = funding_year if funding_year else fiscal_year
-                        bioguide_id = bioguide_matcher.get_bioguide_id(senator_name, year)
-
-                    cleaned_data_writer.writerow([
-                        source_doc, senator_flag, senator_name, bioguide_id, raw_office, funding_year,
-                        fiscal_year, congress_number, reference_page, document_number, date_posted,
-                        start_date, end_date, description, salary_flag, amount, payee
-                    ])
-
-                    rows_processed += 1
-
-                except Exception as e:
-                    print(f"Warning: Error processing line {line_num}: {e}")
-                    print(f"  Line content: {line[:100] if len(line) > 100 else line}")
-                    rows_skipped += 1
-                    continue
+        yield cleaned_row
+        stats['rows_processed'] += 1
 
+
+def print_clean_summary(cleaned_file, stats):
+    """Print the row counts, office cache and bioguide lookup statistics collected by clean_rows()."""
     print(f"Cleaned data written to: {cleaned_file}")
-    print(f"  Rows processed: {rows_processed}")
-    print(f"  Rows skipped: {rows_skipped}")
+    print(f"  Rows processed: {stats['rows_processed']}")
+    print(f"  Rows skipped: {stats['rows_skipped']}")
+    print(f"  Offices: {stats['offices']} distinct ({stats['office_cache_hits']} rows reused a cached office)")
+    bioguide_matcher = stats['bioguide_matcher']
+    if bioguide_matcher:
+        lookup_stats = bioguide_matcher.cache_stats()
+        print(f"  Bioguide lookups: {lookup_stats['hits'] + lookup_stats['misses']} "
+              f"({lookup_stats['misses']} distinct, {lookup_stats['hits']} cached)")
+
+
+def clean_csv(source_doc, csv_file='senate_data.csv', cleaned_file='senate_data_cleaned.csv', add_bioguide_ids=True,
+              legislators_source=None):
+    """
+    Clean and reformat the CSV file.
+
+    See clean_rows() for the cleaning itself.
+    """
+    print(f"\n=== Cleaning CSV data ===")
+
+    stats = {}
+    with open(csv_file, 'r') as in_file, open(cleaned_file, 'w', newline='') as out_file:
+        csv.writer(out_file).writerows(
+            clean_rows(source_doc, csv.reader(in_file), add_bioguide_ids, legislators_source, stats))
+
+    print_clean_summary(cleaned_file, stats)
+
+
+def csv_row_text(row):
+    """
+    Convert a parsed row to the strings csv.reader would return for it after a
+    round trip through senate_data.csv: None becomes '', other values go
+    through str(), and line endings are normalized as reading the file in
+    text mode does.
+    """
+    return ['' if value is None else str(value).replace('\r\n', '\n').replace('\r', '\n') for value in row]
+
+
+def _write_rows_through(rows, writer):
+    """Write each row with a csv writer as it passes through."""
+    for row in rows:
+        writer.writerow(row)
+        yield row
+
+
+def parse_and_clean(source_doc, start_page, end_page, pages_dir="pages", cleaned_file='senate_data_cleaned.csv',
+                    missing_file='missing_data.json', out_file=None, pages=None, jobs=1, cache_file=None,
+                    fixed_width=False, profile_file=None, add_bioguide_ids=True, legislators_source=None):
+    """
+    Parse pages and clean the rows in a single pass.
+
+    Parsed rows flow from iter_parsed_rows() through clean_rows() straight to
+    the cleaned CSV, without writing senate_data.csv and reading it back. The
+    raw CSV is only written (alongside) if out_file is given. The cleaned
+    output is identical to running parse_pages() and then clean_csv().
+
+    Arguments are as for parse_pages() and clean_csv().
+    """
+    rows = iter_parsed_rows(start_page, end_page, pages_dir, missing_file, pages, jobs, cache_file, fixed_width,
+                            profile_file)
+
+    stats = {}
+    with contextlib.ExitStack() as stack:
+        if out_file:
+            raw_writer = csv.writer(stack.enter_context(open(out_file, 'w', newline='')))
+            rows = _write_rows_through(rows, raw_writer)
+
+        out = stack.enter_context(open(cleaned_file, 'w', newline=''))
+        csv.writer(out).writerows(
+            clean_rows(source_doc, (csv_row_text(row) for row in rows), add_bioguide_ids, legislators_source, stats))
+
+    if out_file:
+        print(f"Data written to: {out_file}")
+    print_clean_summary(cleaned_file, stats)
 
 
 def main():
@@ -636,20 +1864,62 @@ Examples:
   # Process with explicit page range
   python3 process_senate_disbursements.py GPO-CDOC-114sdoc13.pdf --start 18 --end 2264
 
+  # Detect the itemization page range automatically
+  python3 process_senate_disbursements.py GPO-CDOC-114sdoc13.pdf
+
+  # Parse and clean in one pass without writing the raw senate_data.csv
+  python3 process_senate_disbursements.py GPO-CDOC-114sdoc13.pdf --start 18 --end 2264 --fused --no-raw-csv
+
   # Process from a specific directory
   python3 process_senate_disbursements.py 114_sdoc13/GPO-CDOC-114sdoc13.pdf --start 18 --end 2264 --output-dir 114_sdoc13
         """
     )
 
     parser.add_argument('pdf_file', help='Path to the Senate disbursement PDF file')
-    parser.add_argument('--start', type=int, help='Starting page number (inclusive)')
-    parser.add_argument('--end', type=int, help='Ending page number (inclusive)')
+    parser.add_argument('--start', type=int, help='Starting page number (inclusive; detected from the PDF if omitted)')
+    parser.add_argument('--end', type=int, help='Ending page number (inclusive; detected from the PDF if omitted)')
     parser.add_argument('--output-dir', default=None, help='Output directory for extracted pages and CSV files (default: same as PDF directory)')
     parser.add_argument('--skip-extract', action='store_true', help='Skip page extraction (use if pages already extracted)')
     parser.add_argument('--skip-clean', action='store_true', help='Skip CSV cleaning step')
+    parser.add_argument('--batch-size', type=int, default=EXTRACT_BATCH_SIZE,
+                        help=f'Pages extracted per pdftotext process (default: {EXTRACT_BATCH_SIZE}, 0 = whole range at once)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of concurrent pdftotext workers for page extraction (default: 1)')
+    parser.add_argument('--parse-jobs', type=int, default=1,
+                        help='Number of processes used to parse pages (default: 1)')
+    parser.add_argument('--parse-cache', action='store_true',
+                        help='Cache parsed pages in parse_cache.json and only re-parse pages whose text or parser changed')
+    parser.add_argument('--profile', action='store_true',
+                        help='Time every parser regex and page, print a report and write it to parse_profile.json')
+    parser.add_argument('--fixed-width', action='store_true',
+                        help='Split expense and salary lines by the column offsets of each page header, using the regex parser only for lines that do not fit')
+    parser.add_argument('--legislators-source', default=None,
+                        help='Legislator data for bioguide IDs: "http" or a local file/directory '
+                             '(default: $BIOGUIDE_SOURCE or http)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Stream page text from pdftotext straight into the parser without writing a pages/ directory')
+    parser.add_argument('--keep-pages', action='store_true',
+                        help='With --stream, also write pages/layout_N.txt files for debugging')
+    parser.add_argument('--fused', action='store_true',
+                        help='Clean rows as they are parsed, in one pass, instead of re-reading senate_data.csv')
+    parser.add_argument('--no-raw-csv', action='store_true',
+                        help='With --fused, do not write the raw senate_data.csv')
 
     args = parser.parse_args()
 
+    # Check for conflicting options before any slow work such as page range detection
+    if args.stream and args.skip_extract:
+        print("--stream reads pages directly from the PDF and cannot be combined with --skip-extract")
+        return 1
+
+    if args.fused and args.skip_clean:
+        print("--fused parses and cleans in one pass and cannot be combined with --skip-clean")
+        return 1
+
+    if args.no_raw_csv and not args.fused:
+        print("--no-raw-csv requires --fused (the separate cleaning step reads the raw CSV)")
+        return 1
+
     # Determine output directory
     if args.output_dir:
         output_dir = args.output_dir
@@ -665,8 +1935,22 @@ Examples:
     csv_file = os.path.join(output_dir, 'senate_data.csv')
     cleaned_file = os.path.join(output_dir, 'senate_data_cleaned.csv')
     missing_file = os.path.join(output_dir, 'missing_data.json')
+    cache_file = os.path.join(output_dir, 'parse_cache.json') if args.parse_cache else None
+    profile_file = os.path.join(output_dir, 'parse_profile.json') if args.profile else None
+
+    # Get page range, detecting whichever end wasn't given
+    if not args.start or not args.end:
+        print("Page range not specified; detecting itemization pages...")
+        try:
+            detected = detect_page_range(args.pdf_file, jobs=args.jobs)
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            print(f"Could not detect the page range: {e}")
+            detected = None
+
+        if detected:
+            args.start = args.start or detected[0]
+            args.end = args.end or detected[1]
 
-    # Get page range
     if not args.start or not args.end:
         print("Page range not specified. Please provide --start and --end page numbers.")
         print("\nTo find the correct page range:")
@@ -687,7 +1971,11 @@ Examples:
     print(f"Source document: {source_doc}")
 
     # Step 1: Extract pages (skip if they already exist)
-    if args.skip_extract:
+    pages = None
+    if args.stream:
+        pages = iter_pdf_pages(args.pdf_file, args.start, args.end, args.batch_size, args.jobs,
+                               pages_dir if args.keep_pages else None)
+    elif args.skip_extract:
         print("\n=== Skipping page extraction (--skip-extract flag provided) ===")
     else:
         # Check if pages already exist
@@ -701,24 +1989,46 @@ Examples:
         if pages_exist:
             print(f"\n=== Pages {args.start}-{args.end} already extracted, skipping extraction ===")
         else:
-            extract_pages(args.pdf_file, args.start, args.end, pages_dir)
-
-    # Step 2: Parse pages
-    parse_pages(args.start, args.end, pages_dir, csv_file, missing_file)
+            failed_batches = extract_pages(args.pdf_file, args.start, args.end, pages_dir, args.batch_size, args.jobs)
+            if failed_batches:
+                print(f"\nStopping: {len(failed_batches)} page batch(es) could not be extracted, "
+                      f"so the parsed data would be incomplete")
+                return 1
+
+    try:
+        if args.fused:
+            # Steps 2 and 3 together: parsed rows go straight to the cleaned CSV
+            if args.no_raw_csv:
+                csv_file = None
+            parse_and_clean(source_doc, args.start, args.end, pages_dir, cleaned_file, missing_file, csv_file,
+                            pages, args.parse_jobs, cache_file, args.fixed_width, profile_file,
+                            legislators_source=args.legislators_source)
+        else:
+            # Step 2: Parse pages
+            parse_pages(args.start, args.end, pages_dir, csv_file, missing_file, pages, args.parse_jobs,
+                        cache_file, args.fixed_width, profile_file)
 
-    # Step 3: Clean CSV
-    if not args.skip_clean:
-        clean_csv(source_doc, csv_file, cleaned_file)
-    else:
-        print("\n=== Skipping CSV cleaning ===")
+            # Step 3: Clean CSV
+            if not args.skip_clean:
+                clean_csv(source_doc, csv_file, cleaned_file, legislators_source=args.legislators_source)
+            else:
+                print("\n=== Skipping CSV cleaning ===")
+    except ExtractionError as e:
+        # Only raised while streaming pages
+        print(f"\n{e}")
+        print("Stopping: the output files in this directory are incomplete")
+        return 1
 
     print(f"\n{'='*60}")
     print("Processing complete!")
     print(f"{'='*60}")
-    print(f"Raw CSV: {csv_file}")
+    if csv_file:
+        print(f"Raw CSV: {csv_file}")
     if not args.skip_clean:
         print(f"Cleaned CSV: {cleaned_file}")
     print(f"Missing data: {missing_file}")
+    if profile_file:
+        print(f"Parse profile: {profile_file}")
 
     return 0
 